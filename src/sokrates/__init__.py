@@ -1,19 +1,42 @@
 # This __init__.py file makes the sokrates directory a Python package.
 # It exposes various modules and their contents directly under the sokrates namespace
 # for easier access and import by other parts of the application.
+# The modules are imported lazily on first access (PEP 562), so importing a
+# single sub-module (e.g. a CLI entry point) doesn't pull in heavy
+# dependencies like openai or torch.
 
-from .colors import *
-from .config import *
-from .file_helper import *
-from .idea_generation_workflow import *
-from .llm_api import *
-from .lmstudio_benchmark import *
-from .merge_ideas_workflow import *
-from .output_printer import *
-from .prompt_refiner import *
-from .refinement_workflow import *
-from .system_monitor import *
-from .sequential_task_executor import *
-from .text_to_speech import *
-from .utils import *
-# from .voice_helper import *
\ No newline at end of file
+import importlib
+
+# exported name -> module that defines it
+_EXPORTS = {
+    "Colors": "colors",
+    "Config": "config",
+    "FileHelper": "file_helper",
+    "IdeaGenerationWorkflow": "idea_generation_workflow",
+    "LLMApi": "llm_api",
+    "LMStudioBenchmark": "lmstudio_benchmark",
+    "MergeIdeasWorkflow": "merge_ideas_workflow",
+    "OutputPrinter": "output_printer",
+    "PromptRefiner": "prompt_refiner",
+    "RefinementWorkflow": "refinement_workflow",
+    "ResponseCache": "response_cache",
+    "cached_response": "response_cache",
+    "SystemMonitor": "system_monitor",
+    "SequentialTaskExecutor": "sequential_task_executor",
+    "TextToSpeech": "text_to_speech",
+    "Utils": "utils",
+    # "voice_helper" is not exported
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
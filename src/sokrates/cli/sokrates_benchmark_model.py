@@ -9,7 +9,6 @@ import json
 import argparse
 import os
 from datetime import datetime
-from .. import LMStudioBenchmark
 
 # Test prompts of varying complexity
 DEFAULT_TEST_PROMPTS = [
@@ -60,6 +59,8 @@ def main():
     )
     args = parser.parse_args()
 
+    from ..lmstudio_benchmark import LMStudioBenchmark
+
     # Parse and validate temperatures
     temperatures_to_test = []
     if args.temperatures:
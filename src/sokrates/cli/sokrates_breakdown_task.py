@@ -2,11 +2,11 @@
 import argparse
 import sys
 from pathlib import Path
-from ..refinement_workflow import RefinementWorkflow
 from ..colors import Colors
 from ..file_helper import FileHelper
 from ..output_printer import OutputPrinter
 from ..config import Config
+from ..response_cache import ResponseCache
 
 DEFAULT_API_ENDPOINT = "http://localhost:1234/v1"
 DEFAULT_MAX_TOKENS = 20000
@@ -20,6 +20,7 @@ def main():
     Returns:
         None
     """
+    config = Config()
     # Set up argument parser
     parser = argparse.ArgumentParser(
             description='Breaks down a given task into sub-tasks with complexity rating. Returns a json representation of the calculated tasks.',
@@ -28,14 +29,14 @@ def main():
 
     parser.add_argument(
         '--api-endpoint',
-        default=Config().api_endpoint,
+        default=config.api_endpoint,
         help=f"LLM server API endpoint. Default is {DEFAULT_API_ENDPOINT}"
     )
 
     parser.add_argument(
         '--api-key',
         required=False,
-        default=Config().api_key,
+        default=config.api_key,
         help='API key for authentication (many local servers don\'t require this)'
     )
 
@@ -55,13 +56,14 @@ def main():
     
     parser.add_argument(
         '--model', '-m',
-        default=Config().default_model,
+        default=config.default_model,
         help=f"The model to use for the task breakdown (default: {Config.DEFAULT_MODEL})"
     )
     
     parser.add_argument(
         '--temperature',
-        default=Config().default_model_temperature,
+        type=float,
+        default=config.default_model_temperature,
         help=f"The temperature to use for the task breakdown (default: {Config.DEFAULT_MODEL_TEMPERATURE})"
     )
 
@@ -76,6 +78,24 @@ def main():
         help='Enable verbose output with debug information'
     )
     
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Disable the on-disk LLM response cache'
+    )
+
+    parser.add_argument(
+        '--cache-dir',
+        default=None,
+        help='Directory for the on-disk LLM response cache (default: $HOME/.sokrates/cache)'
+    )
+
+    parser.add_argument(
+        '--force-cache',
+        action='store_true',
+        help='Cache responses even if the temperature is not 0 (by default only deterministic requests are cached)'
+    )
+
     # context
     parser.add_argument(
         '--context-text', '-ct',
@@ -94,6 +114,8 @@ def main():
 
     # Parse arguments
     args = parser.parse_args()
+    if args.verbose:
+        config.print_configuration()
 
     if args.task and args.task_file:
         OutputPrinter.print_error("You cannot provide both a task-file and a task. Exiting.")
@@ -102,6 +124,10 @@ def main():
     if not args.task and not args.task_file:
         OutputPrinter.print_error("You did not provide a task via --task or --task-file. Exiting.")
         sys.exit(1)
+
+    if args.task_file and not Path(args.task_file).is_file():
+        OutputPrinter.print_error(f"Task file not found: {args.task_file}. Exiting.")
+        sys.exit(1)
         
     if not args.api_key:
         api_key = 'notrequired'
@@ -115,30 +141,35 @@ def main():
         
     # context
     context_array = []
-    if args.context_text:
-        context_array.append(args.context_text)
-        OutputPrinter.print_info("Appending context text to prompt:", args.context_text , Colors.BRIGHT_MAGENTA)
     if args.context_directories:
-        directories = [s.strip() for s in args.context_directories.split(",")]
+        directories = FileHelper.parse_comma_separated_paths(args.context_directories, verbose=args.verbose)
         context_array.extend(FileHelper.read_multiple_files_from_directories(directories, verbose=args.verbose))
         OutputPrinter.print_info("Appending context directories to prompt:", args.context_directories , Colors.BRIGHT_MAGENTA)
     if args.context_files:
-        files = [s.strip() for s in args.context_files.split(",")]
+        files = FileHelper.parse_comma_separated_paths(args.context_files, verbose=args.verbose)
         context_array.extend(FileHelper.read_multiple_files(files, verbose=args.verbose))
         OutputPrinter.print_info("Appending context files to prompt:", args.context_files , Colors.BRIGHT_MAGENTA)
+    # static file contents first, the ad-hoc context text last (keeps the prompt prefix cacheable)
+    if args.context_text:
+        context_array.append(args.context_text)
+        OutputPrinter.print_info("Appending context text to prompt:", args.context_text , Colors.BRIGHT_MAGENTA)
     
         
+    from ..refinement_workflow import RefinementWorkflow
+    response_cache = ResponseCache.from_arguments(args, args.temperature)
     workflow = RefinementWorkflow(api_endpoint=args.api_endpoint, 
         api_key=args.api_key, model=args.model, 
         max_tokens=DEFAULT_MAX_TOKENS, 
         temperature=args.temperature,
-        verbose=args.verbose
+        verbose=args.verbose,
+        response_cache=response_cache
     )
     result = workflow.breakdown_task(task=task, model=args.model, context_array=context_array)
 
+    # the streamed output is the raw response, the result is the cleaned task list
     OutputPrinter.print_section("RESULT", Colors.BRIGHT_BLUE, "═")
     print(result)
-    
+
     if args.output:
         OutputPrinter.print_info("Writing task list to file:", args.output, Colors.BRIGHT_MAGENTA)
         FileHelper.write_to_file(args.output, result, verbose=args.verbose)
@@ -31,12 +31,10 @@ import sys
 import os
 import argparse
 
-from ..llm_api import LLMApi
 from ..config import Config
 from ..colors import Colors
 from ..file_helper import FileHelper
 from ..output_printer import OutputPrinter
-from ..prompt_refiner import PromptRefiner
 import re
 from datetime import datetime
 from pathlib import Path
@@ -45,6 +43,7 @@ import asyncio # Import asyncio for running async functions
 def main():
     """Main function to handle command line arguments and initiate LLM chat session."""
     
+    config = Config()
     # Set up argument parser
     parser = argparse.ArgumentParser(
         description='LLM Chat CLI - Interact with large language models through a command-line interface',
@@ -52,16 +51,16 @@ def main():
     )
     
     parser.add_argument("--api-endpoint", "-ae", 
-                        default=Config().api_endpoint, 
+                        default=config.api_endpoint, 
                         help="The API endpoint for the LLM.")
     parser.add_argument("--api-key", "-ak", 
-                        default=Config().api_key, 
+                        default=config.api_key, 
                         help="The API key for the LLM.")
     parser.add_argument("--model", "-m", 
-                        default=Config().default_model, 
+                        default=config.default_model, 
                         help="The model to use for the LLM.")
     parser.add_argument("--temperature", "-t", 
-                        default=Config().default_model_temperature, 
+                        default=config.default_model_temperature, 
                         type=float, 
                         help="The temperature for the LLM.")
     parser.add_argument("--max-tokens", "-mt", 
@@ -95,8 +94,12 @@ def main():
     
     # Parse arguments
     args = parser.parse_args()
+    if args.verbose:
+        config.print_configuration()
+
+    from ..llm_api import LLMApi
+    from ..prompt_refiner import PromptRefiner
     
-    config = Config()
     refiner = PromptRefiner(verbose=args.verbose)
     api_endpoint = args.api_endpoint or config.api_endpoint
     api_key = args.api_key or config.api_key
@@ -14,6 +14,18 @@ Options:
     --model MODEL             The model to use for task execution
     --output-directory DIR    Output directory for saving results
     --no-refinement           Per default the task prompts are refined before execution. This disables this feature and executes them directly without refinement.
+    --separate-refinement     Refine and execute each task with two LLM requests instead of a single fused request
+    --no-cache                Disable the on-disk cache of task results
+    --cache-dir DIR           Directory for the on-disk cache of task results
+    --force-cache             Cache task results even if the temperature is not 0
+    --batch-size K            Execute K tasks with a single LLM request (default: 1). Batched tasks are not refined.
+    --max-batch-tokens N      Estimated token budget of the task descriptions in one batch (default: no limit)
+    --max-concurrency N       Number of task batches executed in parallel (default: 1)
+    --qps-limit QPS           Maximum number of task batches started per second (default: no limit)
+    --resume / --no-resume    Skip tasks completed in a previous run into the same output directory
+                              (default: enabled if the output directory already exists)
+    --fail-fast               Cancel the remaining tasks after an unrecoverable LLM API error
+                              (server unreachable, authentication failed or model not found)
     --verbose                 Enable verbose output with debug information
 
 Example:
@@ -22,11 +34,11 @@ Example:
 
 import argparse
 import sys
-from ..sequential_task_executor import SequentialTaskExecutor
 from ..colors import Colors
 from ..output_printer import OutputPrinter
 from ..file_helper import FileHelper
 from ..config import Config
+from ..response_cache import ResponseCache
 from pathlib import Path
 from datetime import datetime
 
@@ -43,6 +55,7 @@ def main():
     Raises:
         SystemExit: If required arguments are missing or if task execution fails
     """
+    config = Config()
     # Set up argument parser
     parser = argparse.ArgumentParser(
         description='Executes tasks defined in a JSON file sequentially.',
@@ -57,26 +70,27 @@ def main():
 
     parser.add_argument(
         '--api-endpoint',
-        default=Config().api_endpoint,
+        default=config.api_endpoint,
         help=f"LLM server API endpoint. Default is {Config.DEFAULT_API_ENDPOINT}"
     )
 
     parser.add_argument(
         '--api-key',
         required=False,
-        default=Config().api_key,
+        default=config.api_key,
         help='API key for authentication (many local servers don\'t require this)'
     )
 
     parser.add_argument(
         '--model', '-m',
-        default=Config().default_model,
+        default=config.default_model,
         help=f'The model to use for task execution (default: {Config.DEFAULT_MODEL})'
     )
     
     parser.add_argument(
         '--temperature', '-t',
-        default=Config().default_model_temperature,
+        type=float,
+        default=config.default_model_temperature,
         help=f'The temperature to use for task execution (default: {Config.DEFAULT_MODEL_TEMPERATURE})'
     )
 
@@ -100,16 +114,106 @@ def main():
         help='Disable refinement before task execution'
     )
 
+    parser.add_argument(
+        '--separate-refinement',
+        action='store_true',
+        help='Refine and execute each task with two separate LLM requests. By default both steps are fused into '
+             'a single request, so the refined prompt is not produced on its own and results differ from (and are '
+             'cached separately from) the two request workflow'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Disable the on-disk task result cache'
+    )
+
+    parser.add_argument(
+        '--cache-dir',
+        default=None,
+        help='Directory for the on-disk task result cache (default: $HOME/.sokrates/cache)'
+    )
+
+    parser.add_argument(
+        '--force-cache',
+        action='store_true',
+        help='Cache task results even if the temperature is not 0 (by default only deterministic task results are cached)'
+    )
+
+    parser.add_argument(
+        '--batch-size', '-bs',
+        type=int,
+        default=1,
+        help='Number of tasks to execute with a single LLM request. Batched tasks are executed without refinement (default: 1)'
+    )
+
+    parser.add_argument(
+        '--max-batch-tokens',
+        type=int,
+        default=None,
+        help='Estimated token budget of the task descriptions in one batch. Batches are closed early when it would be exceeded (default: no limit)'
+    )
+
+    parser.add_argument(
+        '--max-concurrency', '-mc',
+        type=int,
+        default=1,
+        help='Number of task batches to execute in parallel; streamed responses are not echoed when greater than 1 (default: 1)'
+    )
+
+    parser.add_argument(
+        '--qps-limit',
+        type=float,
+        default=None,
+        help='Maximum number of task batches started per second (default: no limit)'
+    )
+
+    parser.add_argument(
+        '--resume',
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help='Skip tasks that were completed in a previous run into the same output directory (default: enabled if the output directory already exists)'
+    )
+
+    parser.add_argument(
+        '--fail-fast',
+        action='store_true',
+        help='Cancel the remaining tasks after an unrecoverable LLM API error (server unreachable, authentication failed or model not found)'
+    )
+
     # Parse arguments
     args = parser.parse_args()
-    config = Config(verbose=args.verbose)
+    if args.verbose:
+        config.print_configuration()
+
+    from ..sequential_task_executor import SequentialTaskExecutor
 
     refinement_enabled = not args.no_refinement
     
     if not args.task_file:
         OutputPrinter.print_error("You must provide a task file using --task-file or -tf")
         sys.exit(1)
+
+    if args.batch_size < 1:
+        OutputPrinter.print_error("The batch size must be at least 1")
+        sys.exit(1)
+
+    if args.max_batch_tokens is not None and args.max_batch_tokens < 1:
+        OutputPrinter.print_error("The maximum batch tokens must be at least 1")
+        sys.exit(1)
+
+    if args.max_concurrency < 1:
+        OutputPrinter.print_error("The maximum concurrency must be at least 1")
+        sys.exit(1)
+
+    if args.qps_limit is not None and args.qps_limit <= 0:
+        OutputPrinter.print_error("The QPS limit must be greater than 0")
+        sys.exit(1)
     
+    resume = args.resume
+    if resume is None:
+        resume = bool(args.output_directory) and Path(args.output_directory).is_dir()
+
     # prepare and configure target directory    
     target_directory = Config.create_and_return_task_execution_directory(args.output_directory)
     OutputPrinter.print_info("Writing results to directory", target_directory)
@@ -127,7 +231,15 @@ def main():
         temperature=args.temperature,
         output_dir=target_directory,
         verbose=args.verbose,
-        refinement_enabled=refinement_enabled
+        refinement_enabled=refinement_enabled,
+        response_cache=ResponseCache.from_arguments(args, args.temperature),
+        batch_size=args.batch_size,
+        max_batch_tokens=args.max_batch_tokens,
+        max_concurrency=args.max_concurrency,
+        qps_limit=args.qps_limit,
+        resume=resume,
+        fuse_refinement=not args.separate_refinement,
+        fail_fast=args.fail_fast
     )
 
     try:
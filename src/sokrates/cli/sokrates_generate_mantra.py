@@ -3,11 +3,9 @@
 Python Script to generate a daily mantra and practical call to action utilizing a LLM via REST Endpoint (OpenAI Compatible API)
 """
 import argparse
-from pathlib import Path
 
 from ..colors import Colors
 from ..config import Config
-from ..refinement_workflow import RefinementWorkflow
 from ..output_printer import OutputPrinter
 
 def main():
@@ -16,6 +14,7 @@ def main():
     # Print beautiful header
     OutputPrinter.print_header("🤖 DAILY MANTRA GENERATOR 🌱", Colors.BRIGHT_CYAN, 60)
     
+    config = Config()
     # Set up argument parser
     parser = argparse.ArgumentParser(
         description='Generates a daily mantra with a matching practical call to action',
@@ -38,19 +37,19 @@ def main():
     parser.add_argument(
         '--api-endpoint',
         required=False,
-        default=Config().api_endpoint,
+        default=config.api_endpoint,
         help=f"LLM server API endpoint. Default is {Config.DEFAULT_API_ENDPOINT}"
     )
     
     parser.add_argument(
         '--api-key',
-        default=Config().api_key,
+        default=config.api_key,
         help='API key for authentication (many local servers don\'t require this)'
     )
     
     parser.add_argument(
         '--model', '-m',
-        default=Config().default_model,
+        default=config.default_model,
         help=f"A model name to use for the generation (default: {Config.DEFAULT_MODEL})."
     )
     
@@ -64,7 +63,7 @@ def main():
     parser.add_argument(
         '--temperature', '-t',
         type=float,
-        default=Config().default_model_temperature,
+        default=config.default_model_temperature,
         help='Temperature for response generation (default: 0.7)'
     )
     
@@ -81,7 +80,10 @@ def main():
     
     # Parse arguments
     args = parser.parse_args()
-    config = Config(verbose=args.verbose)
+    if args.verbose:
+        config.print_configuration()
+
+    from ..refinement_workflow import RefinementWorkflow
     
     api_endpoint = args.api_endpoint
     if not api_endpoint:
@@ -102,7 +104,7 @@ def main():
         temperature=args.temperature, max_tokens=args.max_tokens)
     
     context_files = [
-        Path(f"{Path(__file__).parent.parent.resolve()}/prompts/context/self-improvement-principles-v1.md").resolve()
+        Config.DEFAULT_PROMPTS_DIRECTORY / "context" / "self-improvement-principles-v1.md"
     ]
     generated = workflow.generate_mantra(context_files=context_files)
     if args.verbose:
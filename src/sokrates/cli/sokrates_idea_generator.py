@@ -6,9 +6,9 @@ import argparse
 import sys
 from pathlib import Path
 from ..output_printer import OutputPrinter
-from .. import Colors, Config, IdeaGenerationWorkflow, FileHelper
+from .. import Colors, Config, FileHelper
 
-def parse_arguments() -> argparse.Namespace:
+def parse_arguments(config: Config) -> argparse.Namespace:
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(
         description="Idea generator workflow: Generate topic or set topic -> Prompt Generator -> Execution Prompts (with optional refinement)",
@@ -91,7 +91,7 @@ Example usage:
     parser.add_argument(
         '--temperature', '-t',
         type=float,
-        default=Config().default_model_temperature,
+        default=config.default_model_temperature,
         help=f"Temperature for response generation for all LLM calls (Default: {Config.DEFAULT_MODEL_TEMPERATURE})"
     )
     
@@ -134,9 +134,13 @@ def main():
     """Main execution function"""
     OutputPrinter.print_header("🚀 Idea Generator 🚀", Colors.BRIGHT_CYAN, 60)
 
-    args = parse_arguments()
-
     config = Config()
+    args = parse_arguments(config)
+    if args.verbose:
+        config.print_configuration()
+
+    from ..idea_generation_workflow import IdeaGenerationWorkflow
+
     api_endpoint = config.api_endpoint
     api_key = config.api_key
     topic_generation_model = config.default_model
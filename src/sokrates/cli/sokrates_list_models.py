@@ -1,7 +1,48 @@
 #!/usr/bin/env python3
 
 import argparse
-from .. import LLMApi, Config
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from .. import Config, FileHelper
+
+# Seconds a cached model list is used before the endpoint is queried again
+MODEL_LIST_CACHE_TTL = 60
+
+def get_model_list_cache_file(config: Config, api_endpoint: str) -> Path:
+    """
+    Returns the path of the model list cache file for an API endpoint.
+
+    Args:
+        config (Config): The configuration (provides the cache directory)
+        api_endpoint (str): The API endpoint the models are listed for
+
+    Returns:
+        Path: The cache file path ($HOME/.sokrates/cache/models/<sha1 of endpoint>.json)
+    """
+    endpoint_hash = hashlib.sha1(api_endpoint.encode("utf-8")).hexdigest()
+    # a subdirectory, the response cache evicts the json files of the cache directory itself
+    return Path(config.cache_path) / "models" / f"{endpoint_hash}.json"
+
+def read_cached_models(cache_file: Path, ttl: float = MODEL_LIST_CACHE_TTL):
+    """
+    Reads a cached model list if the cache file is younger than the TTL.
+
+    Args:
+        cache_file (Path): The cache file
+        ttl (float): Maximum age of the cache file in seconds
+
+    Returns:
+        list or None: The cached model list or None if there is no valid cache entry
+    """
+    try:
+        if time.time() - os.path.getmtime(cache_file) > ttl:
+            return None
+        return FileHelper.read_json_file(cache_file)
+    except (OSError, ValueError):
+        return None
 
 def main():
     """
@@ -17,6 +58,7 @@ def main():
         None
     """
     
+    config = Config()
     # Set up argument parser
     parser = argparse.ArgumentParser(
         description='Lists available models for an llm endpoint',
@@ -32,22 +74,27 @@ Examples:
     parser.add_argument(
         '--api-endpoint',
         required=False,
-        default=Config().api_endpoint,
+        default=config.api_endpoint,
         help=f"LLM server API endpoint. Default is {Config.DEFAULT_API_ENDPOINT}"
     )
     
     parser.add_argument(
         '--api-key',
         required=False,
-        default=Config().api_key,
+        default=config.api_key,
         help='API key for authentication (many local servers don\'t require this)'
     )
+
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help=f"Ignore the cached model list (models are cached for {MODEL_LIST_CACHE_TTL} seconds per endpoint)"
+    )
     
     # Parse arguments
     args = parser.parse_args()
-    
+
     try:
-        config = Config()
         api_endpoint = config.api_endpoint
         api_key = config.api_key
         
@@ -56,8 +103,13 @@ Examples:
         if args.api_key:
             api_key = args.api_key
         
-        llm_api = LLMApi(api_endpoint=api_endpoint, api_key=api_key)
-        models = llm_api.list_models()
+        cache_file = get_model_list_cache_file(config, api_endpoint)
+        models = None if args.refresh else read_cached_models(cache_file)
+        if models is None:
+            from ..llm_api import LLMApi
+            with LLMApi(api_endpoint=api_endpoint, api_key=api_key) as llm_api:
+                models = llm_api.list_models()
+            FileHelper.write_to_file(cache_file, json.dumps(models))
         
         print("Available models:")
         for model in models:
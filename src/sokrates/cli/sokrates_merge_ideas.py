@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
 import argparse
+import asyncio
+import hashlib
+import os
 import sys
 from pathlib import Path
 from ..output_printer import OutputPrinter
-from .. import Colors, Config, MergeIdeasWorkflow, FileHelper
+from .. import Colors, Config, FileHelper, ResponseCache
 
-def parse_arguments() -> argparse.Namespace:
+def parse_arguments(config: Config) -> argparse.Namespace:
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(
         description="Idea merger workflow: Merges ideas from multiple documents into one final result document",
@@ -18,7 +21,7 @@ TODO
     
     parser.add_argument(
         '--model', '-m',
-        default=Config().default_model,
+        default=config.default_model,
         help=f"The identifier of the model to use (default: {Config.DEFAULT_MODEL})."
     )
     
@@ -44,7 +47,7 @@ TODO
     parser.add_argument(
         '--temperature', '-t',
         type=float,
-        default=Config().default_model_temperature,
+        default=config.default_model_temperature,
         help=f"Temperature for response generation for all LLM calls (Default: {Config.DEFAULT_MODEL_TEMPERATURE})"
     )
     
@@ -66,15 +69,50 @@ TODO
         help=f"Comma separated list of document paths to use for the merge."
     )
 
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Disable the on-disk LLM response cache'
+    )
+
+    parser.add_argument(
+        '--cache-dir',
+        default=None,
+        help='Directory for the on-disk LLM response cache (default: $HOME/.sokrates/cache)'
+    )
+
+    parser.add_argument(
+        '--force-cache',
+        action='store_true',
+        help='Cache responses even if the temperature is not 0 (by default only deterministic requests are cached)'
+    )
+
     return parser.parse_args()
 
+async def read_documents(document_paths, verbose=False):
+    """
+    Reads all source documents concurrently, preserving the input order.
+
+    Args:
+        document_paths (list): Paths of the documents to read
+        verbose (bool): Enable verbose output
+
+    Returns:
+        list: The document contents in the same order as document_paths
+    """
+    return await asyncio.gather(*[asyncio.to_thread(FileHelper.read_file, p, verbose) for p in document_paths])
+
 def main():
     """Main execution function"""
     OutputPrinter.print_header("🚀 Idea Merger 🚀", Colors.BRIGHT_CYAN, 60)
 
-    args = parse_arguments()
-
     config = Config()
+    args = parse_arguments(config)
+    if args.verbose:
+        config.print_configuration()
+
+    from ..merge_ideas_workflow import MergeIdeasWorkflow
+
     api_endpoint = config.api_endpoint
     api_key = config.api_key
     
@@ -99,16 +137,28 @@ def main():
         api_key=api_key,
         verbose=args.verbose,
         max_tokens=args.max_tokens,
-        temperature=args.temperature
+        temperature=args.temperature,
+        response_cache=ResponseCache.from_arguments(args, args.temperature)
     )
     
     # load documents and initialize dict to pass into the merge ideas function
-    document_paths = args.source_documents.split(",")
+    document_paths = FileHelper.parse_comma_separated_paths(args.source_documents, verbose=args.verbose)
+    document_contents = asyncio.run(read_documents(document_paths, args.verbose))
+    # stable document order -> identical prompt prefixes across reruns
+    documents = sorted(zip(document_paths, document_contents))
+    # the resolved paths are machine specific, identify the documents relative to their common directory
+    common_directory = os.path.commonpath([os.path.dirname(p) for p in document_paths]) if document_paths else ""
     source_documents = []
-    for doc_path in document_paths:
-        doc_content = FileHelper.read_file(doc_path, args.verbose)
+    seen_content_hashes = set()
+    for doc_path, doc_content in documents:
+        # skip documents with the same content (copies, symlinks) to avoid sending them twice
+        content_hash = hashlib.blake2b(doc_content.encode("utf-8"), digest_size=16).digest()
+        if content_hash in seen_content_hashes:
+            OutputPrinter.print_warning(f"Skipping duplicate document: {doc_path}")
+            continue
+        seen_content_hashes.add(content_hash)
         source_documents.append({
-            "identifier": doc_path,
+            "identifier": os.path.relpath(doc_path, common_directory),
             "content": doc_content
         })
     
@@ -8,13 +8,23 @@ leveraging the LLMApi and PromptRefiner classes.
 """
 
 import argparse
+import asyncio
 import sys
 from pathlib import Path
 
 
-from .. import LLMApi, PromptRefiner, Colors, FileHelper, Config, OutputPrinter
+from .. import Colors, FileHelper, Config, OutputPrinter, ResponseCache
 
-def parse_arguments() -> argparse.Namespace:
+DEFAULT_REFINEMENT_PROMPT_FILE = Config.DEFAULT_PROMPTS_DIRECTORY / "refine-prompt.md"
+
+# precomputed colored separator lines
+_SEP = {
+    'blue': f"{Colors.BLUE}{'=' * 60}",
+    'yellow': f"{Colors.YELLOW}{'=' * 60}",
+    'cyan': f"{Colors.CYAN}{'=' * 60}",
+}
+
+def parse_arguments(config: Config) -> argparse.Namespace:
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(
         description="Refine prompts using one LLM and send to another for execution",
@@ -46,21 +56,21 @@ Example usage:
     parser.add_argument(
         '--refinement-model', '-rm',
         required=False,
-        default=Config().default_model,
+        default=config.default_model,
         help=f"Name of the model to use for prompt refinement. Default: {Config.DEFAULT_MODEL}"
     )
     
     parser.add_argument(
         '--output-model', '-om',
         required=False,
-        default=Config().default_model,
+        default=config.default_model,
         help=f"Name of the model to receive the refined prompt and to generate the final output. Default: {Config.DEFAULT_MODEL}"
     )
     
     parser.add_argument(
         '--refinement-temperature', '-rt',
         type=float,
-        default=Config().default_model_temperature,
+        default=config.default_model_temperature,
         help=f"Temperature for the refinement model (default: {Config.DEFAULT_MODEL_TEMPERATURE})"
     )
     
@@ -91,14 +101,14 @@ Example usage:
     
     parser.add_argument(
         '--api-endpoint',
-        default=Config().api_endpoint,
+        default=config.api_endpoint,
         required=False,
         help='OpenAI-compatible API endpoint URL'
     )
     
     parser.add_argument(
         '--api-key',
-        default=Config().api_key,
+        default=config.api_key,
         required=False,
         help='API key for authentication'
     )
@@ -128,6 +138,32 @@ Example usage:
         required=False,
         help='Path to file where the final LLM response will be saved'
     )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Disable the on-disk LLM response cache'
+    )
+
+    parser.add_argument(
+        '--cache-dir',
+        default=None,
+        help='Directory for the on-disk LLM response cache (default: $HOME/.sokrates/cache)'
+    )
+
+    parser.add_argument(
+        '--force-cache',
+        action='store_true',
+        help='Cache responses even if the temperature is not 0 (by default only deterministic requests are cached)'
+    )
+
+    parser.add_argument(
+        '--conversation',
+        action='store_true',
+        help='If refinement and output model are the same, request the output as a follow-up turn of the '
+             'refinement conversation, so servers with prefix caching reuse the processed refinement prompt '
+             '(the output request then also contains the refinement prompt and the raw refined response)'
+    )
     
     # context
     parser.add_argument(
@@ -148,18 +184,43 @@ Example usage:
     return parser.parse_args()
 
 
+async def read_input_files(refinement_prompt_file, input_file, context_directories, context_files, verbose=False):
+    """
+    Reads the refinement prompt, the input prompt and all context sources concurrently.
+
+    Each file read is dispatched to a worker thread, so the total wall time is
+    bound by the slowest read instead of the sum of all reads.
+
+    Returns:
+        list: [refinement_prompt_content, input_prompt_content (or None), directory_contents, file_contents]
+    """
+    async def _no_input():
+        return None
+
+    return await asyncio.gather(
+        asyncio.to_thread(FileHelper.read_file, refinement_prompt_file, verbose),
+        asyncio.to_thread(FileHelper.read_file, input_file, verbose) if input_file else _no_input(),
+        asyncio.to_thread(FileHelper.read_multiple_files_from_directories, context_directories, verbose),
+        asyncio.gather(*[asyncio.to_thread(FileHelper.read_file, p, verbose) for p in context_files])
+    )
+
+
 def main():
     """Main execution function"""
-    print(f"{Colors.CYAN}{Colors.BOLD}")
-    print("╔══════════════════════════════════════════════════════════════╗")
-    print("║                 sokrates - Prompt Refinement Workflow        ║")
-    print("╚══════════════════════════════════════════════════════════════╝")
-    print(f"{Colors.RESET}")
+    OutputPrinter.section_batch([
+        f"{Colors.CYAN}{Colors.BOLD}",
+        "╔══════════════════════════════════════════════════════════════╗",
+        "║                 sokrates - Prompt Refinement Workflow        ║",
+        "╚══════════════════════════════════════════════════════════════╝",
+        f"{Colors.RESET}"
+    ])
     
     # Parse arguments
-    args = parse_arguments()
-    
     config = Config()
+    args = parse_arguments(config)
+    if args.verbose:
+        config.print_configuration()
+
     api_endpoint = config.api_endpoint
     api_key = config.api_key
     if args.api_key:
@@ -178,7 +239,7 @@ def main():
 
     refinement_prompt_file = args.refinement_prompt_file
     if not args.refinement_prompt_file:
-        refinement_prompt_file = Path(f"{Path(__file__).parent.parent.resolve()}/prompts/refine-prompt.md").resolve()
+        refinement_prompt_file = DEFAULT_REFINEMENT_PROMPT_FILE
         print(f"{Colors.BLUE}No refinement prompt file provided. Using default: {refinement_prompt_file}{Colors.RESET}")
         
     if not Path(refinement_prompt_file).exists():
@@ -188,91 +249,97 @@ def main():
     if not args.input_file and not args.text_prompt:
         print(f"{Colors.RED}No --input-file or --text-prompt parameters provided. Exiting.{Colors.RESET}")
         sys.exit(1)
+
+    if not args.text_prompt and not Path(args.input_file).is_file():
+        print(f"{Colors.RED}Input file not found: {args.input_file}{Colors.RESET}")
+        sys.exit(1)
         
-    context_array = []
-    if args.context_text:
-        context_array.append(args.context_text)
-        OutputPrinter.print_info("Appending context text to prompt:", args.context_text , Colors.BRIGHT_MAGENTA)
-    if args.context_directories:
-        directories = [s.strip() for s in args.context_directories.split(",")]
-        context_array.extend(FileHelper.read_multiple_files_from_directories(directories, verbose=args.verbose))
-        OutputPrinter.print_info("Appending context directories to prompt:", args.context_directories , Colors.BRIGHT_MAGENTA)
-    if args.context_files:
-        files = [s.strip() for s in args.context_files.split(",")]
-        context_array.extend(FileHelper.read_multiple_files(files, verbose=args.verbose))
-        OutputPrinter.print_info("Appending context files to prompt:", args.context_files , Colors.BRIGHT_MAGENTA)
+    context_directories = FileHelper.parse_comma_separated_paths(args.context_directories, verbose=args.verbose)
+    context_files = FileHelper.parse_comma_separated_paths(args.context_files, verbose=args.verbose)
         
-    # Initialize LLMApi, PromptRefiner
-    llm_api = LLMApi(api_endpoint=api_endpoint, api_key=api_key, verbose=args.verbose)
+    # Initialize LLMApi, PromptRefiner (only after all arguments are validated)
+    from ..llm_api import LLMApi
+    from ..prompt_refiner import PromptRefiner
+    response_cache = ResponseCache.from_arguments(args, args.refinement_temperature, args.output_temperature)
+    llm_api = LLMApi(api_endpoint=api_endpoint, api_key=api_key, verbose=args.verbose, response_cache=response_cache)
     prompt_refiner = PromptRefiner(verbose=args.verbose)
 
     # Step 1: Read input files
-    print(f"\n{Colors.BLUE}{'='*60}")
-    print(f"{Colors.BLUE}🔄 Reading input files")
-    print(f"{Colors.BLUE}{'='*60}{Colors.RESET}")
+    print(f"\n{_SEP['blue']}\n{Colors.BLUE}🔄 Reading input files\n{_SEP['blue']}{Colors.RESET}")
     try:
+        input_file = None if args.text_prompt else args.input_file
+        refinement_prompt_content, input_file_content, directory_contents, file_contents = asyncio.run(
+            read_input_files(refinement_prompt_file, input_file, context_directories, context_files, args.verbose)
+        )
+        
         # refinement prompt
-        refinement_prompt_content = FileHelper.read_file(refinement_prompt_file,args.verbose)
-        print(f"{Colors.GREEN}Successfully read file: {refinement_prompt_file}{Colors.RESET}")
-        print(f"{Colors.BLUE}File size: {len(refinement_prompt_content)} characters{Colors.RESET}")
+        status_lines = [
+            f"{Colors.GREEN}Successfully read file: {refinement_prompt_file}{Colors.RESET}",
+            f"{Colors.BLUE}File size: {len(refinement_prompt_content)} characters{Colors.RESET}"
+        ]
         
         # input prompt
         input_prompt_content = ""
         if args.text_prompt:
             input_prompt_content = args.text_prompt
         else:
-            input_prompt_content = FileHelper.read_file(args.input_file, args.verbose)
-            print(f"{Colors.GREEN}Successfully read file: {args.input_file}{Colors.RESET}")
-        print(f"{Colors.BLUE}Input prompt length: {len(input_prompt_content)} characters{Colors.RESET}")
+            input_prompt_content = input_file_content
+            status_lines.append(f"{Colors.GREEN}Successfully read file: {args.input_file}{Colors.RESET}")
+        status_lines.append(f"{Colors.BLUE}Input prompt length: {len(input_prompt_content)} characters{Colors.RESET}")
+        OutputPrinter.section_batch(status_lines)
     except (FileNotFoundError, IOError) as e:
         print(f"{Colors.RED}Error reading file: {e}{Colors.RESET}")
         sys.exit(1)
     
+    context_array = []
+    if args.context_directories:
+        context_array.extend(directory_contents)
+        OutputPrinter.print_info("Appending context directories to prompt:", args.context_directories , Colors.BRIGHT_MAGENTA)
+    if args.context_files:
+        context_array.extend(file_contents)
+        OutputPrinter.print_info("Appending context files to prompt:", args.context_files , Colors.BRIGHT_MAGENTA)
+    # static file contents first, the ad-hoc context text last (keeps the prompt prefix cacheable)
+    if args.context_text:
+        context_array.append(args.context_text)
+        OutputPrinter.print_info("Appending context text to prompt:", args.context_text , Colors.BRIGHT_MAGENTA)
+    
     # Step 2: Combine prompts
-    print(f"\n{Colors.BLUE}{'='*60}")
-    print(f"{Colors.BLUE}🔄 Combining prompts")
-    print(f"{Colors.BLUE}{'='*60}{Colors.RESET}")
+    print(f"\n{_SEP['blue']}\n{Colors.BLUE}🔄 Combining prompts\n{_SEP['blue']}{Colors.RESET}")
     combined_prompt = prompt_refiner.combine_refinement_prompt(
         input_prompt_content, refinement_prompt_content
     )
     print(f"{Colors.BLUE}Combined prompt length: {len(combined_prompt)} characters{Colors.RESET}")
     
-    # Step 3: Send to refinement model
-    print(f"\n{Colors.YELLOW}{'='*60}")
-    print(f"{Colors.YELLOW}🔄 Sending to refinement model: {args.refinement_model}")
-    print(f"{Colors.YELLOW}{'='*60}{Colors.RESET}")
-    refinement_response = llm_api.send(
-        prompt=combined_prompt,
-        model=args.refinement_model,
-        max_tokens=args.max_tokens_refinement,
-        temperature=args.refinement_temperature
-    )
-    print(f"{Colors.GREEN}Received refinement response: {len(refinement_response)} characters{Colors.RESET}")
-    
-    # Step 4: Clean the refined response
-    print(f"\n{Colors.MAGENTA}{'='*60}")
-    print(f"{Colors.MAGENTA}🔄 Cleaning refined response")
-    print(f"{Colors.MAGENTA}{'='*60}{Colors.RESET}")
-    cleaned_refined_prompt = prompt_refiner.clean_response(refinement_response)
-    print(f"{Colors.GREEN}Cleaned refined prompt length: {len(cleaned_refined_prompt)} characters{Colors.RESET}")
-    
-    # Step 5: Send to output model
-    print(f"\n{Colors.GREEN}{'='*60}")
-    print(f"{Colors.GREEN}🔄 Sending to output model: {args.output_model}")
-    print(f"{Colors.GREEN}{'='*60}{Colors.RESET}")
-    final_response = llm_api.send(
-        prompt=cleaned_refined_prompt,
-        model=args.output_model,
-        max_tokens=args.max_tokens_output,
-        temperature=args.output_temperature,
-        context_array=context_array
-    )
-    print(f"{Colors.GREEN}Received final response: {len(final_response)} characters{Colors.RESET}")
+    # Step 3: Send to refinement model, clean the refined response and send it to the output model
+    print(f"\n{_SEP['yellow']}\n"
+          f"{Colors.YELLOW}🔄 Sending to refinement model: {args.refinement_model}\n"
+          f"{Colors.YELLOW}🔄 Sending cleaned refined prompt to output model: {args.output_model}\n"
+          f"{_SEP['yellow']}{Colors.RESET}")
+    with llm_api:
+        cleaned_refined_prompt, final_response = llm_api.send_pipeline([
+            {
+                "prompt": combined_prompt,
+                "model": args.refinement_model,
+                "max_tokens": args.max_tokens_refinement,
+                "temperature": args.refinement_temperature,
+                "post_process": prompt_refiner.clean_response
+            },
+            {
+                "model": args.output_model,
+                "max_tokens": args.max_tokens_output,
+                "temperature": args.output_temperature,
+                "context_array": context_array
+            }
+        ], conversation=args.conversation)
+    OutputPrinter.section_batch([
+        f"{Colors.GREEN}Cleaned refined prompt length: {len(cleaned_refined_prompt)} characters{Colors.RESET}",
+        f"{Colors.GREEN}Received final response: {len(final_response)} characters{Colors.RESET}"
+    ])
     
     # Write the final response to the output file if --output is provided
     if args.output:
         try:
-            print(f"\n{Colors.CYAN}{'='*60}{Colors.RESET}")
+            print(f"\n{_SEP['cyan']}{Colors.RESET}")
             FileHelper.write_to_file(file_path=args.output, content=final_response, verbose=args.verbose)
             print(f"{Colors.GREEN}Final response saved to: {args.output}{Colors.RESET}")
         except IOError as e:
@@ -280,10 +347,12 @@ def main():
             sys.exit(1)
     
     # Final success message
-    print(f"\n{Colors.CYAN}{'='*60}")
-    print(f"{Colors.CYAN}🎉 Process completed successfully! 🎉")
-    print(f"{Colors.CYAN}{'='*60}{Colors.RESET}")
-    print(f"{Colors.GREEN}Final response length: {len(final_response)} characters{Colors.RESET}")
+    OutputPrinter.section_batch([
+        f"\n{_SEP['cyan']}",
+        f"{Colors.CYAN}🎉 Process completed successfully! 🎉",
+        f"{_SEP['cyan']}{Colors.RESET}",
+        f"{Colors.GREEN}Final response length: {len(final_response)} characters{Colors.RESET}"
+    ])
     
 
 if __name__ == "__main__":
@@ -20,19 +20,20 @@ OUTPUT_FILE="improved.md"
 uv run python refine-prompt.py --api-endpoint "$ENDPOINT"  --models "$MODELS" --input-file $INPUT_FILE  "$REFINEMENT_INSTRUCTIONS_FILE" --verbose --max-tokens 10000 --output $OUTPUT_FILE
 """
 
+import os
 import sys
 import argparse
+import asyncio
 from pathlib import Path
-import time
-from openai import OpenAI
-from .. import LLMApi, PromptRefiner, Colors, FileHelper, Config
+from .. import Colors, FileHelper, Config, ResponseCache
 from ..output_printer import OutputPrinter
 
+DEFAULT_REFINEMENT_PROMPT_FILE = Config.DEFAULT_PROMPTS_DIRECTORY / "refine-prompt.md"
+
 # TODO:
 # - Improve extraction of generated prompts (remove "think" tags).
 # Feature: Allow sending the refined prompt to other LLMs.
 # - allow specifying an output directory for the generated prompts (create it if not present)
-# Add a parameter to specify the wait time after model unloading (default: 0 seconds).
 
 def validate_endpoint_url(url):
     """
@@ -53,11 +54,18 @@ def main():
     # Print beautiful header
     OutputPrinter.print_header("🤖 sokrates PROMPT REFINER 🚀", Colors.BRIGHT_CYAN, 60)
     
+    config = Config()
     # Set up argument parser
     parser = argparse.ArgumentParser(
         description='Send prompts to LLM server with OpenAI-compatible API and get markdown output',
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
+Prompt caching:
+  The refinement prompt is sent as system message, followed by the context
+  files, the --context-text and finally the input prompt. Keep the static parts
+  (refinement prompt, context files) unchanged between runs to benefit from the
+  prompt prefix cache of the LLM server.
+
 Examples:
   # Using input file instead of command line prompt
   python script.py --input-file "initial_prompt.txt" \\
@@ -110,19 +118,19 @@ Examples:
     parser.add_argument(
         '--api-endpoint',
         required=False,
-        default=Config().api_endpoint,
+        default=config.api_endpoint,
         help=f"LLM server API endpoint. Default is {Config.DEFAULT_API_ENDPOINT}"
     )
     
     parser.add_argument(
         '--api-key',
-        default=Config().api_key,
+        default=config.api_key,
         help='API key for authentication (many local servers don\'t require this)'
     )
     
     parser.add_argument(
         '--models', '-m',
-        default=Config().default_model,
+        default=config.default_model,
         help=f"Comma separated list of models to use (default: {Config.DEFAULT_MODEL}). For multiple models e.g: qwen/qwen3-14b,phi4"
     )
     
@@ -136,10 +144,48 @@ Examples:
     parser.add_argument(
         '--temperature', '-t',
         type=float,
-        default=Config().default_model_temperature,
+        default=config.default_model_temperature,
         help=f"Temperature for response generation (default: {Config.DEFAULT_MODEL_TEMPERATURE})"
     )
     
+    parser.add_argument(
+        '--max-workers', '-mw',
+        type=int,
+        default=None,
+        help='Maximum number of models to query concurrently (default: all models at once)'
+    )
+    
+    parser.add_argument(
+        '--stream', '-s',
+        action='store_true',
+        help='Print the responses while they are generated (queries the models one after another)'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Disable the on-disk LLM response cache'
+    )
+    
+    parser.add_argument(
+        '--cache-dir',
+        default=None,
+        help='Directory for the on-disk LLM response cache (default: $HOME/.sokrates/cache)'
+    )
+    
+    parser.add_argument(
+        '--cache-ttl',
+        type=float,
+        default=None,
+        help='Seconds after which cached responses expire (default: never)'
+    )
+    
+    parser.add_argument(
+        '--force-cache',
+        action='store_true',
+        help='Cache responses even if the temperature is not 0 (by default only deterministic requests are cached)'
+    )
+    
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -169,8 +215,12 @@ Examples:
     
     # Parse arguments
     args = parser.parse_args()
+    if args.verbose:
+        config.print_configuration()
+
+    from ..llm_api import LLMApi
+    from ..prompt_refiner import PromptRefiner
     
-    config = Config()
     
     # Validate that either text_prompt or input-file is provided
     if not args.text_prompt and not args.input_file:
@@ -183,6 +233,10 @@ Examples:
         OutputPrinter.print_warning("Choose either command line prompt or input file, not both")
         sys.exit(1)
     
+    if args.max_workers is not None and args.max_workers < 1:
+        OutputPrinter.print_error("--max-workers must be at least 1")
+        sys.exit(1)
+    
     # Validate text prompt (if provided via command line)
     if args.text_prompt and not args.text_prompt.strip():
         OutputPrinter.print_error("Text prompt cannot be empty")
@@ -195,7 +249,7 @@ Examples:
     
     refinement_prompt_file = args.refinement_prompt_file
     if not args.refinement_prompt_file:
-        refinement_prompt_file = Path(f"{Path(__file__).parent.parent.resolve()}/prompts/refine-prompt.md")
+        refinement_prompt_file = DEFAULT_REFINEMENT_PROMPT_FILE
         OutputPrinter.print_info("No refinement prompt file provided. Using default:", refinement_prompt_file, Colors.BRIGHT_CYAN)
         
     if not Path(refinement_prompt_file).exists():
@@ -237,23 +291,28 @@ Examples:
             OutputPrinter.print_info("Output File", args.output, Colors.BRIGHT_CYAN)
         print()
         
-    # context
+    # context: static file contents first, the ad-hoc context text last (keeps the prompt prefix cacheable)
     context_array = []
-    if args.context_text:
-        context_array.append(args.context_text)
-        OutputPrinter.print_info("Appending context text to prompt:", args.context_text , Colors.BRIGHT_MAGENTA)
+    # collect all context file paths first and read them in one parallel batch
+    context_file_paths = []
     if args.context_directories:
-        directories = [s.strip() for s in args.context_directories.split(",")]
-        context_array.extend(FileHelper.read_multiple_files_from_directories(directories, verbose=args.verbose))
+        directories = FileHelper.parse_comma_separated_paths(args.context_directories, verbose=args.verbose)
+        context_file_paths.extend(FileHelper.list_files_in_directories(directories, verbose=args.verbose))
         OutputPrinter.print_info("Appending context directories to prompt:", args.context_directories , Colors.BRIGHT_MAGENTA)
     if args.context_files:
-        files = [s.strip() for s in args.context_files.split(",")]
-        context_array.extend(FileHelper.read_multiple_files(files, verbose=args.verbose))
+        context_file_paths.extend(FileHelper.parse_comma_separated_paths(args.context_files, verbose=args.verbose))
         OutputPrinter.print_info("Appending context files to prompt:", args.context_files , Colors.BRIGHT_MAGENTA)
+    # a context file might also be part of a context directory, include it only once
+    context_file_paths = FileHelper.deduplicate_files(context_file_paths)
+    context_array.extend(FileHelper.read_paths_parallel(context_file_paths, verbose=args.verbose))
+    if args.context_text:
+        context_array.append(args.context_text)
+        OutputPrinter.print_info("Appending context text to prompt:", args.context_text , Colors.BRIGHT_MAGENTA)
     
     try:
         refiner = PromptRefiner(verbose=args.verbose)
-        llm_api = LLMApi(api_endpoint=api_endpoint, api_key=api_key, verbose=args.verbose)
+        response_cache = ResponseCache.from_arguments(args, args.temperature)
+        llm_api = LLMApi(api_endpoint=api_endpoint, api_key=api_key, verbose=args.verbose, response_cache=response_cache)
         
         # Load initial prompt (either from command line or file)
         if args.input_file:
@@ -267,57 +326,81 @@ Examples:
             OutputPrinter.print_progress(f"Loading refinement prompt from file {Colors.CYAN}{refinement_prompt_file}{Colors.RESET}")
         refinement_prompt = FileHelper.read_file(refinement_prompt_file, args.verbose)
         
-        # Combine prompts
-        if args.verbose:
-            OutputPrinter.print_progress("Combining prompts...")
-        combined_prompt = refiner.combine_refinement_prompt(text_prompt, refinement_prompt)
+        # The static refinement prompt is sent as system message ahead of the
+        # context and the input prompt, so repeated runs share the longest
+        # possible prompt prefix with the server-side prompt cache
+        if not text_prompt.strip():
+            raise ValueError("Input prompt cannot be empty")
         
         if args.verbose:
-            OutputPrinter.print_info("Combined prompt length", f"{len(combined_prompt):,} characters", Colors.BRIGHT_MAGENTA)
+            OutputPrinter.print_info("Combined prompt length", f"{len(refinement_prompt) + len(text_prompt):,} characters", Colors.BRIGHT_MAGENTA)
         
         # Send to LLM
         if args.verbose:
             OutputPrinter.print_progress(f"Sending request to LLM server at {Colors.CYAN}{api_endpoint}{Colors.RESET}")
         
-        # send to llm
+        def stream_with_model(model_name):
+            OutputPrinter.print_progress(f"Streaming response of model {Colors.CYAN}{model_name}{Colors.RESET}")
+            chunks = []
+            for piece in llm_api.send_stream(text_prompt, model=model_name, system_prompt=refinement_prompt,
+                    max_tokens=args.max_tokens, temperature=args.temperature, context_array=context_array):
+                sys.stdout.write(piece)
+                sys.stdout.flush()
+                chunks.append(piece)
+            print()
+            return "".join(chunks)
+
+        # send to all models concurrently, the requests are independent
+        async def refine_with_model(model_name, semaphore):
+            async with semaphore:
+                return await llm_api.send_async(text_prompt, model=model_name, system_prompt=refinement_prompt,
+                    max_tokens=args.max_tokens, temperature=args.temperature, context_array=context_array)
+
+        async def refine_with_all_models():
+            # created within the running loop (before Python 3.10 primitives bind to the loop at creation)
+            semaphore = asyncio.Semaphore(args.max_workers or len(models))
+            try:
+                return await asyncio.gather(*(refine_with_model(model_name, semaphore) for model_name in models))
+            finally:
+                await llm_api.aclose()
+
+        if args.stream:
+            # streamed output of concurrent requests would interleave
+            responses = [stream_with_model(model_name) for model_name in models]
+        else:
+            responses = asyncio.run(refine_with_all_models())
+
         created_files = []
-        for i, model_name in enumerate(models, 1):
+        outputs = []
+        if args.output:
+            # one output file per model: <name>-<model>.<extension>
+            f_name, f_extension = os.path.splitext(args.output)
+            f_extension = f_extension[1:] or 'md'
+        for i, (model_name, response_content) in enumerate(zip(models, responses), 1):
             OutputPrinter.print_header(f"🎯 MODEL {i}/{len(models)}: {model_name}", Colors.BRIGHT_GREEN, 60)
 
-            response_content = llm_api.send(combined_prompt, model=model_name, 
-                max_tokens=args.max_tokens, context_array=context_array)
             processed_content = refiner.clean_response(response_content)
         
             # Format as markdown
             markdown_output = refiner.format_as_markdown(processed_content)
         
-            # Save to file if output filename is specified
+            # Collect the output file if output filename is specified
             if args.output:
-                f_name = args.output
-                f_extension = 'md'
-                
-                try:
-                    f_name, f_extension = args.output.rsplit('.', 1)
-                except:
-                    pass
-                
                 model_name_escaped = model_name.replace('/', '-')
                 new_file_name = f"{f_name}-{model_name_escaped}.{f_extension}"
-                
-                OutputPrinter.print_progress(f"Saving response to file: {Colors.CYAN}{new_file_name}{Colors.RESET}")
-                FileHelper.write_to_file(file_path=new_file_name, content=markdown_output, verbose=args.verbose)
-                created_files.append(new_file_name)
-                OutputPrinter.print_file_created(new_file_name)
-            
-            # Print the result to stdout (always print, regardless of file output)
-            OutputPrinter.print_section(f"✨ GENERATED PROMPT FOR {model_name.upper()}", Colors.BRIGHT_MAGENTA, "═")
-            print(f"{Colors.WHITE}{markdown_output}{Colors.RESET}")
-            OutputPrinter.print_section("", Colors.BRIGHT_MAGENTA, "═")
+                outputs.append((new_file_name, markdown_output))
             
-            # Model unload wait
-            if i < len(models):  # Don't wait after the last model
-                OutputPrinter.print_progress(f"Waiting for model to unload... {Colors.DIM}(8 seconds){Colors.RESET}")
-                time.sleep(8)
+            # Print the result to stdout (regardless of file output), streamed responses were printed already
+            if not args.stream:
+                OutputPrinter.print_section(f"✨ GENERATED PROMPT FOR {model_name.upper()}", Colors.BRIGHT_MAGENTA, "═")
+                print(f"{Colors.WHITE}{markdown_output}{Colors.RESET}")
+                OutputPrinter.print_section("", Colors.BRIGHT_MAGENTA, "═")
+        
+        # write all output files at once
+        if outputs:
+            OutputPrinter.print_progress(f"Saving {len(outputs)} response(s) to file(s)")
+            FileHelper.write_many(outputs, verbose=args.verbose)
+            created_files = [file_name for file_name, _ in outputs]
         
         # print files created list
         if created_files:
@@ -21,8 +21,7 @@ import sys
 import logging
 import os
 from pathlib import Path
-from openai import OpenAI
-from .. import LLMApi, FileHelper, PromptRefiner, Config
+from .. import FileHelper, Config
 
 # ANSI escape codes for colors
 COLOR_RESET = "\033[0m"
@@ -97,11 +96,9 @@ def prompt_model(llm_api, prompt, model, max_tokens, temperature,
         if context_text:
             context_array.append(context_text)
         if context_directories:
-            directories = [s.strip() for s in context_directories.split(",")]
-            context_array.extend(FileHelper.read_multiple_files_from_directories(directories, verbose=verbose))
+            context_array.extend(FileHelper.read_multiple_files_from_directories(context_directories, verbose=verbose))
         if context_files:
-            files = [s.strip() for s in context_files.split(",")]
-            context_array.extend(FileHelper.read_multiple_files(files, verbose=verbose))
+            context_array.extend(FileHelper.read_multiple_files(context_files, verbose=verbose))
 
         response = llm_api.send(prompt,
             model=model,
@@ -116,6 +113,7 @@ def prompt_model(llm_api, prompt, model, max_tokens, temperature,
         logging.info(f"{COLOR_MAGENTA}{'-'*20}\n{COLOR_RESET}")
         
         if post_process_results:
+            from ..prompt_refiner import PromptRefiner
             refiner = PromptRefiner({}, verbose=verbose)
             logging.info(f"{COLOR_MAGENTA}{COLOR_BOLD}\nPost processing is enabled\n{COLOR_RESET}")
             response = refiner.clean_response(response)
@@ -132,6 +130,7 @@ def prompt_model(llm_api, prompt, model, max_tokens, temperature,
 def main():
     """Main function to send a prompt to one or more LLM servers and handle responses."""
     
+    config = Config()
     parser = argparse.ArgumentParser(
         description="Send prompts to local LLM servers and save responses as markdown files",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -145,11 +144,11 @@ Call example:
     parser.add_argument('prompt', nargs='?', help='Text prompt to send to LLMs (optional)')
     
     # Required flags
-    parser.add_argument('--api-endpoint', '-ae', default=Config().api_endpoint, help='LLM server API endpoint')
-    parser.add_argument('--api-key', '-ak', default=Config().api_key, help='API key for authentication (can be empty for local servers)')
-    parser.add_argument('--models', '-m', default=Config().default_model, help='Comma separated model names to use (can be multiple)')
+    parser.add_argument('--api-endpoint', '-ae', default=config.api_endpoint, help='LLM server API endpoint')
+    parser.add_argument('--api-key', '-ak', default=config.api_key, help='API key for authentication (can be empty for local servers)')
+    parser.add_argument('--models', '-m', default=config.default_model, help='Comma separated model names to use (can be multiple)')
     parser.add_argument('--max-tokens', '-mt', default=20000, type=int, help='Maximum tokens in response (Default: 20000)')
-    parser.add_argument('--temperature', '-t', default=Config().default_model_temperature, type=float, help='Temperature for response generation')
+    parser.add_argument('--temperature', '-t', default=config.default_model_temperature, type=float, help='Temperature for response generation')
     parser.add_argument('--verbose','-v', action='store_true', help='Enable verbose output')
     parser.add_argument('--output-directory', '-o', default=None, help='Directory to write model outputs to as markdown files')
     parser.add_argument('--input-file','-i', default=None, help='File containing the prompt to send')
@@ -161,6 +160,10 @@ Call example:
     
     # Parse arguments
     args = parser.parse_args()
+    if args.verbose:
+        config.print_configuration()
+
+    from ..llm_api import LLMApi
     
     # Validate input requirements
     if (args.prompt is None and args.input_file is None and args.input_directory is None):
@@ -196,14 +199,17 @@ Call example:
         logging.info(f"{COLOR_MAGENTA}context-directories: {args.context_directories}{COLOR_RESET}")
         logging.info(f"{COLOR_MAGENTA}context-files: {args.context_files}{COLOR_RESET}")
     
+    context_directories = FileHelper.parse_comma_separated_paths(args.context_directories, verbose=args.verbose)
+    context_files = FileHelper.parse_comma_separated_paths(args.context_files, verbose=args.verbose)
+
     # Process single prompt (no directory or file specified)
     if args.prompt is not None:
         for model in models:
             prompt_model(llm_api, prompt=args.prompt, model=model, max_tokens=args.max_tokens, 
                 temperature=args.temperature, output_directory=args.output_directory, source_prompt_file=None, 
                 verbose=args.verbose, post_process_results=args.post_process_results,
-                context_text=args.context_text, context_directories=args.context_directories, 
-                context_files=args.context_files)
+                context_text=args.context_text, context_directories=context_directories, 
+                context_files=context_files)
             sys.exit(0)
 
     # Process multiple prompt files from directory
@@ -221,8 +227,8 @@ Call example:
                     temperature=args.temperature, output_directory=args.output_directory, 
                     source_prompt_file=filepath, verbose=args.verbose, 
                     post_process_results=args.post_process_results,
-                    context_text=args.context_text, context_directories=args.context_directories, 
-                    context_files=args.context_files)
+                    context_text=args.context_text, context_directories=context_directories, 
+                    context_files=context_files)
 
 if __name__ == '__main__':
     main()
@@ -6,11 +6,12 @@ This module provides command-line tools for managing the task queue daemon.
 """
 
 import os
+import select
 import sys
 import signal
 import time
-import subprocess
-from sokrates.task_queue.daemon import TaskQueueDaemon
+import psutil
+from sokrates.colors import Colors
 from sokrates.output_printer import OutputPrinter
 from sokrates.config import Config
 
@@ -43,8 +44,12 @@ def start_daemon():
             log_file_path = Config().daemon_logfile_path
             sys.stdout = open(log_file_path, 'a')
             sys.stderr = open(log_file_path, 'a')
+            # colors were enabled for the terminal when importing, keep escape codes out of the log
+            Colors.disable()
 
             # Also redirect logging to the same file (it's already set up in TaskQueueDaemon)
+            # imported here, only the daemon process needs the LLM client stack
+            from sokrates.task_queue.daemon import TaskQueueDaemon
             daemon = TaskQueueDaemon()
             daemon.run()
 
@@ -88,19 +93,9 @@ def stop_daemon(pid=None):
         os.kill(pid, signal.SIGTERM)
 
         # Wait for process to terminate
-        start_time = time.time()
-        while True:
-            try:
-                os.kill(pid, 0)  # Check if process exists
-            except OSError:
-                break  # Process terminated
-
-            if time.time() - start_time > 10:  # 10 second timeout
-                OutputPrinter.print("Timeout waiting for daemon to stop. Sending SIGKILL...")
-                os.kill(pid, signal.SIGKILL)
-                break
-
-            time.sleep(0.1)
+        if not _wait_for_process_exit(pid, timeout=10):
+            OutputPrinter.print("Timeout waiting for daemon to stop. Sending SIGKILL...")
+            os.kill(pid, signal.SIGKILL)
 
         OutputPrinter.print(f"Task queue daemon stopped (PID: {pid})")
         return True
@@ -108,20 +103,48 @@ def stop_daemon(pid=None):
         OutputPrinter.print(f"Error stopping daemon: {e}")
         return False
 
+def _wait_for_process_exit(pid: int, timeout: float) -> bool:
+    """
+    Waits until the process with the given PID has exited.
+
+    Uses a pidfd (Linux 5.3+), which becomes readable when the process exits,
+    and falls back to polling the process every 100ms on other platforms.
+
+    Returns:
+        bool: True if the process exited, False if the timeout was reached.
+    """
+    try:
+        pidfd = os.pidfd_open(pid)
+    except (AttributeError, OSError):
+        pidfd = None
+    if pidfd is not None:
+        try:
+            ready, _, _ = select.select([pidfd], [], [], timeout)
+            return bool(ready)
+        finally:
+            os.close(pidfd)
+
+    start_time = time.time()
+    while True:
+        try:
+            os.kill(pid, 0)  # Check if process exists
+        except OSError:
+            return True  # Process terminated
+        if time.time() - start_time > timeout:
+            return False
+        time.sleep(0.1)
+
 def _search_for_pid_by_process_names(process_names:list) -> int:
-    for process_name in process_names:
-        result = subprocess.run(
-            ['pgrep', '-f', process_name],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
-
-        if result.returncode == 0:
-            pids = result.stdout.decode().strip().split('\n')
-            # Filter out empty lines and return the first valid PID
-            for pid in pids:
-                if pid.isdigit():
-                    return int(pid)
+    # single pass over the process table, checks all names per process
+    # skip this process and its ancestors (e.g. the shell that started it)
+    own_process = psutil.Process()
+    own_pids = {own_process.pid} | {parent.pid for parent in own_process.parents()}
+    for process in psutil.process_iter(['pid', 'cmdline']):
+        if process.info['pid'] in own_pids:
+            continue
+        command_line = ' '.join(process.info['cmdline'] or ())
+        if any(process_name in command_line for process_name in process_names):
+            return process.info['pid']
     return None
 
 def find_daemon_pid():
@@ -1,6 +1,11 @@
 # This script defines a `Colors` class that provides ANSI escape codes
 # for various text colors, bright colors, text styles, and background colors.
 # These codes can be used to format console output, making it more readable and visually appealing.
+# When stdout is not a terminal (e.g. redirected to a log file) or the NO_COLOR
+# environment variable is set, all codes are empty strings.
+
+import os
+import sys
 
 class Colors:
     """
@@ -49,3 +54,24 @@ class Colors:
     BG_MAGENTA: str = '\033[45m'
     BG_CYAN: str = '\033[46m'
     BG_WHITE: str = '\033[47m'
+
+    # Common combinations
+    RED_BOLD: str = RED + BOLD
+    GREEN_BOLD: str = GREEN + BOLD
+    BLUE_BOLD: str = BLUE + BOLD
+    CYAN_BOLD: str = CYAN + BOLD
+
+    @classmethod
+    def disable(cls) -> None:
+        """
+        Replaces all escape codes with empty strings, e.g. for output that is
+        not written to a terminal.
+        """
+        for name, value in vars(cls).items():
+            if name.isupper() and isinstance(value, str):
+                setattr(cls, name, "")
+
+# Decided at import, so modules can precompute colored strings at import time.
+# Processes redirecting stdout afterwards (e.g. the daemon) call Colors.disable().
+if os.environ.get("NO_COLOR") or not sys.stdout.isatty():
+    Colors.disable()
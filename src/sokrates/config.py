@@ -4,9 +4,10 @@
 # and the default LLM model. This centralizes configuration management
 # and allows for easy customization via environment variables.
 
+import functools
 import os
+import time
 from pathlib import Path
-from dotenv import load_dotenv
 from .colors import Colors
 from datetime import datetime
 
@@ -30,22 +31,32 @@ class Config:
             cls._instance = super(Config, cls).__new__(cls)
             # Initialize your config here, for example:
             cls._instance.settings = {}
+            cls._instance._initialized = False
+            cls._instance._configuration_printed = False
         return cls._instance
   
   DEFAULT_API_ENDPOINT = "http://localhost:1234/v1"
   DEFAULT_API_KEY = "notrequired"
   DEFAULT_MODEL = "qwen/qwen3-8b"
   DEFAULT_MODEL_TEMPERATURE = 0.7
-  DEFAULT_PROMPTS_DIRECTORY = Path(f"{Path(__file__).parent.resolve()}/prompts").resolve()
+  DEFAULT_PROMPTS_DIRECTORY = Path(__file__).resolve().parent / "prompts"
   DEFAULT_TASK_QUEUE_DAEMON_PROCESSING_INTERVAL = 15
+  _HOME = Path.home()
+  DEFAULT_TASK_RESULTS_DIRECTORY = _HOME / ".sokrates" / "tasks" / "results"
   
   def __init__(self, verbose=False) -> None:
     """
-    Initializes the Config object.
+    Initializes the Config object. The configuration is only loaded on the
+    first call, subsequent calls return the already loaded singleton.
 
     Args:
-        verbose (bool): If True, prints basic configuration details upon loading.
+        verbose (bool): If True, prints basic configuration details upon loading,
+            or on a later call if they have not been printed yet.
     """
+    if self._initialized:
+      if verbose and not self._configuration_printed:
+        self.print_configuration()
+      return
     # TODO: refactor this logic, it's messy right now
     self.verbose = verbose
     # Determine the configuration file path. Prioritize SOKRATES_CONFIG_FILEPATH environment variable.
@@ -55,14 +66,19 @@ class Config:
     self.daemon_logfile_path: str = f"{self.logs_path}/daemon.log"
     self.task_queue_daemon_processing_interval = self.DEFAULT_TASK_QUEUE_DAEMON_PROCESSING_INTERVAL
     self.database_path: str = f"{self.home_path}/sokrates_database.sqlite"
+    self.cache_path: str = f"{self.home_path}/cache"
     self.config_path: str = os.environ.get('SOKRATES_CONFIG_FILEPATH', self.config_path)
     if os.environ.get('SOKRATES_DATABASE_PATH'):
       self.database_path: str = os.environ.get('SOKRATES_DATABASE_PATH')
     if os.environ.get('SOKRATES_TASK_QUEUE_DAEMON_LOGFILE_PATH'):
       self.daemon_logfile_path: str = os.environ.get('SOKRATES_TASK_QUEUE_DAEMON_LOGFILE_PATH')      
+    if os.environ.get('SOKRATES_CACHE_PATH'):
+      self.cache_path: str = os.environ.get('SOKRATES_CACHE_PATH')
     self.load_env()
     self.initialize_directories()
-    self.print_configuration()
+    if self.verbose:
+      self.print_configuration()
+    self._initialized = True
     
   def print_configuration(self):
       """
@@ -80,20 +96,26 @@ class Config:
       Returns:
           None
       """
-      print(f"{Colors.GREEN}{Colors.BOLD}### Basic Configuration ###{Colors.RESET}")
-      print(f"{Colors.BLUE}{Colors.BOLD} - SOKRATES_HOME_PATH: {self.home_path}{Colors.RESET}")
-      print(f"{Colors.BLUE}{Colors.BOLD} - SOKRATES_API_ENDPOINT: {self.api_endpoint}{Colors.RESET}")
-      print(f"{Colors.BLUE}{Colors.BOLD} - SOKRATES_DEFAULT_MODEL: {self.default_model}{Colors.RESET}")
-      print(f"{Colors.BLUE}{Colors.BOLD} - SOKRATES_DEFAULT_MODEL_TEMPERATURE: {self.default_model_temperature}{Colors.RESET}")
-      print(f"{Colors.BLUE}{Colors.BOLD} - SOKRATES_CONFIG_FILEPATH: {self.config_path}{Colors.RESET}")
-      print(f"{Colors.BLUE}{Colors.BOLD} - SOKRATES_DATABASE_PATH: {self.database_path}{Colors.RESET}")
-      print(f"{Colors.BLUE}{Colors.BOLD} - SOKRATES_DAEMON_LOGFILE_PATH: {self.daemon_logfile_path}{Colors.RESET}")
+      settings = {
+        "SOKRATES_HOME_PATH": self.home_path,
+        "SOKRATES_API_ENDPOINT": self.api_endpoint,
+        "SOKRATES_DEFAULT_MODEL": self.default_model,
+        "SOKRATES_DEFAULT_MODEL_TEMPERATURE": self.default_model_temperature,
+        "SOKRATES_CONFIG_FILEPATH": self.config_path,
+        "SOKRATES_DATABASE_PATH": self.database_path,
+        "SOKRATES_DAEMON_LOGFILE_PATH": self.daemon_logfile_path,
+      }
+      lines = [f"{Colors.GREEN_BOLD}### Basic Configuration ###{Colors.RESET}"]
+      lines.extend(f"{Colors.BLUE_BOLD} - {name}: {value}{Colors.RESET}" for name, value in settings.items())
+      print("\n".join(lines))
+      self._configuration_printed = True
   
   def load_env(self) -> None:
       """
       Loads environment variables from the specified .env file.
       Sets API endpoint, API key, and default model, applying defaults if not found.
       """
+      from dotenv import load_dotenv
       load_dotenv(self.config_path)
       self.api_endpoint: str | None = os.environ.get('SOKRATES_API_ENDPOINT', self.DEFAULT_API_ENDPOINT)
       self.api_key: str | None = os.environ.get('SOKRATES_API_KEY', self.DEFAULT_API_KEY)
@@ -111,11 +133,23 @@ class Config:
     Returns:
         None
     """
-    print(f"Creating sokrates home path: {self.home_path}")
+    if self.verbose:
+      print(f"Creating sokrates home path: {self.home_path}")
     Path(self.home_path).mkdir(parents=True, exist_ok=True)
-    print(f"Creating sokrates logs path: {self.logs_path}")
+    if self.verbose:
+      print(f"Creating sokrates logs path: {self.logs_path}")
     Path(self.logs_path).mkdir(parents=True, exist_ok=True)
   
+  # configuration parameter name -> getter on the Config instance
+  _GETTERS = {
+    'api_endpoint': lambda config: config.api_endpoint,
+    'api_key': lambda config: config.api_key,
+    'default_model': lambda config: config.default_model,
+    'default_model_temperature': lambda config: config.default_model_temperature,
+    'database_path': lambda config: config.database_path,
+    'task_queue_daemon_logfile_path': lambda config: config.daemon_logfile_path,
+  }
+
   @staticmethod
   def _get_local_member_value(key):
     """
@@ -133,19 +167,10 @@ class Config:
     Returns:
         The value of the requested configuration parameter, or None if not found.
     """
-    if key == 'api_endpoint':
-      return Config._instance.api_endpoint 
-    if key == 'api_key':
-      return Config._instance.api_endpoint 
-    if key == 'default_model':
-      return Config._instance.default_model
-    if key == 'default_model_temperature':
-      return Config._instance.default_model_temperature
-    if key == 'database_path':
-      return Config._instance.database_path
-    if key == 'task_queue_daemon_logfile_path':
-      return Config._instance.daemon_logfile_path
-    return None
+    getter = Config._GETTERS.get(key)
+    if getter is None or Config._instance is None:
+      return None
+    return getter(Config._instance)
   
   @staticmethod
   def get(key, default_value=None):
@@ -164,7 +189,7 @@ class Config:
         The configuration value for the specified key, or the default_value if not found.
     """
     lval = Config._get_local_member_value(key)
-    if lval:
+    if lval is not None:
       return lval
     return os.environ.get(key, default_value)
   
@@ -188,14 +213,17 @@ class Config:
         return output_directory
     
     # use default if not specified
-    now = datetime.now()
-    home_dir = Path.home()
-    
-    # Format the directory name as 'YYYY-MM-DD_HH-MM'
-    directory_name = now.strftime("%Y-%m-%d_%H-%M")
-    
-    default_task_result_parent_dir = home_dir / ".sokrates" / "tasks" / "results"
-    target_dir = Path(default_task_result_parent_dir) / directory_name
-    Path(target_dir).mkdir(parents=True, exist_ok=True)
+    target_dir = Config._task_execution_directory(int(time.time() // 60))
+    target_dir.mkdir(parents=True, exist_ok=True)
     
     return target_dir
+
+  @staticmethod
+  @functools.lru_cache(maxsize=1)
+  def _task_execution_directory(minute: int) -> Path:
+    """
+    Returns the default task result directory for the given minute since the
+    epoch, named 'YYYY-MM-DD_HH-MM'. Cached, so all tasks started within the
+    same minute share one Path object.
+    """
+    return Config.DEFAULT_TASK_RESULTS_DIRECTORY / f"{datetime.fromtimestamp(minute * 60):%Y-%m-%d_%H-%M}"
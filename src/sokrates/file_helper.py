@@ -24,12 +24,23 @@
 
 import os
 import json
-from typing import List
+import functools
+import mmap
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
 from .colors import Colors
 from datetime import datetime
 import shutil
 from pathlib import Path
 
+# Use orjson for parsing json files if it is available
+try:
+    import orjson
+    ORJSON_ENABLED = True
+except ImportError:
+    ORJSON_ENABLED = False
+
 class FileHelper:
     """
     A utility class providing static methods for various file system operations.
@@ -45,16 +56,36 @@ class FileHelper:
 
     Functions:
         - clean_name(): Sanitize filenames by removing problematic characters
+        - parse_comma_separated_paths(): Parse a comma separated list of paths into unique existing paths
         - list_files_in_directory(): List files in a directory (non-recursive)
+        - deduplicate_files(): Remove paths referring to the same file
         - read_file(): Read content from a single file
         - read_multiple_files(): Read content from multiple files
         - read_multiple_files_from_directories(): Read all files from directories
         - write_to_file(): Write content to a file with directory creation
+        - write_new_file(): Write content to a new file without overwriting existing files
+        - write_many(): Write multiple files in parallel
         - create_new_file(): Create empty files with directory creation
         - generate_postfixed_sub_directory_name(): Generate timestamped directory names
         - combine_files(): Combine multiple files into single string
         - combine_files_in_directories(): Combine all files from directories
     """
+
+    # Minimum number of bytes requested per read call when reading files
+    READ_BUFFER_SIZE = 128 * 1024
+    # Files of at least this size are memory mapped and decoded in place
+    MMAP_MIN_SIZE = 16 * 1024
+    # Upper bound for the number of threads reading files in parallel
+    MAX_READ_WORKERS = 32
+    # Fewer files are read sequentially, the thread pool setup costs more than it saves
+    PARALLEL_READ_MIN_FILES = 4
+    # Fewer files are written sequentially (see write_many())
+    PARALLEL_WRITE_MIN_FILES = 3
+    # Parent directories known to exist, skips makedirs for repeated writes into the
+    # same directory (set.add is atomic, so no lock is needed)
+    _known_directories = set()
+    # Character replacements applied by clean_name() in a single str.translate pass
+    _CLEAN_NAME_TABLE = str.maketrans({'/': '_', ':': '-', '*': '-', '?': None, '"': None})
     
     @staticmethod
     def clean_name(name: str) -> str:
@@ -74,7 +105,37 @@ class FileHelper:
         Side Effects:
             - None (pure function)
         """
-        return name.replace('/', '_').replace(':', '-').replace('*', '-').replace('?', '').replace('"', '')
+        return name.translate(FileHelper._CLEAN_NAME_TABLE)
+
+    @staticmethod
+    def parse_comma_separated_paths(paths: str, verbose: bool = False) -> List[str]:
+        """
+        Parses a comma separated list of file or directory paths (e.g. from a CLI argument).
+
+        Main Functionality:
+            - Splits the string and strips whitespace around each path
+            - Resolves the paths and removes duplicates (keeping the first occurrence)
+            - Drops paths that don't exist with a warning
+
+        Args:
+            paths (str): Comma separated list of paths
+            verbose (bool, optional): If True, prints the parsed paths
+
+        Returns:
+            List[str]: Unique, resolved paths of existing files or directories in input order
+        """
+        if not paths:
+            return []
+        resolved_paths = dict.fromkeys(str(Path(path.strip()).resolve()) for path in paths.split(",") if path.strip())
+        existing_paths = []
+        for path in resolved_paths:
+            if not os.path.exists(path):
+                print(f"{Colors.YELLOW}Warning: Path does not exist and is skipped: {path}{Colors.RESET}")
+                continue
+            existing_paths.append(path)
+        if verbose:
+            print(f"{Colors.CYAN}Parsed paths: {existing_paths}{Colors.RESET}")
+        return existing_paths
 
     @staticmethod
     def list_files_in_directory(directory_path: str, verbose: bool = False) -> List[str]:
@@ -83,32 +144,82 @@ class FileHelper:
 
         Main Functionality:
             - Scans a directory and returns all files (not subdirectories)
-            - Uses os.scandir for efficient file system access
+            - Uses os.scandir for efficient file system access (the file type
+              is taken from the directory entry without an extra stat call)
+            - Returns the paths sorted, so repeated runs build byte-identical prompts
 
         Args:
             directory_path (str): Directory path to scan
             verbose (bool, optional): If True, enables verbose output
 
         Returns:
-            List[str]: List of full file paths found in the directory
+            List[str]: Sorted list of full file paths found in the directory
 
         Side Effects:
             - None (pure function)
         """
-        file_paths = []
-        for file_path in os.scandir(directory_path):
-            if os.path.isfile(file_path.path):
-                file_paths.append(file_path.path)
+        with os.scandir(directory_path) as entries:
+            file_paths = [entry.path for entry in entries if entry.is_file()]
+        file_paths.sort()
         return file_paths
     
+    @staticmethod
+    def list_files_in_directories(directory_paths: List[str], verbose: bool = False) -> List[str]:
+        """
+        Lists the files of multiple directories (non-recursive). Several
+        directories are scanned in parallel using a thread pool.
+
+        Args:
+            directory_paths (List[str]): List of directory paths to scan
+            verbose (bool, optional): If True, enables verbose output
+
+        Returns:
+            List[str]: File paths in directory order, sorted within each directory
+        """
+        if len(directory_paths) <= 1:
+            listings = [FileHelper.list_files_in_directory(directory_path, verbose=verbose) for directory_path in directory_paths]
+        else:
+            with ThreadPoolExecutor(max_workers=min(FileHelper.MAX_READ_WORKERS, len(directory_paths))) as executor:
+                listings = list(executor.map(lambda directory_path: FileHelper.list_files_in_directory(directory_path, verbose=verbose), directory_paths))
+        return [file_path for listing in listings for file_path in listing]
+
+    @staticmethod
+    def deduplicate_files(file_paths: List[str]) -> List[str]:
+        """
+        Removes paths referring to a file that is already in the list, e.g. the
+        same file reached through a symlink or listed under several directories.
+        Files are identified by device and inode.
+
+        Args:
+            file_paths (List[str]): List of file paths
+
+        Returns:
+            List[str]: The file paths in their original order, keeping the first
+                path of each file. Paths that cannot be stat'ed are kept.
+        """
+        seen = set()
+        unique_paths = []
+        for file_path in file_paths:
+            try:
+                file_stat = os.stat(file_path)
+            except OSError:
+                unique_paths.append(file_path)
+                continue
+            key = (file_stat.st_dev, file_stat.st_ino)
+            if key not in seen:
+                seen.add(key)
+                unique_paths.append(file_path)
+        return unique_paths
+
     @staticmethod
     def read_json_file(file_path: str, verbose: bool = False) -> dict:
         """
         Reads and parses a JSON file.
 
         Main Functionality:
-            - Opens and reads a JSON file
+            - Opens and reads a JSON file in binary mode
             - Parses the JSON content into a Python dictionary
+              (with orjson if it is installed, the standard json module otherwise)
 
         Args:
             file_path (str): Path to the JSON file to read
@@ -122,8 +233,9 @@ class FileHelper:
         """
         if verbose:
             print(f"{Colors.CYAN}Loading json file from {file_path} ...{Colors.RESET}")
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        return orjson.loads(data) if ORJSON_ENABLED else json.loads(data)
 
     @staticmethod
     def read_file(file_path: str, verbose: bool = False) -> str:
@@ -131,7 +243,12 @@ class FileHelper:
         Reads and returns the entire content of a specified file.
 
         Main Functionality:
-            - Opens a file and reads its entire content
+            - Reads the entire file with a single os.read call sized by fstat
+              (bypassing the buffered text I/O layer)
+            - Normalizes line endings to '\n' like text mode reading
+            - Caches the content of the 256 most recently read files keyed by
+              path, modification time and size, so repeated reads of an
+              unchanged file only cost a stat call
             - Strips whitespace from the beginning and end of the content
             - Handles file reading errors with appropriate exceptions
 
@@ -148,13 +265,63 @@ class FileHelper:
         try:
             if verbose:
                 print(f"{Colors.CYAN}Loading file from {file_path} ...{Colors.RESET}")
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read().strip()
+            file_stat = os.stat(file_path)
+            return FileHelper._read_file_cached(os.fspath(file_path), file_stat.st_mtime_ns, file_stat.st_size)
         except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {file_path}")
         except IOError as e:
             raise IOError(f"Error reading file {file_path}: {e}")
     
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _read_file_cached(file_path: str, mtime_ns: int, size: int) -> str:
+        """
+        Reads and strips a file. Results are cached per (path, modification time, size),
+        so a changed file is read again.
+        """
+        fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            content = FileHelper._decode_mapped_file(fd) if size >= FileHelper.MMAP_MIN_SIZE else None
+            if content is None:
+                content = FileHelper._read_fd(fd, size).decode('utf-8')
+        finally:
+            os.close(fd)
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        return content.strip()
+
+    @staticmethod
+    def _read_fd(fd: int, size: int) -> bytes:
+        """
+        Reads a file descriptor until EOF with as few os.read calls as possible.
+        """
+        read_size = max(size, FileHelper.READ_BUFFER_SIZE)
+        chunks = []
+        # loop until EOF, the file might have grown since it was stat'ed;
+        # a short read of a regular file means EOF, which saves the final empty read
+        while True:
+            chunk = os.read(fd, read_size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            if len(chunk) < read_size:
+                break
+        return b"".join(chunks)
+
+    @staticmethod
+    def _decode_mapped_file(fd: int) -> str:
+        """
+        Decodes a file via a read-only memory mapping, which saves copying the
+        content into an intermediate bytes object. Returns None if the file
+        can't be mapped (e.g. it was truncated to zero bytes since it was stat'ed).
+        """
+        try:
+            mapped = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            return None
+        with mapped:
+            return str(mapped, 'utf-8')
+
     @staticmethod
     def read_multiple_files(file_paths: List[str], verbose: bool = False) -> List[str]:
         """
@@ -175,10 +342,7 @@ class FileHelper:
         Side Effects:
             - None (pure function)
         """
-        contents = []
-        for file_path in file_paths:
-            contents.append(FileHelper.read_file(file_path, verbose=verbose))
-        return contents
+        return FileHelper.read_paths_parallel(file_paths, verbose=verbose)
     
     @staticmethod
     def read_multiple_files_from_directories(directory_paths: List[str], verbose: bool = False) -> List[str]:
@@ -187,8 +351,8 @@ class FileHelper:
 
         Main Functionality:
             - Scans multiple directories and reads all files within them
-            - Combines content from all files into a single list
-            - Uses the list_files_in_directory and read_multiple_files methods
+            - Reads the files in parallel using a thread pool
+            - Combines content from all files into a single list (in directory and file name order)
 
         Args:
             directory_paths (List[str]): List of directory paths to scan
@@ -200,13 +364,28 @@ class FileHelper:
         Side Effects:
             - None (pure function)
         """
-        contents=[]
-        for directory_path in directory_paths:
-            file_list = FileHelper.list_files_in_directory(directory_path, verbose=verbose)
-            file_contents = FileHelper.read_multiple_files(file_list, verbose=verbose)
-            for fc in file_contents:
-                contents.append(fc)
-        return contents
+        file_list = FileHelper.list_files_in_directories(directory_paths, verbose=verbose)
+        return FileHelper.read_paths_parallel(file_list, verbose=verbose)
+
+    @staticmethod
+    def read_paths_parallel(file_paths: List[str], verbose: bool = False, max_workers: int = MAX_READ_WORKERS) -> List[str]:
+        """
+        Reads multiple files in parallel using a thread pool, so the latencies
+        of the individual reads (e.g. on network filesystems) overlap.
+
+        Args:
+            file_paths (List[str]): List of file paths to read
+            verbose (bool, optional): If True, enables verbose output
+            max_workers (int, optional): Maximum number of concurrent reads
+
+        Returns:
+            List[str]: List of file contents in the order of file_paths
+        """
+        if len(file_paths) < FileHelper.PARALLEL_READ_MIN_FILES:
+            return [FileHelper.read_file(file_path, verbose=verbose) for file_path in file_paths]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(file_paths))) as executor:
+            return list(executor.map(lambda file_path: FileHelper.read_file(file_path, verbose=verbose), file_paths))
 
     @staticmethod
     def write_to_file(file_path: str, content: str, verbose: bool = False) -> None:
@@ -215,7 +394,8 @@ class FileHelper:
 
         Main Functionality:
             - Creates parent directories if they don't exist
-            - Writes content to the specified file
+            - Writes the utf-8 encoded content with os.write calls (usually a single one),
+              bypassing the buffered text I/O layer
             - Handles directory creation and file writing errors
 
         Args:
@@ -231,11 +411,8 @@ class FileHelper:
             - Writes content to the specified file
         """
         try:
-            dirname = os.path.dirname(file_path)
-            if dirname:
-                os.makedirs(dirname, exist_ok=True)
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            fd = FileHelper._open_with_parent_directories(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0))
+            FileHelper._write_fd(fd, content)
 
             if verbose:
                 print(f"{Colors.GREEN}Content successfully written to {file_path}{Colors.RESET}")
@@ -243,12 +420,119 @@ class FileHelper:
             raise IOError(f"Error writing to file {file_path}: {e}")
 
     @staticmethod
-    def copy_file(source_filepath, target_filepath, verbose:bool = False):
+    def write_new_file(file_path: str, content: str, verbose: bool = False) -> str:
+        """
+        Writes content to a new file without overwriting existing files.
+
+        Main Functionality:
+            - Creates the file exclusively (O_CREAT | O_EXCL), so concurrent writers
+              never overwrite each other's files
+            - If the file exists, falls back to the timestamp postfixed file path
+              (see generate_postfixed_file_path()) and then to numbered variants of it
+            - Creates parent directories if they don't exist
+
+        Args:
+            file_path (str): Preferred destination file path
+            content (str): Content to write
+            verbose (bool, optional): If True, prints success message
+
+        Returns:
+            str: The path of the file that was written
+
+        Side Effects:
+            - Creates parent directories if they don't exist
+            - Creates a new file
+        """
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+        candidate = file_path
+        attempt = 0
+        try:
+            while True:
+                try:
+                    fd = FileHelper._open_with_parent_directories(candidate, flags)
+                    break
+                except FileExistsError:
+                    attempt += 1
+                    postfixed_path = FileHelper.generate_postfixed_file_path(os.fspath(file_path))
+                    if attempt > 1:
+                        root, extension = os.path.splitext(postfixed_path)
+                        postfixed_path = f"{root}_{attempt}{extension}"
+                    candidate = postfixed_path
+            FileHelper._write_fd(fd, content)
+
+            if verbose:
+                print(f"{Colors.GREEN}Content successfully written to {candidate}{Colors.RESET}")
+            return candidate
+        except IOError as e:
+            raise IOError(f"Error writing to file {candidate}: {e}")
+
+    @staticmethod
+    def _write_fd(fd: int, content: str) -> None:
+        """
+        Writes the utf-8 encoded content to a file descriptor and closes it.
+        """
+        try:
+            data = memoryview(content.encode('utf-8'))
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def write_many(items: List[Tuple[str, str]], verbose: bool = False, max_workers: int = MAX_READ_WORKERS) -> None:
+        """
+        Writes multiple files in parallel using a thread pool, so the open, write
+        and close calls of the individual files overlap. Up to two files are
+        written sequentially.
+
+        Args:
+            items (List[Tuple[str, str]]): (file path, content) pairs to write
+            verbose (bool, optional): If True, prints success messages
+            max_workers (int, optional): Maximum number of concurrent writes
+
+        Returns:
+            None
+
+        Side Effects:
+            - Creates parent directories if they don't exist
+            - Writes the contents to the specified files
+        """
+        if len(items) < FileHelper.PARALLEL_WRITE_MIN_FILES:
+            for file_path, content in items:
+                FileHelper.write_to_file(file_path, content, verbose=verbose)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            # consume the results, so the first failed write raises here
+            list(executor.map(lambda item: FileHelper.write_to_file(item[0], item[1], verbose=verbose), items))
+
+    @staticmethod
+    def _open_with_parent_directories(file_path: str, flags: int) -> int:
+        """
+        Opens a file descriptor with os.open, creating missing parent directories.
+        makedirs is only called once per directory; if a remembered directory
+        was removed in the meantime, it is created again.
+        """
+        dirname = os.path.dirname(file_path)
+        if dirname and dirname not in FileHelper._known_directories:
+            os.makedirs(dirname, exist_ok=True)
+            FileHelper._known_directories.add(dirname)
+        try:
+            return os.open(file_path, flags, 0o666)
+        except FileNotFoundError:
+            if not dirname:
+                raise
+            os.makedirs(dirname, exist_ok=True)
+            return os.open(file_path, flags, 0o666)
+
+    @staticmethod
+    def copy_file(source_filepath, target_filepath, verbose:bool = False, preserve_metadata: bool = False):
         """
         Copies a file from source to target path.
 
         Main Functionality:
-            - Uses shutil.copy2 to copy a file with metadata preservation
+            - Uses shutil.copyfile, which copies in-kernel (sendfile) on Linux,
+              or shutil.copy2 if the metadata should be preserved as well
             - Creates parent directories as needed for the target path
             - Handles various error conditions with appropriate messages
 
@@ -256,13 +540,14 @@ class FileHelper:
             source_filepath (str): Path to the source file to copy
             target_filepath (str): Destination path for the copied file
             verbose (bool, optional): If True, prints success/failure messages
+            preserve_metadata (bool, optional): If True, also copies permissions and timestamps
 
         Returns:
             None
 
         Side Effects:
             - Creates parent directories for target path if needed
-            - Copies file content and metadata from source to destination
+            - Copies file content (and optionally metadata) from source to destination
 
         Raises:
             FileNotFoundError: If the source file doesn't exist
@@ -273,7 +558,10 @@ class FileHelper:
             FileHelper.copy_file('/path/to/source.txt', '/path/to/target.txt')
         """
         try:
-            shutil.copy2(source_filepath, target_filepath, follow_symlinks=True)
+            if preserve_metadata:
+                shutil.copy2(source_filepath, target_filepath, follow_symlinks=True)
+            else:
+                shutil.copyfile(source_filepath, target_filepath, follow_symlinks=True)
             if verbose:
                 print(f"{Colors.GREEN}File copied successfully from {source_filepath} to {target_filepath}{Colors.RESET}")
         
@@ -299,11 +587,7 @@ class FileHelper:
             IOError: For creation errors
         """
         try:
-            dirname = os.path.dirname(file_path)
-            if dirname:
-                os.makedirs(dirname, exist_ok=True)
-            with open(file_path, 'a', encoding='utf-8') as f:
-                f.write("")
+            os.close(FileHelper._open_with_parent_directories(file_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND))
             if verbose:
                 print(f"{Colors.GREEN}File successfully created at {file_path}{Colors.RESET}")
         except IOError as e:
@@ -320,9 +604,7 @@ class FileHelper:
         Returns:
             str: Directory path with YYYY-MM-DD_HH-MM postfix
         """
-        current_datetime = datetime.now()
-        formatted_datetime = current_datetime.strftime("%Y-%m-%d_%H-%M")
-        return f"{base_directory}/{formatted_datetime}"
+        return f"{base_directory}/{FileHelper._minute_timestamp(int(time.time() // 60))}"
     
     @staticmethod
     def generate_postfixed_file_path(file_path: str) -> str:
@@ -334,12 +616,17 @@ class FileHelper:
         Returns:
             str: file path with YYYY-MM-DD_HH-MM.EXTENSION postfix
         """
-        current_datetime = datetime.now()
-        formatted_datetime = current_datetime.strftime("%Y-%m-%d_%H-%M")
-        path = Path(file_path)
-        full_path_without_extension = path.with_suffix("")
-        file_extension = path.suffix
-        return str(Path(f"{full_path_without_extension}_{formatted_datetime}.{file_extension}"))
+        root, extension = os.path.splitext(file_path)
+        return f"{root}_{FileHelper._minute_timestamp(int(time.time() // 60))}{extension}"
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _minute_timestamp(minute: int) -> str:
+        """
+        Formats the given minute since the epoch as local YYYY-MM-DD_HH-MM,
+        cached so all files and directories postfixed within a minute share one string.
+        """
+        return datetime.fromtimestamp(minute * 60).strftime("%Y-%m-%d_%H-%M")
     
     @staticmethod
     def combine_files(file_paths: List[str], verbose: bool = False) -> str:
@@ -359,15 +646,14 @@ class FileHelper:
         if file_paths is None:
             raise Exception("No files provided")
         
-        combined_content = ""
-        for file_path in file_paths:
-            combined_content = f"{combined_content}\n---\n{FileHelper.read_file(file_path, verbose=verbose)}"
-        return combined_content
+        contents = FileHelper.read_paths_parallel(file_paths, verbose=verbose)
+        return "".join(f"\n---\n{content}" for content in contents)
     
     @staticmethod
     def combine_files_in_directories(directory_paths: List[str], verbose: bool = False) -> str:
         """
         Combines all files from directories into single string with '---' separators.
+        Files found in several directories (e.g. through symlinks) are only included once.
 
         Args:
             directory_paths (List[str]): List of directories to scan
@@ -382,7 +668,5 @@ class FileHelper:
         if directory_paths is None:
             raise Exception("No directory_paths provided")
         
-        file_list=[]
-        for directory_path in directory_paths:
-            file_list += FileHelper.list_files_in_directory(directory_path, verbose=verbose)
+        file_list = FileHelper.deduplicate_files(FileHelper.list_files_in_directories(directory_paths, verbose=verbose))
         return FileHelper.combine_files(file_list, verbose=verbose)
@@ -5,7 +5,6 @@
 # and managing the output. This workflow is designed to automate and enhance
 # the prompt engineering process.
 
-from pathlib import Path
 from .llm_api import LLMApi
 from .prompt_refiner import PromptRefiner
 from .colors import Colors
@@ -70,26 +69,26 @@ class IdeaGenerationWorkflow:
         
         self.api_endpoint = api_endpoint
         self.api_key = api_key
-        self.llm_api = LLMApi(api_endpoint=api_endpoint,
-                               api_key=api_key,
-                               verbose=verbose)
+        self.llm_api = LLMApi.get_shared(api_endpoint=api_endpoint,
+                                          api_key=api_key,
+                                          verbose=verbose)
         self.prompt_refiner = PromptRefiner(verbose=verbose)
         self.topic = topic
         self.topic_input_file = topic_input_file
         
-        topic_generation_instructions_file = str(Path(f"{Config.DEFAULT_PROMPTS_DIRECTORY}/{self.DEFAULT_TOPIC_GENERATOR_PATH}").resolve())
+        topic_generation_instructions_file = str(Config.DEFAULT_PROMPTS_DIRECTORY / self.DEFAULT_TOPIC_GENERATOR_PATH)
         OutputPrinter.print_info(f"No topic_generator_file, topic_input_file or topic specified. Using the default topic generation instructions in {topic_generation_instructions_file}", Colors.BRIGHT_MAGENTA)
         self.topic_generator_file = topic_generation_instructions_file
         
         self.refinement_prompt_file = refinement_prompt_file
         if self.refinement_prompt_file is None:
-            full_refinement_filepath = str(Path(f"{Config.DEFAULT_PROMPTS_DIRECTORY}/{self.DEFAULT_REFINEMENT_PATH}").resolve())
+            full_refinement_filepath = str(Config.DEFAULT_PROMPTS_DIRECTORY / self.DEFAULT_REFINEMENT_PATH)
             OutputPrinter.print_info(f"No refinement_prompt_file specified. Using the default refinement prompt instructions in {full_refinement_filepath}", Colors.BRIGHT_MAGENTA)
             self.refinement_prompt_file = full_refinement_filepath
         
         self.prompt_generator_file = prompt_generator_file
         if self.prompt_generator_file is None:
-            full_pg_filepath = str(Path(f"{Config.DEFAULT_PROMPTS_DIRECTORY}/{self.DEFAULT_PROMPT_GENERATOR_PATH}").resolve())
+            full_pg_filepath = str(Config.DEFAULT_PROMPTS_DIRECTORY / self.DEFAULT_PROMPT_GENERATOR_PATH)
             OutputPrinter.print_info(f"No prompt_generator_file specified. Using the default prompt generator instructions in {full_pg_filepath}", Colors.BRIGHT_MAGENTA)
             self.prompt_generator_file = full_pg_filepath
         
@@ -116,7 +115,7 @@ class IdeaGenerationWorkflow:
         Returns:
             list: A list of randomly selected topic categories.
         """
-        topic_categories_json_path = str(Path(f"{Config.DEFAULT_PROMPTS_DIRECTORY}/context/topic_categories.json").resolve())
+        topic_categories_json_path = str(Config.DEFAULT_PROMPTS_DIRECTORY / "context/topic_categories.json")
         categories_object = FileHelper.read_json_file(topic_categories_json_path, self.verbose)
         all_categories = categories_object["topic_categories"]
         number_of_categories_to_pick = Utils.generate_random_int(min_value=1, max_value=self.MAXIMUM_CATEGORIES_TO_PICK)
@@ -4,22 +4,64 @@
 # for text generation, and managing chat completions, including streaming
 # responses and performance metrics.
 
+import atexit
+import contextlib
+import hashlib
+import importlib.util
+import json
 import logging
 import sys
+import threading
 import time
-from typing import List
+import weakref
+from typing import Iterator, List
 import requests
 
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI, DefaultHttpxClient, DefaultAsyncHttpxClient, Timeout, DEFAULT_CONNECTION_LIMITS
 from .colors import Colors
 from .config import Config
+from .response_cache import ResponseCache, cached_response
+
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]")
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+# connection pool and timeouts of the shared clients (reads wait for long generations)
+HTTP_CONNECTION_LIMITS = type(DEFAULT_CONNECTION_LIMITS)(max_connections=100, max_keepalive_connections=50)
+HTTP_TIMEOUT = Timeout(connect=5.0, read=300.0, write=60.0, pool=5.0)
+
+# OpenAI clients shared by all LLMApi instances, keyed by endpoint and api key
+_shared_clients = {}
+_shared_clients_lock = threading.Lock()
+
+def _close_shared_clients() -> None:
+    with _shared_clients_lock:
+        for client in _shared_clients.values():
+            client.close()
+        _shared_clients.clear()
+
+atexit.register(_close_shared_clients)
+
+# per thread switch for echoing streamed tokens to stdout (see LLMApi.stream_echo())
+_stream_echo = threading.local()
 
 class LLMApi:
     """
     Handles interactions with OpenAI-compatible LLM APIs.
     Provides methods for model listing, text generation, and chat completions.
+
+    The HTTP connection pool is shared by all requests of all instances
+    using the same endpoint and api key. It is closed by close(), when
+    leaving a `with` block or at interpreter exit.
     """
-    def __init__(self, verbose: bool = False, api_endpoint: str = Config.DEFAULT_API_ENDPOINT, api_key: str = Config.DEFAULT_API_KEY):
+
+    # prompt of follow-up turns without an own prompt in conversation pipelines
+    CONVERSATION_FOLLOW_UP_PROMPT = "Now execute the prompt from your previous response. Respond with the result only."
+
+    # instances handed out by get_shared(), alive as long as someone uses them
+    _shared_instances = weakref.WeakValueDictionary()
+    _shared_instances_lock = threading.Lock()
+    def __init__(self, verbose: bool = False, api_endpoint: str = Config.DEFAULT_API_ENDPOINT, api_key: str = Config.DEFAULT_API_KEY,
+                 response_cache: ResponseCache = None):
         """
         Initializes the LLMApi client.
 
@@ -27,27 +69,138 @@ class LLMApi:
             verbose (bool): If True, enables verbose output for API interactions.
             api_endpoint (str): The URL of the LLM API endpoint. Defaults to Config.DEFAULT_API_ENDPOINT.
             api_key (str): The API key for authentication. Defaults to Config.DEFAULT_API_KEY.
+            response_cache (ResponseCache, optional): If set, responses of `send` and `send_async` are served from
+                and stored in this on-disk cache. Defaults to None (no caching).
         """
         logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
         self.verbose = verbose
         self.api_endpoint = api_endpoint
         self.api_key = api_key
+        self.response_cache = response_cache
+        self._client_key = hashlib.sha256(f"{api_endpoint}|{api_key}".encode("utf-8")).hexdigest()
+        self._async_client = None
         
+    @classmethod
+    def get_shared(cls, api_endpoint: str = Config.DEFAULT_API_ENDPOINT, api_key: str = Config.DEFAULT_API_KEY,
+                   verbose: bool = False, response_cache: ResponseCache = None) -> "LLMApi":
+        """
+        Returns an LLMApi instance shared by all callers with the same settings,
+        e.g. workflows chained within one command. The instance lives as long
+        as it is referenced.
+
+        Args:
+            api_endpoint (str): The URL of the LLM API endpoint. Defaults to Config.DEFAULT_API_ENDPOINT.
+            api_key (str): The API key for authentication. Defaults to Config.DEFAULT_API_KEY.
+            verbose (bool): If True, enables verbose output for API interactions.
+            response_cache (ResponseCache, optional): The response cache of the instance. Defaults to None.
+
+        Returns:
+            LLMApi: The shared instance.
+        """
+        # the instance references its cache, so the cache id is unique while the instance lives
+        key = (api_endpoint, api_key, verbose, id(response_cache))
+        with cls._shared_instances_lock:
+            instance = cls._shared_instances.get(key)
+            if instance is None:
+                instance = cls(api_endpoint=api_endpoint, api_key=api_key, verbose=verbose, response_cache=response_cache)
+                cls._shared_instances[key] = instance
+            return instance
+
+    @staticmethod
+    @contextlib.contextmanager
+    def stream_echo(enabled: bool):
+        """
+        Enables or disables echoing streamed responses to stdout for requests
+        made by the current thread within the `with` block. Requests running
+        concurrently in several threads disable it, as their tokens would
+        interleave on stdout.
+
+        Args:
+            enabled (bool): If False, `send` and `chat_completion` only return the response.
+        """
+        previous = getattr(_stream_echo, "enabled", True)
+        _stream_echo.enabled = enabled
+        try:
+            yield
+        finally:
+            _stream_echo.enabled = previous
+
+    @staticmethod
+    def stream_echo_enabled() -> bool:
+        """
+        Returns:
+            bool: Whether streamed responses are echoed to stdout in the current thread (see stream_echo()).
+        """
+        return getattr(_stream_echo, "enabled", True)
+
     def get_openai_client(self) -> OpenAI:
         """
-        Creates and returns an OpenAI client instance configured with the
-        specified API endpoint and key.
+        Returns the OpenAI client instance configured with the specified API
+        endpoint and key. The client is created on first use and shared by
+        all instances with the same endpoint and key, so the underlying HTTP
+        connections are kept alive between requests and models. The client
+        is safe to share between threads. HTTP/2 is used if the h2 package
+        is installed.
 
         Returns:
             OpenAI: An initialized OpenAI client object.
         """
-        if self.verbose:
-            print(f"{Colors.BLUE}{Colors.BOLD}Initializing openai client for endpoint {self.api_endpoint}...{Colors.RESET}")
-        
-        return OpenAI(
-            base_url=self.api_endpoint,
-            api_key=self.api_key
-        )
+        with _shared_clients_lock:
+            client = _shared_clients.get(self._client_key)
+            if client is None:
+                if self.verbose:
+                    print(f"{Colors.BLUE}{Colors.BOLD}Initializing openai client for endpoint {self.api_endpoint}...{Colors.RESET}")
+                client = OpenAI(
+                    base_url=self.api_endpoint,
+                    api_key=self.api_key,
+                    http_client=DefaultHttpxClient(http2=HTTP2_ENABLED, limits=HTTP_CONNECTION_LIMITS, timeout=HTTP_TIMEOUT)
+                )
+                _shared_clients[self._client_key] = client
+            return client
+
+    def close(self) -> None:
+        """
+        Closes the HTTP connection pool of this endpoint and api key. A new
+        client is created on the next request.
+        """
+        with _shared_clients_lock:
+            client = _shared_clients.pop(self._client_key, None)
+        if client is not None:
+            client.close()
+
+    def get_async_openai_client(self) -> AsyncOpenAI:
+        """
+        Returns the AsyncOpenAI client instance used by send_async. Like the
+        synchronous client it is created on first use and reused afterwards.
+        The client is bound to the event loop it is first used in, so it
+        should be closed via aclose() before that loop finishes.
+
+        Returns:
+            AsyncOpenAI: An initialized AsyncOpenAI client object.
+        """
+        if self._async_client is None:
+            if self.verbose:
+                print(f"{Colors.BLUE}{Colors.BOLD}Initializing async openai client for endpoint {self.api_endpoint}...{Colors.RESET}")
+            self._async_client = AsyncOpenAI(
+                base_url=self.api_endpoint,
+                api_key=self.api_key,
+                http_client=DefaultAsyncHttpxClient(http2=HTTP2_ENABLED, limits=HTTP_CONNECTION_LIMITS, timeout=HTTP_TIMEOUT)
+            )
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """
+        Closes the HTTP connection pool of the async client.
+        """
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def list_models(self) -> List[str]:
         """
@@ -72,7 +225,8 @@ class LLMApi:
             print(f"{Colors.RED}{Colors.BOLD}Error listing models: {str(e)}{Colors.RESET}")
             raise(e)
 
-    def send(self, prompt: str, model: str = Config.DEFAULT_MODEL, context: str = None, context_array: List[str] = None, max_tokens: int = 2000, temperature: float = 0.7) -> str:
+    @cached_response
+    def send(self, prompt: str, model: str = Config.DEFAULT_MODEL, context: str = None, context_array: List[str] = None, max_tokens: int = 2000, temperature: float = 0.7, system_prompt: str = None) -> str:
         """
         Sends a text prompt to the LLM server for generation and returns the response.
         Context can be provided as a single string or a list of strings, which will be
@@ -89,6 +243,11 @@ class LLMApi:
             temperature (float): Controls the randomness of the output. Higher values (e.g., 0.8)
                                  make the output more random, while lower values (e.g., 0.2)
                                  make it more focused and deterministic. Defaults to 0.7.
+            system_prompt (str, optional): Static instructions sent as a system message
+                                           before the prompt. Keeping static instructions in
+                                           the system message gives consecutive requests a
+                                           shared prefix for server-side prompt caching.
+                                           Defaults to None.
 
         Returns:
             str: The generated content from the LLM.
@@ -120,12 +279,7 @@ class LLMApi:
 
             stream = client.chat.completions.create(
                 model=model,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
+                messages=self._build_messages(prompt, system_prompt),
                 max_tokens=max_tokens,
                 temperature=temperature,
                 stream=True
@@ -138,16 +292,20 @@ class LLMApi:
             print(f"{Colors.GREEN}{Colors.BOLD}Streaming generation ...{Colors.RESET}")
             print()
             print(f"{Colors.GREEN}{'-'*30}{Colors.RESET}")
-            response_content = ""
+            response_chunks = []
+            echo = self.stream_echo_enabled()
             for chunk in stream:
                 content = chunk.choices[0].delta.content
                 if content:
                     if first_token_time is None:
                         first_token_time = time.time()
-                    print(content, end="", flush=True)
-                    response_content += content
+                    if echo:
+                        sys.stdout.write(content)
+                        sys.stdout.flush()
+                    response_chunks.append(content)
 
             end_time = time.time()
+            response_content = "".join(response_chunks)
             if self.verbose:
                 print(f"{Colors.GREEN}{'-'*30}{Colors.RESET}")
 
@@ -172,6 +330,214 @@ class LLMApi:
         except Exception as e:
             raise Exception(f"{Colors.RED}{Colors.BOLD}Error calling LLM API at {self.api_endpoint}: {e}{Colors.RESET}")
 
+    @cached_response
+    async def send_async(self, prompt: str, model: str = Config.DEFAULT_MODEL, context: str = None, context_array: List[str] = None, max_tokens: int = 2000, temperature: float = 0.7, system_prompt: str = None) -> str:
+        """
+        Asynchronous variant of `send`, so requests to several models can run
+        concurrently (e.g. via asyncio.gather).
+
+        The response is not streamed to stdout, as the output of concurrent
+        requests would interleave. Responses are served from and stored in the
+        `response_cache` with the same keys as `send` (see cached_response).
+
+        Args:
+            prompt (str): The main text prompt to send to the LLM.
+            model (str): The name of the model to use for generation. Defaults to Config.DEFAULT_MODEL.
+            context (str, optional): A single string of context to prepend to the prompt.
+                                     Defaults to None.
+            context_array (List[str], optional): A list of context text fragments to prepend.
+                                                 Defaults to None.
+            max_tokens (int): The maximum number of tokens to generate in the response. Defaults to 2000.
+            temperature (float): Controls the randomness of the output. Defaults to 0.7.
+            system_prompt (str, optional): Static instructions sent as a system message
+                                           before the prompt. Defaults to None.
+
+        Returns:
+            str: The generated content from the LLM.
+
+        Raises:
+            Exception: If the API call to the LLM server fails.
+        """
+        print(f"{Colors.CYAN}{Colors.BOLD}Generating with model {model} ...{Colors.RESET}", file=sys.stderr)
+        if context_array:
+            prompt = f"{self.combine_context(context_array)}\n{prompt}"
+        if context:
+            prompt = f"{self.combine_context([context])}\n{prompt}"
+
+        try:
+            client = self.get_async_openai_client()
+            start_time = time.time()
+            completion = await client.chat.completions.create(
+                model=model,
+                messages=self._build_messages(prompt, system_prompt),
+                max_tokens=max_tokens,
+                temperature=temperature
+            )
+            response_content = completion.choices[0].message.content or ""
+        except Exception as e:
+            raise Exception(f"{Colors.RED}{Colors.BOLD}Error calling LLM API at {self.api_endpoint}: {e}{Colors.RESET}")
+
+        print(f"{Colors.CYAN}{Colors.BOLD}Done generating using model {model} ({time.time() - start_time:.4f}s){Colors.RESET}", file=sys.stderr)
+        return response_content
+
+    def send_stream(self, prompt: str, model: str = Config.DEFAULT_MODEL, context: str = None, context_array: List[str] = None, max_tokens: int = 2000, temperature: float = 0.7, system_prompt: str = None) -> Iterator[str]:
+        """
+        Sends a text prompt to the LLM server and yields the response while it
+        is generated, so callers can show or process it before the generation
+        is complete. Unlike `send`, nothing is printed to stdout.
+
+        Responses are served from and stored in the `response_cache` with the
+        same keys as `send`; a cached response is yielded as a single piece.
+
+        Args:
+            prompt (str): The main text prompt to send to the LLM.
+            model (str): The name of the model to use for generation. Defaults to Config.DEFAULT_MODEL.
+            context (str, optional): A single string of context to prepend to the prompt.
+                                     Defaults to None.
+            context_array (List[str], optional): A list of context text fragments to prepend.
+                                                 Defaults to None.
+            max_tokens (int): The maximum number of tokens to generate in the response. Defaults to 2000.
+            temperature (float): Controls the randomness of the output. Defaults to 0.7.
+            system_prompt (str, optional): Static instructions sent as a system message
+                                           before the prompt. Defaults to None.
+
+        Yields:
+            str: The content pieces of the response in the order they are generated.
+
+        Raises:
+            Exception: If the API call to the LLM server fails.
+        """
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = ResponseCache.request_key(model, temperature, max_tokens, context, context_array, prompt, system_prompt)
+            response = self.response_cache.get(cache_key)
+            if response is not None:
+                print(f"{Colors.CYAN}{Colors.BOLD}Using cached response for model {model}{Colors.RESET}", file=sys.stderr)
+                yield response
+                return
+
+        print(f"{Colors.CYAN}{Colors.BOLD}Generating with model {model} ...{Colors.RESET}", file=sys.stderr)
+        if context_array:
+            prompt = f"{self.combine_context(context_array)}\n{prompt}"
+        if context:
+            prompt = f"{self.combine_context([context])}\n{prompt}"
+
+        try:
+            stream = self.get_openai_client().chat.completions.create(
+                model=model,
+                messages=self._build_messages(prompt, system_prompt),
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stream=True
+            )
+            response_chunks = []
+            for chunk in stream:
+                content = chunk.choices[0].delta.content
+                if content:
+                    response_chunks.append(content)
+                    yield content
+        except Exception as e:
+            raise Exception(f"{Colors.RED}{Colors.BOLD}Error calling LLM API at {self.api_endpoint}: {e}{Colors.RESET}")
+
+        if self.response_cache is not None:
+            self.response_cache.set(cache_key, "".join(response_chunks), model=model)
+
+    def send_pipeline(self, stages: List[dict], conversation: bool = False) -> List[str]:
+        """
+        Sends a chain of dependent prompts, where each stage consumes the output
+        of the previous stage. All stages are sent over the same client
+        connection, so no connection setup happens between the dependent requests.
+
+        Each stage is a dictionary with the keyword arguments of `send`
+        (prompt, model, context, context_array, max_tokens, temperature) and an
+        optional 'post_process' callable, which is applied to the response of
+        the stage. Stages without a prompt receive the (post processed) output
+        of the previous stage as their prompt.
+
+        If conversation is True and all stages use the same model, the stages
+        are sent as consecutive turns of a single conversation instead: every
+        request starts with the previous turns, so servers with prefix caching
+        (LM Studio, llama.cpp, vLLM) reuse their KV cache instead of processing
+        the earlier prompts again. Stages without a prompt then ask the model
+        to execute the prompt from its previous answer.
+
+        Args:
+            stages (List[dict]): The ordered pipeline stages.
+            conversation (bool): Send stages of the same model as one conversation. Defaults to False.
+
+        Returns:
+            List[str]: The (post processed) output of each stage.
+
+        Raises:
+            ValueError: If the first stage does not provide a prompt.
+            Exception: If the API call to the LLM server fails.
+        """
+        if conversation and len({stage.get('model', Config.DEFAULT_MODEL) for stage in stages}) == 1:
+            return self._send_conversation_pipeline(stages)
+
+        outputs = []
+        previous_output = None
+        for stage in stages:
+            stage = dict(stage)
+            post_process = stage.pop('post_process', None)
+            if stage.get('prompt') is None:
+                if previous_output is None:
+                    raise ValueError("The first pipeline stage requires a prompt")
+                stage['prompt'] = previous_output
+            response = self.send(**stage)
+            if post_process:
+                response = post_process(response)
+            outputs.append(response)
+            previous_output = response
+        return outputs
+
+    def _send_conversation_pipeline(self, stages: List[dict]) -> List[str]:
+        """
+        Sends the pipeline stages as consecutive turns of one conversation (see send_pipeline).
+
+        Args:
+            stages (List[dict]): The ordered pipeline stages (all using the same model).
+
+        Returns:
+            List[str]: The (post processed) output of each stage.
+        """
+        messages = []
+        outputs = []
+        for stage in stages:
+            prompt = stage.get('prompt')
+            if prompt is None:
+                if not messages:
+                    raise ValueError("The first pipeline stage requires a prompt")
+                prompt = self.CONVERSATION_FOLLOW_UP_PROMPT
+            if stage.get('context_array'):
+                prompt = f"{self.combine_context(stage['context_array'])}\n{prompt}"
+            if stage.get('context'):
+                prompt = f"{self.combine_context([stage['context']])}\n{prompt}"
+            messages.append({"role": "user", "content": prompt})
+
+            model = stage.get('model', Config.DEFAULT_MODEL)
+            max_tokens = stage.get('max_tokens', 2000)
+            temperature = stage.get('temperature', 0.7)
+            cache_key = None
+            response = None
+            if self.response_cache is not None:
+                cache_key = ResponseCache.cache_key(model, temperature, max_tokens, json.dumps(messages))
+                response = self.response_cache.get(cache_key)
+                if response is not None:
+                    print(f"{Colors.CYAN}{Colors.BOLD}Using cached response for model {model}{Colors.RESET}", file=sys.stderr)
+                    if self.stream_echo_enabled():
+                        print(response)
+            if response is None:
+                response = self.chat_completion(list(messages), model=model, max_tokens=max_tokens, temperature=temperature)
+                if cache_key is not None:
+                    self.response_cache.set(cache_key, response, model=model)
+
+            # the raw response is kept in the history, so the next request shares the cached prefix
+            messages.append({"role": "assistant", "content": response})
+            post_process = stage.get('post_process')
+            outputs.append(post_process(response) if post_process else response)
+        return outputs
+
     def chat_completion(self, messages: List[dict], model: str = Config.DEFAULT_MODEL, max_tokens: int = 2000, temperature: float = 0.7) -> str:
         """
         Sends a list of messages (conversation history) to the LLM server for chat completion.
@@ -221,16 +587,20 @@ class LLMApi:
             print(f"{Colors.GREEN}{Colors.BOLD}Streaming generation ...{Colors.RESET}")
             print()
             print(f"{Colors.GREEN}{'-'*30}{Colors.RESET}")
-            response_content = ""
+            response_chunks = []
+            echo = self.stream_echo_enabled()
             for chunk in stream:
                 content = chunk.choices[0].delta.content
                 if content:
                     if first_token_time is None:
                         first_token_time = time.time()
-                    print(content, end="", flush=True)
-                    response_content += content
+                    if echo:
+                        sys.stdout.write(content)
+                        sys.stdout.flush()
+                    response_chunks.append(content)
 
             end_time = time.time()
+            response_content = "".join(response_chunks)
             if self.verbose:
                 print(f"{Colors.GREEN}{'-'*30}{Colors.RESET}")
 
@@ -254,6 +624,16 @@ class LLMApi:
         except Exception as e:
             raise Exception(f"{Colors.RED}{Colors.BOLD}Error calling LLM API at {self.api_endpoint}: {e}{Colors.RESET}")
 
+    @staticmethod
+    def _build_messages(prompt: str, system_prompt: str = None) -> List[dict]:
+        """
+        Builds the messages of a single prompt request, with the optional
+        system prompt first.
+        """
+        messages = [{"role": "system", "content": system_prompt}] if system_prompt else []
+        messages.append({"role": "user", "content": prompt})
+        return messages
+
     def combine_context(self, context: List[str]) -> str:
         """
         Combines a list of context strings into a single string,
@@ -265,8 +645,4 @@ class LLMApi:
         Returns:
             str: A single string containing the combined context.
         """
-        combined_content = ""
-        for context_part in context:
-            combined_content = f"{combined_content}\n---\n{context_part}"
-        combined_content = f"{combined_content}\n ---"
-        return combined_content
\ No newline at end of file
+        return "".join(f"\n---\n{context_part}" for context_part in context) + "\n ---"
\ No newline at end of file
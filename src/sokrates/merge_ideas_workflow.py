@@ -1,10 +1,11 @@
 from typing import List
-from pathlib import Path
+from xml.sax.saxutils import quoteattr
 from .llm_api import LLMApi
 from .prompt_refiner import PromptRefiner
 from .colors import Colors
 from .config import Config
 from .file_helper import FileHelper
+from .response_cache import ResponseCache
 
 class MergeIdeasWorkflow:
     """
@@ -19,7 +20,8 @@ class MergeIdeasWorkflow:
         model: str = Config.DEFAULT_MODEL,
         max_tokens: int = 50000,
         temperature: float = 0.7,
-        verbose: bool = False) -> None:
+        verbose: bool = False,
+        response_cache: ResponseCache = None) -> None:
       """
       Initialize the MergeIdeasWorkflow with configuration parameters.
       
@@ -30,15 +32,17 @@ class MergeIdeasWorkflow:
           max_tokens (int): Maximum tokens for the LLM response
           temperature (float): Sampling temperature for response generation
           verbose (bool): Enable verbose output for debugging
+          response_cache (ResponseCache, optional): On-disk cache for LLM responses
       """
-      self.llm_api = LLMApi(api_endpoint=api_endpoint, api_key=api_key, verbose=verbose)
+      self.llm_api = LLMApi.get_shared(api_endpoint=api_endpoint, api_key=api_key, verbose=verbose, response_cache=response_cache)
       self.refiner = PromptRefiner(verbose=verbose)
       self.model = model
       self.max_tokens = max_tokens
       self.temperature = temperature
       self.verbose = verbose
       # Path to the prompt template used for merging ideas
-      self.idea_merger_prompt_file = str(Path(f"{Config.DEFAULT_PROMPTS_DIRECTORY}/merge-ideas-v1.md").resolve())
+      # (the prompts directory is already resolved, so no filesystem lookups are needed here)
+      self.idea_merger_prompt_file = str(Config.DEFAULT_PROMPTS_DIRECTORY / "merge-ideas-v1.md")
 
     def merge_ideas(self, source_documents: dict, context_array: List[str]=None) -> str:
       """
@@ -53,13 +57,13 @@ class MergeIdeasWorkflow:
       """
       # Load the specialized prompt template for merging ideas
       idea_merger_prompt = FileHelper.read_file(self.idea_merger_prompt_file, self.verbose)
-      file_list_str = "# Source documents"
       
       # Format each document with XML-like tags for clear separation
-      for doc in source_documents:
-        doc_identifier = doc['identifier']
-        doc_content = doc['content']
-        file_list_str = f"{file_list_str}\n<document identifier=\"{doc_identifier}\">{doc_content}</document>\n"
+      # (quoteattr escapes quotes and markup characters in the identifiers)
+      file_list_str = "# Source documents" + "".join(
+        f"\n<document identifier={quoteattr(str(doc['identifier']))}>{doc['content']}</document>\n"
+        for doc in source_documents
+      )
       
       # Combine the prompt template with the formatted documents
       combined_prompt = f"{idea_merger_prompt}\n{file_list_str}\n"
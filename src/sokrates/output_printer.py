@@ -4,6 +4,8 @@
 # and file creation notifications) to ensure consistent and visually
 # appealing terminal feedback for the user.
 
+import sys
+from typing import List
 from .colors import Colors
 
 class OutputPrinter:
@@ -13,7 +15,7 @@ class OutputPrinter:
   """
   
   @staticmethod
-  def print_header(title: str, color: str = Colors.BRIGHT_CYAN, width: int = 60) -> None:
+  def print_header(title: str, color: str = None, width: int = 60) -> None:
     """
     Prints a decorative header with a title centered within borders.
 
@@ -22,24 +24,42 @@ class OutputPrinter:
         color (str): The ANSI color code for the header. Defaults to Colors.BRIGHT_CYAN.
         width (int): The total width of the header, including borders. Defaults to 60.
     """
+    if color is None:
+      color = Colors.BRIGHT_CYAN
     border = "═" * width
-    print(f"\n{color}{Colors.BOLD}╔{border}╗{Colors.RESET}")
-    print(f"{color}{Colors.BOLD}║{title.center(width)}║{Colors.RESET}")
-    print(f"{color}{Colors.BOLD}╚{border}╝{Colors.RESET}\n")
+    OutputPrinter.section_batch([
+      f"\n{color}{Colors.BOLD}╔{border}╗{Colors.RESET}",
+      f"{color}{Colors.BOLD}║{title.center(width)}║{Colors.RESET}",
+      f"{color}{Colors.BOLD}╚{border}╝{Colors.RESET}\n"
+    ])
 
   @staticmethod
-  def print(value: str, color = Colors.BRIGHT_YELLOW):
+  def section_batch(lines: List[str]) -> None:
+    """
+    Prints multiple lines with a single write to stdout.
+
+    Args:
+        lines (List[str]): The lines to print (without trailing newlines).
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+
+  @staticmethod
+  def print(value: str, color = None):
       """
       Prints a value with the specified color.
+      The line is written with a single write, so it is not split up by
+      lines printed from other threads.
 
       Args:
           value (str): The text to print.
           color (str): The ANSI color code for the output. Defaults to Colors.BRIGHT_YELLOW.
       """
-      print(f"{color}{value}{Colors.RESET}")
+      if color is None:
+          color = Colors.BRIGHT_YELLOW
+      sys.stdout.write(f"{color}{value}{Colors.RESET}\n")
   
   @staticmethod
-  def print_section(title: str, color: str = Colors.BRIGHT_BLUE, char: str = "─") -> None:
+  def print_section(title: str, color: str = None, char: str = "─") -> None:
       """
       Prints a section separator with a title.
 
@@ -48,12 +68,16 @@ class OutputPrinter:
           color (str): The ANSI color code for the section. Defaults to Colors.BRIGHT_BLUE.
           char (str): The character used to draw the separator lines. Defaults to "─".
       """
-      print(f"\n{color}{Colors.BOLD}{char * 50}{Colors.RESET}")
-      print(f"{color}{Colors.BOLD} {title}{Colors.RESET}")
-      print(f"{color}{Colors.BOLD}{char * 50}{Colors.RESET}")
+      if color is None:
+          color = Colors.BRIGHT_BLUE
+      OutputPrinter.section_batch([
+          f"\n{color}{Colors.BOLD}{char * 50}{Colors.RESET}",
+          f"{color}{Colors.BOLD} {title}{Colors.RESET}",
+          f"{color}{Colors.BOLD}{char * 50}{Colors.RESET}"
+      ])
 
   @staticmethod
-  def print_info(label: str, value: str, label_color: str = Colors.BRIGHT_GREEN, value_color: str = Colors.WHITE) -> None:
+  def print_info(label: str, value: str, label_color: str = None, value_color: str = None) -> None:
       """
       Prints formatted information with a colored label and value.
 
@@ -63,6 +87,10 @@ class OutputPrinter:
           label_color (str): The ANSI color code for the label. Defaults to Colors.BRIGHT_GREEN.
           value_color (str): The ANSI color code for the value. Defaults to Colors.WHITE.
       """
+      if label_color is None:
+          label_color = Colors.BRIGHT_GREEN
+      if value_color is None:
+          value_color = Colors.WHITE
       print(f"{label_color}{Colors.BOLD}{label}:{Colors.RESET} {value_color}{value}{Colors.RESET}")
 
   @staticmethod
@@ -8,6 +8,27 @@ from .colors import Colors
 import re
 from markdownify import markdownify as md
 
+# meta blocks LLMs wrap around their answers, removed including their content
+_META_BLOCK_PATTERNS = [re.compile(pattern, re.DOTALL | re.IGNORECASE) for pattern in (
+    r'<think>.*?</think>',  # Think blocks
+    r'<thinking>.*?</thinking>',  # Thinking blocks
+    r'<reasoning>.*?</reasoning>',  # Reasoning blocks
+    r'<meta>.*?</meta>',  # Meta blocks
+    r'<reflection>.*?</reflection>',  # Reflection blocks
+)]
+_PREFIX_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'^Here\'s the refined prompt:\s*',
+    r'^Refined prompt:\s*',
+    r'^The refined prompt is:\s*',
+    r'^Here is the refined version:\s*',
+    r'^Refined version:\s*',
+)]
+_BLANK_LINES_PATTERN = re.compile(r'\n\s*\n\s*\n')
+_STRAY_TAG_PATTERN = re.compile(r'</?(think|tool_code|execute_result|response|answer)>', re.DOTALL)
+# matches whenever clean_response() could change a response: tags, one of the
+# prefixes, runs of blank lines or surrounding whitespace
+_NEEDS_CLEANING_PATTERN = re.compile(r'<|\n\s*\n\s*\n|\A\s|\s\Z|\A(?:here|refined|the refined)', re.IGNORECASE)
+
 class PromptRefiner:
     """
     A utility class for refining and cleaning LLM-generated text.
@@ -30,6 +51,10 @@ class PromptRefiner:
         Combines an initial input prompt with a refinement prompt.
         The refinement prompt typically contains instructions for how to refine the input.
 
+        The static refinement prompt is placed first and the input prompt last,
+        so consecutive requests share the longest possible prompt prefix and
+        benefit from server-side prefix (KV) caching.
+
         Args:
             input_prompt (str): The initial text prompt that needs refinement.
             refinement_prompt (str): The prompt containing instructions for refinement
@@ -103,43 +128,29 @@ class PromptRefiner:
         if self.verbose:
             print(f"{Colors.MAGENTA}Cleaning refined response...{Colors.RESET}")
         
+        # fast path: most responses contain nothing to remove
+        if not _NEEDS_CLEANING_PATTERN.search(response):
+            if self.verbose:
+                print(f"{Colors.BLUE}No cleaning needed - response was already clean{Colors.RESET}")
+            return response
+
         original_length = len(response)
         cleaned = response
         
-        patterns_to_remove = [
-            r'<think>.*?</think>',  # Think blocks
-            r'<thinking>.*?</thinking>',  # Thinking blocks
-            r'<reasoning>.*?</reasoning>',  # Reasoning blocks
-            r'<meta>.*?</meta>',  # Meta blocks
-            r'<reflection>.*?</reflection>',  # Reflection blocks
-        ]
+        for pattern in _META_BLOCK_PATTERNS:
+            cleaned, count = pattern.subn('', cleaned)
+            if count and self.verbose:
+                print(f"{Colors.BLUE}Removing {count} instances of pattern: {pattern.pattern}{Colors.RESET}")
         
-        for pattern in patterns_to_remove:
-            matches = re.findall(pattern, cleaned, re.DOTALL | re.IGNORECASE)
-            if matches:
+        for prefix in _PREFIX_PATTERNS:
+            if prefix.match(cleaned):
+                cleaned = prefix.sub('', cleaned)
                 if self.verbose:
-                    print(f"{Colors.BLUE}Removing {len(matches)} instances of pattern: {pattern}{Colors.RESET}")
-                cleaned = re.sub(pattern, '', cleaned, flags=re.DOTALL | re.IGNORECASE)
-        
-        prefixes_to_remove = [
-            r'^Here\'s the refined prompt:\s*',
-            r'^Refined prompt:\s*',
-            r'^The refined prompt is:\s*',
-            r'^Here is the refined version:\s*',
-            r'^Refined version:\s*',
-        ]
-        
-        for prefix in prefixes_to_remove:
-            if re.match(prefix, cleaned, re.IGNORECASE):
-                cleaned = re.sub(prefix, '', cleaned, flags=re.IGNORECASE)
-                if self.verbose:
-                    print(f"{Colors.BLUE}Removed prefix pattern: {prefix}{Colors.RESET}")
+                    print(f"{Colors.BLUE}Removed prefix pattern: {prefix.pattern}{Colors.RESET}")
         
         # cleanup unneeded tags
-        cleaned = re.sub(r'\n\s*\n\s*\n', '\n\n', cleaned)
-        
-        stray_tag_pattern = r'</?(think|tool_code|execute_result|response|answer)>'
-        cleaned = re.sub(stray_tag_pattern, '', cleaned, flags=re.DOTALL)
+        cleaned = _BLANK_LINES_PATTERN.sub('\n\n', cleaned)
+        cleaned = _STRAY_TAG_PATTERN.sub('', cleaned)
         cleaned = cleaned.strip()
         
         chars_removed = original_length - len(cleaned)
@@ -6,12 +6,12 @@
 # generating specific content like "mantras" based on provided context.
 
 from typing import List
-from pathlib import Path
 from .llm_api import LLMApi
 from .prompt_refiner import PromptRefiner
 from .colors import Colors
 from .config import Config
 from .file_helper import FileHelper
+from .response_cache import ResponseCache
 
 class RefinementWorkflow:
     """
@@ -20,12 +20,17 @@ class RefinementWorkflow:
     This class integrates with LLM API for model interaction and
     PromptRefiner for prompt processing and response cleaning.
     """
+
+    # appended to the refinement prompt when refinement and execution are fused into one request
+    FUSED_EXECUTION_INSTRUCTION = "\n\n---\nNow execute the refined prompt and return the final answer only."
+
     def __init__(self, api_endpoint: str = Config.DEFAULT_API_ENDPOINT, 
         api_key: str = Config.DEFAULT_API_KEY, 
         model: str = Config.DEFAULT_MODEL, 
         max_tokens: int = 20000,
         temperature: float = 0.7,
-        verbose: bool = False) -> None:
+        verbose: bool = False,
+        response_cache: ResponseCache = None) -> None:
       """
       Initializes the RefinementWorkflow.
 
@@ -36,8 +41,9 @@ class RefinementWorkflow:
           max_tokens (int): The maximum number of tokens for LLM responses. Defaults to 20000.
           temperature (float): The sampling temperature for LLM responses. Defaults to 0.7.
           verbose (bool): If True, enables verbose output. Defaults to False.
+          response_cache (ResponseCache, optional): On-disk cache for LLM responses. Defaults to None (no caching).
       """
-      self.llm_api = LLMApi(api_endpoint=api_endpoint, api_key=api_key, verbose=verbose)
+      self.llm_api = LLMApi.get_shared(api_endpoint=api_endpoint, api_key=api_key, verbose=verbose, response_cache=response_cache)
       self.refiner = PromptRefiner(verbose=verbose)
       self.model = model
       self.max_tokens = max_tokens
@@ -59,7 +65,8 @@ class RefinementWorkflow:
         print(f"{Colors.MAGENTA}Refining prompt:\n{Colors.RESET}")
         print(f"{Colors.MAGENTA}{input_prompt}\n{Colors.RESET}")
       combined_prompt = self.refiner.combine_refinement_prompt(input_prompt, refinement_prompt)
-      response_content = self.llm_api.send(combined_prompt, model=self.model, max_tokens=self.max_tokens, context_array=context_array)
+      response_content = self.llm_api.send(combined_prompt, model=self.model, max_tokens=self.max_tokens,
+        temperature=self.temperature, context_array=context_array)
       processed_content = self.refiner.clean_response(response_content)
 
       # Format as markdown
@@ -69,16 +76,23 @@ class RefinementWorkflow:
         print(f"{Colors.MAGENTA}{markdown_output}\n{Colors.RESET}")
       return markdown_output
     
-    def refine_and_send_prompt(self, input_prompt: str, refinement_prompt: str, refinement_model: str = None, execution_model: str = None, refinement_temperature: float = None) -> str:
+    def refine_and_send_prompt(self, input_prompt: str, refinement_prompt: str, refinement_model: str = None, execution_model: str = None, refinement_temperature: float = None,
+                               fuse: bool = False) -> str:
       """
       Refines an input prompt and then sends the refined prompt to an LLM for execution.
 
+      If the same model and temperature are used for refinement and execution
+      and fuse is True, both steps are done with a single request, which
+      instructs the model to refine the prompt and execute the result.
+
       Args:
           input_prompt (str): The initial prompt to be refined.
           refinement_prompt (str): The prompt containing instructions for refinement.
           refinement_model (str, optional): The model to use for refinement. Defaults to self.model.
           execution_model (str, optional): The model to use for execution. Defaults to self.model.
           refinement_temperature (float, optional): The temperature for refinement. Defaults to self.temperature.
+          fuse (bool, optional): If True, refinement and execution with the same model and
+                                 temperature are fused into a single request. Defaults to False.
 
       Returns:
           str: The executed response as a Markdown string.
@@ -90,16 +104,22 @@ class RefinementWorkflow:
       if not refinement_temperature:
         refinement_temperature = self.temperature
       
-      if self.verbose:
-        print(f"{Colors.MAGENTA}Refining and sending prompt...\n{Colors.RESET}")
-      refined_prompt = self.refine_prompt(input_prompt=input_prompt, refinement_prompt=refinement_prompt)
-      
-      if self.verbose:
-        print(f"{Colors.MAGENTA}Sending refined prompt to model: {execution_model}\n{Colors.RESET}") # Corrected model_name to execution_model
-      
-      
-      response_content = self.llm_api.send(refined_prompt, model=execution_model, 
-        max_tokens=self.max_tokens, temperature=refinement_temperature)
+      if fuse and refinement_model == execution_model and refinement_temperature == self.temperature:
+        if self.verbose:
+          print(f"{Colors.MAGENTA}Refining and executing prompt with a single request to model: {execution_model}\n{Colors.RESET}")
+        fused_prompt = self.refiner.combine_refinement_prompt(input_prompt, refinement_prompt) + self.FUSED_EXECUTION_INSTRUCTION
+        response_content = self.llm_api.send(fused_prompt, model=execution_model,
+          max_tokens=self.max_tokens, temperature=refinement_temperature)
+      else:
+        if self.verbose:
+          print(f"{Colors.MAGENTA}Refining and sending prompt...\n{Colors.RESET}")
+        refined_prompt = self.refine_prompt(input_prompt=input_prompt, refinement_prompt=refinement_prompt)
+        
+        if self.verbose:
+          print(f"{Colors.MAGENTA}Sending refined prompt to model: {execution_model}\n{Colors.RESET}") # Corrected model_name to execution_model
+        
+        response_content = self.llm_api.send(refined_prompt, model=execution_model, 
+          max_tokens=self.max_tokens, temperature=refinement_temperature)
       processed_content = self.refiner.clean_response(response_content)
 
       # Format as markdown
@@ -121,7 +141,7 @@ class RefinementWorkflow:
       Returns:
           str: The breakdown of the task as a Markdown string.
       """
-      breakdown_instructions_filepath = Path(f"{Path(__file__).parent.resolve()}/prompts/breakdown-v1.md").resolve()
+      breakdown_instructions_filepath = Config.DEFAULT_PROMPTS_DIRECTORY / "breakdown-v1.md"
       breakdown_instructions = FileHelper.read_file(breakdown_instructions_filepath)
       
       result = self.refine_prompt(input_prompt=task, refinement_prompt=breakdown_instructions, context_array=context_array)
@@ -142,10 +162,10 @@ class RefinementWorkflow:
       """
       if not context_files:
         context_files = [
-          Path(f"{Path(__file__).parent.resolve()}/prompts/context/self-improvement-principles-v1.md").resolve()
+          Config.DEFAULT_PROMPTS_DIRECTORY / "context" / "self-improvement-principles-v1.md"
         ]
       if not task_file_path:
-        task_file_path = Path(f"{Path(__file__).parent.resolve()}/prompts/generate-mantra-v1.md").resolve()
+        task_file_path = Config.DEFAULT_PROMPTS_DIRECTORY / "generate-mantra-v1.md"
       
       task = FileHelper.read_file(file_path=task_file_path)
       context = FileHelper.combine_files(file_paths=context_files)
@@ -0,0 +1,255 @@
+# This script defines the `ResponseCache` class, an on-disk cache for LLM
+# responses. Responses are stored as json files named after a content hash of
+# the request parameters (model, temperature, max tokens and prompt), so
+# re-running the same request returns the stored response instead of paying
+# for another inference run. It also provides the `cached_response` decorator
+# that adds the cache lookup to `LLMApi.send` and `LLMApi.send_async`.
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+from .colors import Colors
+from .config import Config
+
+class ResponseCache:
+    """
+    Stores LLM responses on disk keyed by a hash of the request parameters.
+
+    Each cache entry is a json file `<cache_directory>/<hash>.json` containing
+    the response and the model it was generated with. Entries are written
+    atomically, so concurrent processes never read partially written files.
+
+    Entries can expire after a time to live, and the number of entries can be
+    limited, in which case the least recently used entries are evicted. The
+    modification time of an entry file is its last use.
+    """
+
+    # Maximum number of entries of the caches created by the command line tools
+    DEFAULT_MAX_ENTRIES = 1000
+
+    def __init__(self, cache_directory: str = None, verbose: bool = False,
+                 ttl: Optional[float] = None, max_entries: Optional[int] = None):
+        """
+        Initializes the ResponseCache.
+
+        Args:
+            cache_directory (str, optional): Directory to store the cache entries in.
+                Defaults to the cache directory of the configuration ($HOME/.sokrates/cache).
+            verbose (bool): If True, prints cache hits and writes.
+            ttl (float, optional): Seconds after the last use an entry expires.
+                Defaults to None (entries never expire).
+            max_entries (int, optional): Maximum number of entries; the least recently
+                used entries are removed when it is exceeded. Defaults to None (unlimited).
+        """
+        if not cache_directory:
+            cache_directory = Config().cache_path
+        self.cache_directory = Path(cache_directory)
+        self.verbose = verbose
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+    @staticmethod
+    def cache_key(*parts) -> str:
+        """
+        Calculates the cache key for the given request parameters.
+
+        Args:
+            *parts: The request parameters, e.g. model, temperature, max_tokens and prompt.
+
+        Returns:
+            str: The hex digest of the blake2b hash over all parameters.
+        """
+        # json keeps the parts apart and distinguishes types, e.g. None from "None"
+        serialized = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.blake2b(serialized.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def caches_temperatures(force_cache: bool, *temperatures: float) -> bool:
+        """
+        Decides whether the responses of requests with the given temperatures are cached.
+
+        Only deterministic requests are cached unless force_cache is set: a cached
+        response of a request with a temperature above 0 would be returned for
+        every later run, although a new sample is expected.
+
+        Args:
+            force_cache (bool): Cache responses regardless of the temperatures.
+            *temperatures (float): The temperatures of all requests.
+
+        Returns:
+            bool: True if the responses should be cached.
+        """
+        return force_cache or all(float(temperature) == 0 for temperature in temperatures)
+
+    @classmethod
+    def from_arguments(cls, args, *temperatures: float) -> Optional["ResponseCache"]:
+        """
+        Creates the response cache of a command line tool from its parsed arguments
+        (no_cache, cache_dir, force_cache and, if defined, cache_ttl and verbose).
+        Only deterministic requests are cached unless force_cache is set (see caches_temperatures()).
+
+        Args:
+            args (argparse.Namespace): The parsed command line arguments.
+            *temperatures (float): The temperatures of all requests of the tool.
+
+        Returns:
+            Optional[ResponseCache]: The cache limited to DEFAULT_MAX_ENTRIES entries,
+                or None if responses are not cached.
+        """
+        if args.no_cache or not ResponseCache.caches_temperatures(args.force_cache, *temperatures):
+            return None
+        return cls(args.cache_dir, verbose=getattr(args, 'verbose', False),
+                   ttl=getattr(args, 'cache_ttl', None), max_entries=cls.DEFAULT_MAX_ENTRIES)
+
+    @staticmethod
+    def request_key(model, temperature, max_tokens, context, context_array, prompt, system_prompt=None) -> str:
+        """
+        Calculates the cache key of a `LLMApi.send` style request.
+
+        The system prompt is only part of the key if it is set.
+
+        Returns:
+            str: The cache key (see cache_key()).
+        """
+        parts = [model, temperature, max_tokens, context, context_array, prompt]
+        if system_prompt:
+            parts.append(system_prompt)
+        return ResponseCache.cache_key(*parts)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Looks up a cached response.
+
+        Args:
+            key (str): The cache key (see cache_key()).
+
+        Returns:
+            Optional[str]: The cached response or None if there is no (readable) entry.
+        """
+        path = self._entry_path(key)
+        try:
+            if self.ttl is not None and time.time() - path.stat().st_mtime > self.ttl:
+                path.unlink(missing_ok=True)
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                response = json.load(f)['response']
+            if self.ttl is not None or self.max_entries is not None:
+                os.utime(path)
+        except (OSError, ValueError, KeyError):
+            return None
+        if self.verbose:
+            print(f"{Colors.CYAN}Response cache hit: {key}{Colors.RESET}", file=sys.stderr)
+        return response
+
+    def set(self, key: str, response: str, model: str = None) -> None:
+        """
+        Stores a response in the cache.
+
+        The entry is written to a temporary file first and then moved into
+        place, so readers only ever see complete entries.
+
+        Args:
+            key (str): The cache key (see cache_key()).
+            response (str): The response to store.
+            model (str, optional): The model that generated the response.
+        """
+        self.cache_directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({"model": model, "response": response}, f)
+            os.replace(tmp_path, self._entry_path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        if self.verbose:
+            print(f"{Colors.CYAN}Stored response in cache: {key}{Colors.RESET}", file=sys.stderr)
+        if self.max_entries is not None:
+            self._evict()
+
+    def _evict(self) -> None:
+        """
+        Removes the least recently used entries exceeding max_entries.
+        """
+        entries = []
+        with os.scandir(self.cache_directory) as it:
+            for entry in it:
+                if entry.name.endswith(".json"):
+                    try:
+                        entries.append((entry.stat().st_mtime, entry.path))
+                    except OSError:
+                        continue
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort()
+        for _, path in entries[:len(entries) - self.max_entries]:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+def cached_response(send_function):
+    """
+    Decorator for `LLMApi.send` and `LLMApi.send_async`, which serves responses
+    from the instance's `response_cache` when one is configured.
+
+    The cache key covers the model, temperature, max tokens, the prompt, the
+    system prompt and all provided context. Cache hits of `send` are echoed to
+    stdout like a streamed response (unless disabled with `LLMApi.stream_echo()`),
+    cache hits of coroutines are not, as their responses aren't streamed either.
+    """
+    signature = inspect.signature(send_function)
+
+    def request_key(self, args, kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        call = bound.arguments
+        key = ResponseCache.request_key(call['model'], call['temperature'], call['max_tokens'],
+                                        call['context'], call['context_array'], call['prompt'],
+                                        call.get('system_prompt'))
+        return key, call['model']
+
+    def lookup(self, key, model, echo):
+        response = self.response_cache.get(key)
+        if response is not None:
+            print(f"{Colors.CYAN}{Colors.BOLD}Using cached response for model {model}{Colors.RESET}", file=sys.stderr)
+            if echo:
+                print(response)
+        return response
+
+    if inspect.iscoroutinefunction(send_function):
+        @functools.wraps(send_function)
+        async def async_wrapper(self, *args, **kwargs):
+            if self.response_cache is None:
+                return await send_function(self, *args, **kwargs)
+
+            key, model = request_key(self, args, kwargs)
+            response = lookup(self, key, model, echo=False)
+            if response is None:
+                response = await send_function(self, *args, **kwargs)
+                self.response_cache.set(key, response, model=model)
+            return response
+        return async_wrapper
+
+    @functools.wraps(send_function)
+    def wrapper(self, *args, **kwargs):
+        if self.response_cache is None:
+            return send_function(self, *args, **kwargs)
+
+        key, model = request_key(self, args, kwargs)
+        response = lookup(self, key, model, echo=self.stream_echo_enabled())
+        if response is None:
+            response = send_function(self, *args, **kwargs)
+            self.response_cache.set(key, response, model=model)
+        return response
+    return wrapper
@@ -10,23 +10,56 @@ Parameters:
   - temperature (float): Controls randomness in prompt refinement. Default: Config.DEFAULT_MODEL_TEMPERATURE
   - output_dir (str, optional): Directory path for saving results. Default: "./task_results"
   - verbose (bool, optional): Enables detailed logging if True. Default: False
+  - batch_size (int, optional): Number of sub-tasks executed with a single LLM request. Default: 1
+  - max_batch_tokens (int, optional): Estimated token budget of the sub-task descriptions in one batch. Default: None (unlimited)
+  - max_concurrency (int, optional): Number of task batches executed in parallel. Default: 1
+  - qps_limit (float, optional): Maximum number of task batches started per second. Default: None (unlimited)
+  - resume (bool, optional): Skip tasks recorded as completed in the checkpoint file of the output directory. Default: True
+  - fuse_refinement (bool, optional): Refine and execute each task with a single LLM request. Default: False
+  - fail_fast (bool, optional): Cancel the remaining tasks after an unrecoverable LLM API error. Default: False
+  - echo_stream (bool, optional): Echo streamed LLM responses to stdout. Default: True
 
 Usage Example:
   executor = SequentialTaskExecutor(output_dir="./results", verbose=True)
   result_summary = executor.execute_tasks_from_file("tasks.json")
 """
 
+import asyncio
+import json
 import os
-from typing import List, Dict
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Tuple
+import openai
 from .refinement_workflow import RefinementWorkflow
 from .file_helper import FileHelper
 from .config import Config
-from .output_printer import OutputPrinter
 from .llm_api import LLMApi
+from .output_printer import OutputPrinter
+from .response_cache import ResponseCache
+
+# Use orjson for parsing LLM responses and checkpoints if it is available
+try:
+    import orjson
+    ORJSON_ENABLED = True
+except ImportError:
+    ORJSON_ENABLED = False
+
+def _json_loads(data):
+    return orjson.loads(data) if ORJSON_ENABLED else json.loads(data)
+
+def _json_dumps(value) -> str:
+    return orjson.dumps(value).decode("utf-8") if ORJSON_ENABLED else json.dumps(value)
+
+# LLM API errors after which the requests of the remaining tasks would fail as well
+# (the server is unreachable, the credentials are rejected or the model doesn't exist)
+_UNRECOVERABLE_ERRORS = (openai.APIConnectionError, openai.AuthenticationError,
+                         openai.PermissionDeniedError, openai.NotFoundError)
 
 class SequentialTaskExecutor:
     """
-    Executes tasks defined in a JSON file sequentially.
+    Executes tasks defined in a JSON file sequentially or with bounded concurrency.
 
     This class reads tasks from a JSON file (same format as BreakdownTask output),
     processes each task by analyzing concepts, generating prompts, refining them,
@@ -34,7 +67,7 @@ class SequentialTaskExecutor:
 
     Main Responsibilities:
         - Load tasks from JSON files
-        - Process tasks sequentially with error handling
+        - Process tasks sequentially (or concurrently with a bounded number of parallel requests) with error handling
         - Manage refinement workflows for prompt generation
         - Save execution results to output directory
 
@@ -46,19 +79,47 @@ class SequentialTaskExecutor:
         verbose (bool): Verbose output flag
         workflow (RefinementWorkflow): Workflow instance for prompt refinement
         refinement_enabled (bool): Should prompts be refined before execution first
+        response_cache (ResponseCache): Optional on-disk cache for task results
+        batch_size (int): Number of sub-tasks that are sent to the LLM in one request
+        max_batch_tokens (int): Estimated token budget of the sub-task descriptions in one batch (None for no limit)
+        max_concurrency (int): Number of task batches that are executed in parallel
+        qps_limit (float): Maximum number of task batches started per second (None for no limit)
+        resume (bool): Skip tasks that are recorded as completed in the checkpoint file
+        fuse_refinement (bool): Refine and execute a task with a single LLM request
+        fail_fast (bool): Cancel the remaining tasks after an unrecoverable LLM API error
+        echo_stream (bool): Echo streamed LLM responses to stdout
+        refinement_prompt (str): The refinement prompt used for all tasks
+        checkpoint_file (str): Path of the JSONL checkpoint file in the output directory
 
     Methods:
         execute_tasks_from_file(): Execute all tasks from a JSON file
+        execute_tasks_from_file_async(): Coroutine version of execute_tasks_from_file()
         _process_single_task_file(): Process individual task file with refinement and execution
+        _process_task_batch(): Execute multiple tasks with a single LLM request
     """
 
+    CHECKPOINT_FILE_NAME = "_checkpoint.jsonl"
+    # Sub-tasks with longer descriptions are rejected instead of being sent to the LLM
+    MAX_DESCRIPTION_LENGTH = 100_000
+    # Rough number of characters per token, used to estimate batch sizes without a tokenizer
+    CHARS_PER_TOKEN = 4
+
     def __init__(self, api_endpoint: str = Config.DEFAULT_API_ENDPOINT,
                  api_key: str = Config.DEFAULT_API_KEY,
                  model: str = Config.DEFAULT_MODEL,
                  temperature: float = Config.DEFAULT_MODEL_TEMPERATURE,
                  output_dir: str = None,
                  verbose: bool = False,
-                 refinement_enabled: bool = True):
+                 refinement_enabled: bool = True,
+                 response_cache: ResponseCache = None,
+                 batch_size: int = 1,
+                 max_batch_tokens: int = None,
+                 max_concurrency: int = 1,
+                 qps_limit: float = None,
+                 resume: bool = True,
+                 fuse_refinement: bool = False,
+                 fail_fast: bool = False,
+                 echo_stream: bool = True):
         """
         Initializes the SequentialTaskExecutor with configuration and workflow setup.
 
@@ -69,9 +130,34 @@ class SequentialTaskExecutor:
             output_dir (str, optional): Directory where task results will be saved.
                 If None, defaults to "./task_results".
             verbose (bool, optional): If True, enables verbose output. Defaults to False.
+            refinement_enabled (bool, optional): If True, task prompts are refined before execution. Defaults to True.
+            response_cache (ResponseCache, optional): If set, task results are cached per task
+                (keyed by model, temperature, refinement mode and task prompt). Defaults to None.
+            batch_size (int, optional): If greater than 1, sub-tasks are executed in batches of this size
+                with one LLM request per batch (without prompt refinement). Tasks missing from a batch
+                response are executed one by one. Defaults to 1.
+            max_batch_tokens (int, optional): If set, a batch is closed early when the estimated tokens
+                of its sub-task descriptions would exceed this budget. Sub-tasks exceeding the budget on
+                their own are executed with a single request. Defaults to None (no limit).
+            max_concurrency (int, optional): Number of task batches executed in parallel.
+                Independent tasks overlap their LLM requests when greater than 1. Defaults to 1.
+            qps_limit (float, optional): Maximum number of task batches started per second.
+                Defaults to None (no limit).
+            resume (bool, optional): If True, tasks recorded as completed in the checkpoint file
+                of the output directory (with unchanged task description) are skipped. Defaults to True.
+            fuse_refinement (bool, optional): If True, refinement and execution of a task are done
+                with a single LLM request. The refined prompt is then not produced on its own and
+                results are cached separately from two step results. Defaults to False.
+            fail_fast (bool, optional): If True, tasks that have not started yet are cancelled after a task
+                failed with an unrecoverable LLM API error (server unreachable, authentication failed or
+                model not found), instead of letting each of them fail on its own. Defaults to False.
+            echo_stream (bool, optional): If True, streamed LLM responses are echoed to stdout.
+                The echo is always off with max_concurrency greater than 1, and callers running
+                several executions at once disable it, so their output doesn't interleave. Defaults to True.
 
         Side Effects:
             - Creates output directory if it doesn't exist
+            - Reads the refinement prompt
             - Initializes refinement workflow instance
         """
         self.config = Config(verbose=verbose)
@@ -82,10 +168,25 @@ class SequentialTaskExecutor:
         self.output_dir = Config.create_and_return_task_execution_directory(output_dir)
         self.verbose = verbose
         self.refinement_enabled = refinement_enabled
+        self.response_cache = response_cache
+        self.batch_size = max(1, batch_size)
+        self.max_batch_tokens = max_batch_tokens
+        self.max_concurrency = max(1, max_concurrency)
+        self.qps_limit = qps_limit
+        self.resume = resume
+        self.fuse_refinement = fuse_refinement
+        self.fail_fast = fail_fast
+        self.echo_stream = echo_stream
+        self.checkpoint_file = os.path.join(self.output_dir, self.CHECKPOINT_FILE_NAME)
+        self._checkpoint_lock = threading.Lock()
 
         # Create output directory if it doesn't exist
         os.makedirs(self.output_dir, exist_ok=True)
 
+        # Use a generic refinement prompt for task execution, loaded once for all tasks
+        self.refinement_prompt = FileHelper.read_file(str(Config.DEFAULT_PROMPTS_DIRECTORY / "refine-prompt.md"),
+                                                      verbose=self.verbose)
+
         # Initialize refinement workflow
         self.workflow = RefinementWorkflow(
             api_endpoint=self.api_endpoint,
@@ -97,7 +198,8 @@ class SequentialTaskExecutor:
 
     def execute_tasks_from_file(self, task_file_path: str) -> Dict[str, any]:
         """
-        Executes all tasks from a JSON file sequentially.
+        Executes all tasks from a JSON file, sequentially or with bounded concurrency.
+        Runs execute_tasks_from_file_async() in a new event loop.
 
         Args:
             task_file_path (str): Path to the JSON file containing tasks
@@ -118,17 +220,36 @@ class SequentialTaskExecutor:
             - Modifies internal state with task execution results
             - Creates output files in the specified directory
         """
+        return asyncio.run(self.execute_tasks_from_file_async(task_file_path))
+
+    async def execute_tasks_from_file_async(self, task_file_path: str) -> Dict[str, any]:
+        """
+        Executes all tasks from a JSON file with at most max_concurrency task batches
+        in flight. Use this instead of execute_tasks_from_file() when an event loop
+        is already running.
+
+        Args:
+            task_file_path (str): Path to the JSON file containing tasks
+
+        Returns:
+            dict: Summary of execution results (see execute_tasks_from_file())
+
+        Raises:
+            ValueError: If task file cannot be loaded or parsed
+        """
         if self.verbose:
             OutputPrinter.print(f"Loading tasks from {task_file_path}...")
 
         # Load tasks from JSON file
         try:
-            tasks = FileHelper.read_json_file(task_file_path, verbose=self.verbose)
+            tasks = self._read_task_file(task_file_path)
         except Exception as e:
             raise ValueError(f"Failed to load task file: {e}")
 
         main_task = tasks.get("task", None)
-        
+        # the main task context is the same for all sub-tasks, so it is built once per task file
+        main_task_context = self._build_main_task_context(main_task)
+
         results = {
             "total_tasks": len(tasks.get("subtasks", [])),
             "successful_tasks": 0,
@@ -136,44 +257,255 @@ class SequentialTaskExecutor:
             "details": []
         }
 
-        for subtask in tasks.get("subtasks", []):
-            task_id = subtask.get("id")
-            task_desc = subtask.get("description")
+        completed_tasks = self._load_checkpoint() if self.resume else set()
 
-            if not task_id or not task_desc:
+        valid_subtasks = []
+        subtasks, rejected_details = self._validate_subtasks(tasks.get("subtasks", []))
+        results["details"].extend(rejected_details)
+        for subtask in subtasks:
+            if (str(subtask["id"]), self._task_hash(main_task, subtask["description"])) in completed_tasks:
+                OutputPrinter.print(f"Skipping task {subtask['id']}: already completed in a previous run")
+                results["successful_tasks"] += 1
                 results["details"].append({
+                    "task_id": subtask["id"],
+                    "status": "completed",
+                    "message": "Task already completed in a previous run"
+                })
+                continue
+            valid_subtasks.append(subtask)
+
+        batches = self._build_batches(valid_subtasks)
+        for batch_details in await self._execute_batches(batches, main_task=main_task,
+                                                            main_task_context=main_task_context):
+            for detail in batch_details:
+                if detail["status"] == "completed":
+                    results["successful_tasks"] += 1
+                else:
+                    results["failed_tasks"] += 1
+                results["details"].append(detail)
+
+        if self.verbose:
+            OutputPrinter.print(f"Task execution summary:")
+            OutputPrinter.print(f"- Total tasks: {results['total_tasks']}")
+            OutputPrinter.print(f"- Successful: {results['successful_tasks']}")
+            OutputPrinter.print(f"- Failed: {results['failed_tasks']}")
+
+        return results
+
+    def _build_batches(self, subtasks: List[dict]) -> List[List[dict]]:
+        """
+        Groups consecutive sub-tasks into batches of at most batch_size sub-tasks
+        and, if max_batch_tokens is set, at most max_batch_tokens estimated tokens
+        of sub-task descriptions.
+
+        Args:
+            subtasks (List[dict]): The validated sub-tasks
+
+        Returns:
+            List[List[dict]]: The batches in sub-task order
+        """
+        if self.batch_size == 1:
+            return [[subtask] for subtask in subtasks]
+
+        batches = []
+        batch = []
+        batch_tokens = 0
+        for subtask in subtasks:
+            tokens = self._estimate_tokens(subtask["description"])
+            if batch and (len(batch) >= self.batch_size or
+                          (self.max_batch_tokens and batch_tokens + tokens > self.max_batch_tokens)):
+                batches.append(batch)
+                batch = []
+                batch_tokens = 0
+            batch.append(subtask)
+            batch_tokens += tokens
+        if batch:
+            batches.append(batch)
+        return batches
+
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        """
+        Estimates the number of tokens of a text from its length.
+        """
+        return len(text) // SequentialTaskExecutor.CHARS_PER_TOKEN + 1
+
+    async def _execute_batches(self, batches: List[List[dict]], main_task: str = None,
+                               main_task_context: str = None) -> List[List[dict]]:
+        """
+        Executes all task batches with at most max_concurrency batches in flight
+        and at most qps_limit batches started per second.
+
+        Args:
+            batches (List[List[dict]]): The batches of sub-tasks to execute
+            main_task (str, optional): The main task the sub-tasks belong to
+            main_task_context (str, optional): The prompt section describing the main task
+                (see _build_main_task_context())
+
+        Returns:
+            List[List[dict]]: The execution details per batch, in the order of the batches
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        rate_limit_lock = asyncio.Lock()
+        next_start_time = time.monotonic()
+        loop = asyncio.get_running_loop()
+        # set by a worker thread after an unrecoverable error in fail fast mode
+        abort = threading.Event() if self.fail_fast else None
+
+        async def run_batch(batch: List[dict]) -> List[dict]:
+            nonlocal next_start_time
+            async with semaphore:
+                if abort is not None and abort.is_set():
+                    return [self._cancelled_detail(subtask) for subtask in batch]
+                if self.qps_limit:
+                    async with rate_limit_lock:
+                        delay = next_start_time - time.monotonic()
+                        if delay > 0:
+                            await asyncio.sleep(delay)
+                        next_start_time = max(next_start_time, time.monotonic()) + 1.0 / self.qps_limit
+                return await loop.run_in_executor(executor, self._execute_batch_in_thread, batch, main_task,
+                                                  main_task_context, abort)
+
+        # the default executor of asyncio.to_thread() has at most min(32, cpu count + 4)
+        # threads, a dedicated pool allows max_concurrency batches to actually overlap
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, max(1, len(batches))),
+                                thread_name_prefix="task-batch") as executor:
+            return await asyncio.gather(*(run_batch(batch) for batch in batches))
+
+    def _validate_subtasks(self, subtasks: List[dict]) -> Tuple[List[dict], List[dict]]:
+        """
+        Validates the sub-tasks of a task file before any LLM request is made.
+
+        Sub-tasks without an id or (non-blank) description, with a description
+        longer than MAX_DESCRIPTION_LENGTH characters, or repeating an earlier
+        sub-task (same id and description) are rejected. Descriptions are stripped.
+
+        Args:
+            subtasks (List[dict]): The sub-tasks of the task file
+
+        Returns:
+            Tuple[List[dict], List[dict]]: The valid sub-tasks and the "skipped"
+                execution details of the rejected ones
+        """
+        valid_subtasks = []
+        rejected_details = []
+        seen = set()
+        for subtask in subtasks:
+            if not isinstance(subtask, dict):
+                subtask = {}
+            task_id = subtask.get("id")
+            description = subtask.get("description")
+            if isinstance(description, str):
+                description = description.strip()
+
+            message = None
+            if not task_id or not description or not isinstance(description, str):
+                message = "Missing required fields"
+            elif len(description) > self.MAX_DESCRIPTION_LENGTH:
+                message = f"Description exceeds {self.MAX_DESCRIPTION_LENGTH} characters"
+            elif (str(task_id), description) in seen:
+                message = "Duplicate of an earlier sub-task"
+
+            if message:
+                rejected_details.append({
                     "task_id": task_id,
                     "status": "skipped",
-                    "message": "Missing required fields"
+                    "message": message
                 })
                 continue
+            seen.add((str(task_id), description))
+            valid_subtasks.append({**subtask, "description": description})
+        return valid_subtasks, rejected_details
 
+    def _execute_batch_in_thread(self, batch: List[dict], main_task: str = None, main_task_context: str = None,
+                                 abort: threading.Event = None) -> List[dict]:
+        """
+        Executes a batch of sub-tasks (see _execute_batch()) in a worker thread.
+        Streamed responses are only echoed to stdout if echo_stream is set and
+        batches run one at a time, as the tokens of parallel batches would interleave.
+        """
+        with LLMApi.stream_echo(self.echo_stream and self.max_concurrency == 1):
+            return self._execute_batch(batch, main_task, main_task_context, abort)
+
+    def _execute_batch(self, batch: List[dict], main_task: str = None, main_task_context: str = None,
+                       abort: threading.Event = None) -> List[dict]:
+        """
+        Executes a batch of sub-tasks. Batches with more than one task are sent
+        as a single request first, tasks without a result are executed one by one.
+
+        Args:
+            batch (List[dict]): The sub-tasks to execute
+            main_task (str, optional): The main task the sub-tasks belong to
+            main_task_context (str, optional): The prompt section describing the main task
+            abort (threading.Event, optional): In fail fast mode, set after an unrecoverable
+                error; the remaining tasks are cancelled once it is set
+
+        Returns:
+            List[dict]: The execution details (task_id, status, message) per task
+        """
+        batch_results = {}
+        if len(batch) > 1:
             try:
-                result = self._process_single_task_file(task_desc=task_desc, 
-                                                        task_id=task_id, main_task=main_task)
-                results["successful_tasks"] += 1
+                batch_results = self._process_task_batch(batch, main_task=main_task,
+                                                         main_task_context=main_task_context)
+            except Exception as e:
+                self._check_unrecoverable(e, abort)
+                OutputPrinter.print(f"Batch execution failed: {e}. Falling back to single task execution ...")
+
+        details = []
+        for subtask in batch:
+            task_id = subtask.get("id")
+            task_desc = subtask.get("description")
+            if abort is not None and abort.is_set() and str(task_id) not in batch_results:
+                details.append(self._cancelled_detail(subtask))
+                continue
+            try:
+                if str(task_id) not in batch_results:
+                    self._process_single_task_file(task_desc=task_desc,
+                                                   task_id=task_id, main_task=main_task,
+                                                   main_task_context=main_task_context)
                 status = "completed"
                 message = "Task executed successfully"
             except Exception as e:
-                results["failed_tasks"] += 1
+                self._check_unrecoverable(e, abort)
                 status = "failed"
                 message = f"Error executing task: {str(e)}"
 
-            results["details"].append({
+            details.append({
                 "task_id": task_id,
                 "status": status,
                 "message": message
             })
+        return details
 
-        if self.verbose:
-            OutputPrinter.print(f"Task execution summary:")
-            OutputPrinter.print(f"- Total tasks: {results['total_tasks']}")
-            OutputPrinter.print(f"- Successful: {results['successful_tasks']}")
-            OutputPrinter.print(f"- Failed: {results['failed_tasks']}")
-
-        return results
+    @staticmethod
+    def _check_unrecoverable(error: Exception, abort: threading.Event = None) -> None:
+        """
+        Sets the abort event (fail fast mode only) if the error, or an error it was
+        raised from, means that further LLM requests will fail as well.
+        """
+        if abort is None or abort.is_set():
+            return
+        while error is not None:
+            if isinstance(error, _UNRECOVERABLE_ERRORS):
+                OutputPrinter.print(f"Cancelling the remaining tasks after an unrecoverable LLM API error: {error}")
+                abort.set()
+                return
+            error = error.__cause__ or error.__context__
+
+    @staticmethod
+    def _cancelled_detail(subtask: dict) -> dict:
+        """
+        Returns the execution details of a sub-task cancelled in fail fast mode.
+        """
+        return {
+            "task_id": subtask.get("id"),
+            "status": "cancelled",
+            "message": "Task cancelled after an unrecoverable LLM API error"
+        }
 
-    def _process_single_task_file(self, task_desc: str, task_id: int, main_task: str = None) -> str:
+    def _process_single_task_file(self, task_desc: str, task_id: int, main_task: str = None,
+                                  main_task_context: str = None) -> str:
         """
         Processes a single task file through the complete workflow:
         1. Generate initial prompt from task description
@@ -184,6 +516,9 @@ class SequentialTaskExecutor:
         Args:
             task_desc (str): Task description text
             task_id (int): Unique identifier for the task
+            main_task (str, optional): The main task the sub-task belongs to
+            main_task_context (str, optional): The prompt section describing the main task.
+                Built from main_task if not given.
 
         Returns:
             str: The execution result from the LLM
@@ -202,10 +537,139 @@ class SequentialTaskExecutor:
 
         # Step 1: Generate initial prompt from main task and sub-task description
         sub_task_prompt = f"Sub-Task {task_id}: {task_desc}" 
-        main_task_context = ""
+        if main_task_context is None:
+            main_task_context = self._build_main_task_context(main_task)
+        task_prompt = f"{main_task_context} {sub_task_prompt}"
         
-        if main_task:
-            main_task_context = f"""
+        # Step 2: Refine the prompt using existing refinement workflow
+        if self.verbose:
+            OutputPrinter.print(f"Refining and executing prompt for task {task_id} ...")
+
+        refinement_prompt = self.refinement_prompt
+
+        execution_result = None
+        cache_key = None
+        if self.response_cache is not None:
+            # fused results differ from two step results, so they get their own keys
+            fused = self.refinement_enabled and self.fuse_refinement
+            cache_key = ResponseCache.cache_key(self.model, self.temperature, self.refinement_enabled,
+                                                refinement_prompt, task_prompt, *(["fused"] if fused else []))
+            execution_result = self.response_cache.get(cache_key)
+            if execution_result is not None:
+                OutputPrinter.print(f"Using cached result for task {task_id} ...")
+
+        if execution_result is None:
+            if self.refinement_enabled:
+                OutputPrinter.print(f"Refinement is enabled. Refining and then executing the prompt ...")
+                # Refine and execute prompt using LLM API
+                execution_result = self.workflow.refine_and_send_prompt(
+                    input_prompt=task_prompt,
+                    refinement_prompt=refinement_prompt,  # No further refinement needed for execution
+                    refinement_model=self.model,
+                    execution_model=self.model,
+                    refinement_temperature=self.temperature,
+                    fuse=self.fuse_refinement
+                )
+            else:
+                OutputPrinter.print(f"Refinement is disabled. Executing the prompt directly ...")
+                execution_result = self.workflow.llm_api.send(task_prompt,
+                                                              model=self.model,
+                                                              max_tokens=20000,
+                                                              temperature=self.temperature)
+            if cache_key is not None:
+                self.response_cache.set(cache_key, execution_result, model=self.model)
+
+        if self.verbose:
+            OutputPrinter.print(f"Execution result for task {task_id}:\n{execution_result}")
+
+        # Step 4: Save the result to output directory
+        self._save_task_result(task_id, execution_result, self._task_hash(main_task, task_desc))
+        return execution_result
+
+    def _process_task_batch(self, batch: List[dict], main_task: str = None,
+                            main_task_context: str = None) -> Dict[str, str]:
+        """
+        Executes multiple independent sub-tasks with a single LLM request.
+
+        All sub-tasks of the batch are listed in one prompt and the model is asked
+        to answer with a JSON array of {task_id, result} objects. Every result
+        contained in the response is saved to the output directory.
+
+        Args:
+            batch (List[dict]): The sub-tasks to execute (each with an id and a description)
+            main_task (str, optional): The main task the sub-tasks belong to
+            main_task_context (str, optional): The prompt section describing the main task.
+                Built from main_task if not given.
+
+        Returns:
+            Dict[str, str]: The results contained in the response, keyed by task id (as string).
+                Tasks missing in the response are not contained.
+
+        Raises:
+            ValueError: If the response is not a JSON array
+        """
+        task_ids = [str(subtask["id"]) for subtask in batch]
+        if self.verbose:
+            OutputPrinter.print(f"\nProcessing task batch: {', '.join(task_ids)}")
+
+        if main_task_context is None:
+            main_task_context = self._build_main_task_context(main_task)
+        task_list = "\n".join(f"Task {subtask['id']}: {subtask['description']}" for subtask in batch)
+        batch_prompt = f"""{main_task_context}
+Execute each of the following sub-tasks independently.
+
+{task_list}
+
+Return a JSON array of {{task_id, result}} objects with one object per task and no other text.
+The result of each task must be a string containing the complete result in markdown format.
+"""
+        response = self.workflow.llm_api.send(batch_prompt,
+                                              model=self.model,
+                                              max_tokens=20000,
+                                              temperature=self.temperature)
+        refiner = self.workflow.refiner
+        cleaned_response = refiner.clean_response_from_markdown(refiner.clean_response(response))
+        try:
+            entries = _json_loads(cleaned_response)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Batch response is not valid JSON: {e}")
+        if not isinstance(entries, list):
+            raise ValueError("Batch response is not a JSON array")
+
+        batch_results = {}
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            task_id = str(entry.get("task_id"))
+            result = entry.get("result")
+            if task_id in task_ids and isinstance(result, str) and result:
+                batch_results[task_id] = result
+
+        task_descriptions = {str(subtask["id"]): subtask["description"] for subtask in batch}
+        for task_id, result in batch_results.items():
+            self._save_task_result(task_id, result, self._task_hash(main_task, task_descriptions[task_id]))
+
+        missing_task_ids = [task_id for task_id in task_ids if task_id not in batch_results]
+        if missing_task_ids:
+            OutputPrinter.print(f"Batch response is missing results for tasks: {', '.join(missing_task_ids)}")
+        return batch_results
+
+    @staticmethod
+    def _build_main_task_context(main_task: str = None) -> str:
+        """
+        Builds the prompt section describing the main task a sub-task belongs to.
+        The main task is the same for all sub-tasks of a task file, so the section
+        is built once per task file and passed to the task executions.
+
+        Args:
+            main_task (str, optional): The main task description
+
+        Returns:
+            str: The context section or an empty string if there is no main task
+        """
+        if not main_task:
+            return ""
+        return f"""
 # Context description
 The task that should be executed is a sub-task of a bigger project or main objective.
 Handle the sub-task in the context of the main objective.
@@ -214,52 +678,89 @@ Handle the sub-task in the context of the main objective.
 {main_task}
 
 """
-        task_prompt = f"{main_task_context} {sub_task_prompt}"
-        
-        # Step 2: Refine the prompt using existing refinement workflow
-        if self.verbose:
-            OutputPrinter.print(f"Refining and executing prompt for task {task_id} ...")
 
-        # Use a generic refinement prompt for task execution
-        refinement_prompt_path = f"{Config.DEFAULT_PROMPTS_DIRECTORY}/refine-prompt.md"
-        refinement_prompt = FileHelper.read_file(refinement_prompt_path, verbose=self.verbose)
+    def _save_task_result(self, task_id, execution_result: str, task_hash: str) -> None:
+        """
+        Saves the result of a task to the output directory and records the task
+        as completed in the checkpoint file.
+        If a result file for the task already exists, a postfixed file name is used.
 
-        execution_result = ""
+        Args:
+            task_id: The id of the task
+            execution_result (str): The result to save
+            task_hash (str): The hash of the task (see _task_hash())
+        """
+        preferred_output_file = os.path.join(self.output_dir, f"task_{task_id}_result.md")
         
-        if self.refinement_enabled:
-            OutputPrinter.print(f"Refinement is enabled. Refining and then executing the prompt ...")
-            # Refine and execute prompt using LLM API
-            execution_result = self.workflow.refine_and_send_prompt(
-                input_prompt=task_prompt,
-                refinement_prompt=refinement_prompt,  # No further refinement needed for execution
-                refinement_model=self.model,
-                execution_model=self.model,
-                refinement_temperature=self.temperature
-            )
-        else:
-            OutputPrinter.print(f"Refinement is disabled. Executing the prompt directly ...")
-            llmapi = LLMApi(verbose=self.verbose, 
-                            api_endpoint=self.api_endpoint, 
-                            api_key=self.api_key)
-            execution_result = llmapi.send(task_prompt, 
-                            model = self.model, 
-                            max_tokens=20000, 
-                            temperature=self.temperature)
+        # if file exists -> a postfixed output filepath is used (created atomically, safe for parallel tasks)
+        output_file = FileHelper.write_new_file(preferred_output_file, execution_result, verbose=self.verbose)
+        if output_file != preferred_output_file:
+            OutputPrinter.print(f"File: {preferred_output_file} already exists. Generated postfixed file name for output file: {output_file}")
 
         if self.verbose:
-            OutputPrinter.print(f"Execution result for task {task_id}:\n{execution_result}")
+            OutputPrinter.print(f"Result saved to {output_file}")
 
-        # Step 4: Save the result to output directory
-        output_file = f"{self.output_dir}/task_{task_id}_result.md"
-        
-        # if file exists -> create postfixed output filepath
-        if os.path.exists(output_file):
-            output_file_before = output_file
-            output_file = FileHelper.generate_postfixed_file_path(output_file)
-            OutputPrinter.print(f"File: {output_file_before} already exists. Generated postfixed file name for output file: {output_file}")
-        FileHelper.write_to_file(output_file, execution_result, verbose=self.verbose)
+        self._write_checkpoint(task_id, task_hash, output_file)
+
+    def _read_task_file(self, task_file_path: str) -> dict:
+        """
+        Reads and parses a task file (see FileHelper.read_json_file()).
+
+        Args:
+            task_file_path (str): Path to the JSON task file
 
+        Returns:
+            dict: The parsed task file
+        """
+        return FileHelper.read_json_file(task_file_path, verbose=self.verbose)
+
+    @staticmethod
+    def _task_hash(main_task: str, task_desc: str) -> str:
+        """
+        Calculates the hash identifying the content of a task for checkpointing.
+
+        Args:
+            main_task (str): The main task the sub-task belongs to
+            task_desc (str): The sub-task description
+
+        Returns:
+            str: The hex digest of the task hash
+        """
+        return ResponseCache.cache_key(main_task, task_desc)
+
+    def _load_checkpoint(self) -> set:
+        """
+        Loads the completed tasks from the checkpoint file of the output directory.
+        Unreadable lines (e.g. from an interrupted write) are ignored.
+
+        Returns:
+            set: (task_id, task_hash) tuples of all completed tasks
+        """
+        completed_tasks = set()
+        if not os.path.exists(self.checkpoint_file):
+            return completed_tasks
+        with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = _json_loads(line)
+                    completed_tasks.add((str(entry["task_id"]), entry["hash"]))
+                except (ValueError, KeyError, TypeError):
+                    continue
         if self.verbose:
-            OutputPrinter.print(f"Result saved to {output_file}")
+            OutputPrinter.print(f"Loaded {len(completed_tasks)} completed tasks from {self.checkpoint_file}")
+        return completed_tasks
 
-        return execution_result
\ No newline at end of file
+    def _write_checkpoint(self, task_id, task_hash: str, output_file: str) -> None:
+        """
+        Appends a completed task to the checkpoint file.
+
+        Args:
+            task_id: The id of the task
+            task_hash (str): The hash of the task (see _task_hash())
+            output_file (str): The path of the task result file
+        """
+        entry = _json_dumps({"task_id": task_id, "hash": task_hash, "output_path": str(output_file)})
+        with self._checkpoint_lock:
+            with open(self.checkpoint_file, 'a', encoding='utf-8') as f:
+                f.write(f"{entry}\n")
+                f.flush()
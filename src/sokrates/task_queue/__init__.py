@@ -6,17 +6,29 @@
 # - Database access layer: Handles SQLite database operations
 # - Status tracking: Monitors task execution progress
 # - Error handling: Implements retry mechanisms and dead letter queue
+# The modules are imported lazily on first access (PEP 562), so the task
+# queue CLIs only load the LLM client stack when they process tasks.
 
-from .database import TaskQueueDatabase
-from .manager import TaskQueueManager
-from .processor import TaskProcessor
-from .status_tracker import StatusTracker
-from .error_handler import ErrorHandler
+import importlib
 
-__all__ = [
-    "TaskQueueDatabase",
-    "TaskQueueManager",
-    "TaskProcessor",
-    "StatusTracker",
-    "ErrorHandler"
-]
\ No newline at end of file
+# exported name -> module that defines it
+_EXPORTS = {
+    "TaskQueueDatabase": "database",
+    "TaskQueueManager": "manager",
+    "TaskProcessor": "processor",
+    "StatusTracker": "status_tracker",
+    "ErrorHandler": "error_handler",
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
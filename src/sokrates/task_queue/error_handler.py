@@ -9,6 +9,7 @@ Classes:
     ErrorHandler: Manages error handling and recovery strategies
 """
 
+import random
 import time
 from ..config import Config
 
@@ -26,10 +27,13 @@ class ErrorHandler:
 
     Methods:
         should_retry(): Determine if a task should be retried
-        get_retry_delay(): Calculate retry delay with exponential backoff
+        get_retry_delay(): Calculate retry delay with exponential backoff and jitter
         log_error(): Log error details to history
     """
 
+    # Upper bound for retry delays in seconds
+    MAX_RETRY_DELAY = 60.0
+
     def __init__(self):
         """
         Initializes the ErrorHandler with configuration from Config.
@@ -53,7 +57,11 @@ class ErrorHandler:
 
     def get_retry_delay(self, attempt):
         """
-        Calculate retry delay using exponential backoff.
+        Calculate retry delay using exponential backoff with random jitter.
+
+        The delay is drawn uniformly between the base delay and the exponential
+        backoff for the attempt, so tasks failing together (e.g. when the LLM
+        server is down) don't all retry at the same moment.
 
         Args:
             attempt (int): Current retry attempt number
@@ -62,7 +70,8 @@ class ErrorHandler:
             float: Delay in seconds
         """
         # Cap the delay to avoid excessive waiting
-        return min(60.0, self.base_delay * (2 ** attempt))
+        backoff = min(self.MAX_RETRY_DELAY, self.base_delay * (2 ** attempt))
+        return random.uniform(min(self.base_delay, backoff), backoff)
 
     def log_error(self, task_id, error_message, attempt=1):
         """
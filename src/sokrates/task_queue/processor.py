@@ -9,12 +9,14 @@ Classes:
     TaskProcessor: Manages task execution and status updates
 """
 
+import asyncio
 import time
 from typing import Optional
 from .manager import TaskQueueManager
 from .status_tracker import StatusTracker
 from .error_handler import ErrorHandler
 from ..sequential_task_executor import SequentialTaskExecutor
+from ..response_cache import ResponseCache
 from sokrates.config import Config
 
 class TaskProcessor:
@@ -28,24 +30,54 @@ class TaskProcessor:
         manager: TaskQueueManager instance for database operations
         status_tracker: StatusTracker instance for tracking progress
         error_handler: ErrorHandler instance for error management
+        concurrency: Number of tasks executed in parallel
+        tasks_per_second: Maximum number of tasks started per second
+        use_response_cache: Whether task results are cached on disk
+        force_response_cache: Whether task results are cached even if the temperature is not 0
 
     Methods:
         process_tasks(): Process pending tasks from the queue
+        process_tasks_async(): Coroutine version of process_tasks() executing tasks in parallel
         execute_task(): Execute a single task using SequentialTaskExecutor
     """
 
-    def __init__(self, db_path: Optional[str] = None, logger = None):
+    # Default number of queued tasks executed in parallel (the default endpoint is a
+    # local server handling one request at a time, parallel execution is opt-in)
+    DEFAULT_CONCURRENCY = 1
+    # Default maximum number of queued tasks started per second
+    DEFAULT_TASKS_PER_SECOND = 1.0
+
+    def __init__(self, db_path: Optional[str] = None, logger = None,
+                 concurrency: Optional[int] = None, tasks_per_second: Optional[float] = None,
+                 use_response_cache: bool = True, force_response_cache: bool = False):
         """
         Initializes the TaskProcessor with configured components.
 
         Args:
             db_path (str, optional): Path to the SQLite database file.
                 If None, uses the default from TaskQueueManager.
+            concurrency (int, optional): Number of tasks executed in parallel.
+                If None, uses TASK_QUEUE_CONCURRENCY from the configuration (default: 1).
+            tasks_per_second (float, optional): Maximum number of tasks started per second.
+                If None, uses TASK_QUEUE_TASKS_PER_SECOND from the configuration (default: 1).
+            use_response_cache (bool, optional): If True, task results are cached on disk, so
+                re-queued and retried task files don't execute unchanged sub-tasks again. Like in the
+                command line tools, results are only cached if the configured temperature is 0. Defaults to True.
+            force_response_cache (bool, optional): If True, task results are cached regardless of the
+                temperature. Defaults to False.
         """
         self.manager = TaskQueueManager(db_path)
         self.status_tracker = StatusTracker(self.manager)
         self.error_handler = ErrorHandler()
         self.logger = logger
+        if concurrency is None:
+            concurrency = int(Config.get("TASK_QUEUE_CONCURRENCY", self.DEFAULT_CONCURRENCY))
+        if tasks_per_second is None:
+            tasks_per_second = float(Config.get("TASK_QUEUE_TASKS_PER_SECOND", self.DEFAULT_TASKS_PER_SECOND))
+        self.concurrency = max(1, concurrency)
+        self.tasks_per_second = tasks_per_second
+        self.use_response_cache = use_response_cache
+        self.force_response_cache = force_response_cache
         
     def log_message(self, message):
         """
@@ -60,6 +92,22 @@ class TaskProcessor:
     def process_tasks(self, limit: Optional[int] = None):
         """
         Process pending tasks from the queue.
+        Runs process_tasks_async() in a new event loop.
+
+        Args:
+            limit (int, optional): Maximum number of tasks to process. If None, processes all.
+        """
+        asyncio.run(self.process_tasks_async(limit))
+
+    async def process_tasks_async(self, limit: Optional[int] = None):
+        """
+        Process pending tasks from the queue with a pool of `concurrency` workers,
+        starting at most `tasks_per_second` task executions per second.
+
+        Failed tasks that should be retried are put back into the work queue after
+        their retry delay, so waiting for a retry doesn't block a worker.
+        Database access stays on the event loop thread, the task files are
+        executed by SequentialTaskExecutor.execute_tasks_from_file_async().
 
         Args:
             limit (int, optional): Maximum number of tasks to process. If None, processes all.
@@ -73,84 +121,131 @@ class TaskProcessor:
                 self.log_message("No pending tasks to process.")
                 return
 
+            # one executor (with its workflow and prompts) for all tasks of this cycle
+            executor = self._create_executor()
+            # (task, attempt) items, attempt 0 is the first execution
+            work_queue = asyncio.Queue()
             for task in pending_tasks:
-                self._process_single_task_file(task)
-                time.sleep(1)  # Small delay between tasks
+                work_queue.put_nowait((task, 0))
+            rate_limit_lock = asyncio.Lock()
+            next_start_time = time.monotonic()
+            retry_timers = set()
+
+            async def requeue_after(delay, item):
+                await asyncio.sleep(delay)
+                work_queue.put_nowait(item)
+                # only now the original item is done, so join() keeps waiting for the retry
+                work_queue.task_done()
+
+            async def worker():
+                nonlocal next_start_time
+                while True:
+                    task, attempt = await work_queue.get()
+                    retry_delay = None
+                    try:
+                        # space the task starts instead of sleeping between tasks
+                        async with rate_limit_lock:
+                            delay = next_start_time - time.monotonic()
+                            if delay > 0:
+                                await asyncio.sleep(delay)
+                            next_start_time = max(next_start_time, time.monotonic()) + 1.0 / self.tasks_per_second
+                        retry_delay = await self._process_single_task_file(task, executor, attempt)
+                    except Exception as e:
+                        self.log_message(f"Error processing task {task['task_id']}: {e}")
+                    if retry_delay is None:
+                        work_queue.task_done()
+                    else:
+                        timer = asyncio.create_task(requeue_after(retry_delay, (task, attempt + 1)))
+                        retry_timers.add(timer)
+                        timer.add_done_callback(retry_timers.discard)
+
+            workers = [asyncio.create_task(worker()) for _ in range(min(self.concurrency, len(pending_tasks)))]
+            try:
+                await work_queue.join()
+            finally:
+                for pending in (*workers, *retry_timers):
+                    pending.cancel()
+                await asyncio.gather(*workers, *retry_timers, return_exceptions=True)
 
         except Exception as e:
             self.log_message(f"Error processing tasks: {e}")
         finally:
             self.manager.close()
 
-    def _process_single_task_file(self, task):
+    def _create_executor(self) -> SequentialTaskExecutor:
+        """
+        Creates the SequentialTaskExecutor for a processing cycle from the configuration.
+
+        Returns:
+            SequentialTaskExecutor: The executor shared by all tasks of the cycle
+        """
+        config = Config()
+        response_cache = None
+        if self.use_response_cache and ResponseCache.caches_temperatures(self.force_response_cache,
+                                                                         config.default_model_temperature):
+            response_cache = ResponseCache(config.cache_path, max_entries=ResponseCache.DEFAULT_MAX_ENTRIES)
+        return SequentialTaskExecutor(
+                api_endpoint=config.api_endpoint,
+                api_key=config.api_key,
+                model=config.default_model,
+                temperature=config.default_model_temperature,
+                verbose=True,
+                # streamed tokens of tasks running in parallel would interleave in the log
+                echo_stream=self.concurrency == 1,
+                response_cache=response_cache
+                )
+
+    async def _process_single_task_file(self, task, executor: SequentialTaskExecutor, attempt: int = 0) -> Optional[float]:
         """
         Process a single task through execution and status updates.
 
         Args:
             task (dict): Task information from the queue
+            executor (SequentialTaskExecutor): The executor running the task file
+            attempt (int, optional): Number of the retry, 0 for the first execution
+
+        Returns:
+            Optional[float]: The delay in seconds after which the task should be retried,
+                None if it completed or failed permanently
         """
         task_id = task['task_id']
         file_path = task['file_path']
         
-        executor = SequentialTaskExecutor(
-                api_endpoint=Config().api_endpoint,
-                api_key=Config().api_key,
-                model=Config().default_model,
-                temperature=Config().default_model_temperature,
-                verbose=True
-                )
-
         try:
-            # Update status to in_progress
-            self.status_tracker.update_status(task_id, "in_progress")
+            if attempt == 0:
+                # Update status to in_progress
+                self.status_tracker.update_status(task_id, "in_progress")
+            else:
+                self.log_message(f"Retrying task {task_id} (attempt {attempt})...")
 
             # Execute task using SequentialTaskExecutor
-            result = executor.execute_tasks_from_file(file_path)
+            result = await executor.execute_tasks_from_file_async(file_path)
 
             # Update status to completed with result
+            retry_info = f" on retry {attempt}" if attempt else ""
             self.status_tracker.update_status(
                 task_id,
                 "completed",
-                result=f"Successfully executed: {result['successful_tasks']}/{result['total_tasks']} tasks"
+                result=f"Successfully executed{retry_info}: {result['successful_tasks']}/{result['total_tasks']} tasks"
             )
+            return None
 
         except Exception as e:
             # Handle errors with retry logic
-            current_attempt = 1
-
-            while True:
-                error_info = self.error_handler.log_error(task_id, str(e), current_attempt)
+            current_attempt = attempt + 1
+            self.error_handler.log_error(task_id, str(e), current_attempt)
 
-                next_action = self.error_handler.handle_failure(
-                    self.manager,
-                    task_id,
-                    str(e),
-                    current_attempt
-                )
-
-                if next_action == "retry":
-                    self.log_message(f"Retrying task {task_id} (attempt {current_attempt})...")
-                    time.sleep(self.error_handler.get_retry_delay(current_attempt))
+            next_action = self.error_handler.handle_failure(
+                self.manager,
+                task_id,
+                str(e),
+                current_attempt
+            )
 
-                    try:
-                        # Retry the execution
-                        result = executor.execute_tasks_from_file(file_path)
-
-                        self.status_tracker.update_status(
-                            task_id,
-                            "completed",
-                            result=f"Successfully executed on retry {current_attempt}: {result['successful_tasks']}/{result['total_tasks']} tasks"
-                        )
-                        break  # Successful retry, exit the loop
-
-                    except Exception as retry_e:
-                        current_attempt += 1
-                        e = retry_e  # Update error for next iteration
-
-                elif next_action == "dead_letter":
-                    self.log_message(f"Moving task {task_id} to dead letter queue after max retries")
-                    break
-
-                else:  # fail
-                    self.log_message(f"Task {task_id} failed permanently: {e}")
-                    break
+            if next_action == "retry":
+                return self.error_handler.get_retry_delay(current_attempt)
+            elif next_action == "dead_letter":
+                self.log_message(f"Moving task {task_id} to dead letter queue after max retries")
+            else:  # fail
+                self.log_message(f"Task {task_id} failed permanently: {e}")
+            return None
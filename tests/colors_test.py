@@ -0,0 +1,23 @@
+from sokrates import Colors
+
+class TestColors:
+
+    def test_disable_clears_all_codes(self, mocker):
+        for name, value in vars(Colors).items():
+            if name.isupper() and isinstance(value, str):
+                mocker.patch.object(Colors, name, value)
+        Colors.disable()
+        assert Colors.RED == ""
+        assert Colors.BLUE_BOLD == ""
+        assert Colors.RESET == ""
+
+    def test_output_printer_follows_disable_after_import(self, mocker, capsys):
+        from sokrates import OutputPrinter
+        mocker.patch.object(Colors, "BRIGHT_YELLOW", "\033[93m")
+        mocker.patch.object(Colors, "RESET", "\033[0m")
+        OutputPrinter.print("colored")
+        assert capsys.readouterr().out == "\033[93mcolored\033[0m\n"
+        # e.g. the daemon disables colors after redirecting stdout to its log file
+        Colors.disable()
+        OutputPrinter.print("plain")
+        assert capsys.readouterr().out == "plain\n"
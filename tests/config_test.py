@@ -0,0 +1,34 @@
+from sokrates import Config
+
+class TestConfig:
+
+    def test_configuration_is_loaded_once(self, mocker):
+        config = Config()
+        load_env = mocker.patch.object(Config, "load_env")
+        assert Config(verbose=True) is config
+        load_env.assert_not_called()
+
+    def test_later_verbose_call_prints_configuration_once(self, mocker):
+        config = Config()
+        mocker.patch.object(config, "_configuration_printed", False)
+        print_configuration = mocker.patch.object(Config, "print_configuration",
+            side_effect=lambda: setattr(config, "_configuration_printed", True))
+        Config(verbose=True)
+        Config(verbose=True)
+        print_configuration.assert_called_once()
+
+    def test_default_task_execution_directory(self, mocker, tmp_path):
+        mocker.patch.object(Config, "DEFAULT_TASK_RESULTS_DIRECTORY", tmp_path)
+        mocker.patch("sokrates.config.time.time", return_value=1_700_000_000)
+        Config._task_execution_directory.cache_clear()
+        target_dir = Config.create_and_return_task_execution_directory()
+        assert target_dir.parent == tmp_path
+        assert target_dir.is_dir()
+        assert Config.create_and_return_task_execution_directory() is target_dir
+        Config._task_execution_directory.cache_clear()
+
+    def test_get_returns_member_values(self):
+        config = Config()
+        assert Config.get('api_key') == config.api_key
+        assert Config.get('task_queue_daemon_logfile_path') == config.daemon_logfile_path
+        assert Config.get('UNKNOWN_SOKRATES_KEY', 'default') == 'default'
@@ -1,4 +1,5 @@
 import pytest
+import os
 from pathlib import Path
 from sokrates import FileHelper
 
@@ -31,6 +32,30 @@ class TestFileHelperBasicFunctionality:
         actual_content = FileHelper.read_file(test_file)
         assert actual_content == expected_content
 
+    def test_write_many(self, tmp_path):
+        items = [(str(tmp_path / f"sub{i % 2}" / f"file{i}.md"), f"content {i}") for i in range(5)]
+        FileHelper.write_many(items)
+        for file_path, content in items:
+            assert Path(file_path).read_text() == content
+
+    def test_write_new_file_does_not_overwrite(self, tmp_path, mocker):
+        mocker.patch.object(FileHelper, "_minute_timestamp", return_value="2025-01-02_03-04")
+        test_file = str(tmp_path / "result.md")
+        written = [FileHelper.write_new_file(test_file, f"content {i}") for i in range(3)]
+        assert written == [test_file,
+                           str(tmp_path / "result_2025-01-02_03-04.md"),
+                           str(tmp_path / "result_2025-01-02_03-04_2.md")]
+        for i, file_path in enumerate(written):
+            assert Path(file_path).read_text() == f"content {i}"
+
+    def test_clean_name(self):
+        assert FileHelper.clean_name('What is "x/y": a*b?') == "What is x_y- a-b"
+
+    def test_read_json_file(self, tmp_path):
+        test_file = tmp_path / "test.json"
+        test_file.write_text('{"tasks": [{"id": 1, "desc": "Café – über"}]}', encoding="utf-8")
+        assert FileHelper.read_json_file(test_file) == {"tasks": [{"id": 1, "desc": "Café – über"}]}
+
 class TestFileHelperEdgeCases:
     def test_write_to_existing_file(self, tmp_path):
         test_file = tmp_path / "test.txt"
@@ -39,3 +64,84 @@ class TestFileHelperEdgeCases:
         new_content = "Second line."
         FileHelper.write_to_file(file_path=test_file, content=new_content)
         assert test_file.read_text() == new_content
+
+    def test_read_file_normalizes_line_endings(self, tmp_path):
+        test_file = tmp_path / "windows.txt"
+        test_file.write_bytes("  first line\r\nsecond line\rthird line äöü\n\n".encode("utf-8"))
+        assert FileHelper.read_file(test_file) == "first line\nsecond line\nthird line äöü"
+
+    def test_read_large_file(self, tmp_path):
+        test_file = tmp_path / "large.txt"
+        content = "line äöü\r\n" * (FileHelper.MMAP_MIN_SIZE // 8)
+        test_file.write_bytes(content.encode("utf-8"))
+        assert FileHelper.read_file(test_file) == content.replace("\r\n", "\n").strip()
+
+    def test_combine_files(self, tmp_path):
+        for name in ["a.txt", "b.txt"]:
+            (tmp_path / name).write_text(name)
+        assert FileHelper.combine_files([tmp_path / "a.txt", tmp_path / "b.txt"]) == "\n---\na.txt\n---\nb.txt"
+
+    def test_copy_file(self, tmp_path):
+        source = tmp_path / "source.txt"
+        source.write_text("content")
+        os.utime(source, (0, 0))
+        FileHelper.copy_file(source, tmp_path / "copy.txt")
+        FileHelper.copy_file(source, tmp_path / "copy2.txt", preserve_metadata=True)
+        assert (tmp_path / "copy.txt").read_text() == "content"
+        assert (tmp_path / "copy.txt").stat().st_mtime != 0
+        assert (tmp_path / "copy2.txt").stat().st_mtime == 0
+
+    def test_write_to_removed_directory(self, tmp_path):
+        test_file = tmp_path / "output" / "test.txt"
+        FileHelper.write_to_file(file_path=test_file, content="first")
+        shutil.rmtree(tmp_path / "output")
+        FileHelper.write_to_file(file_path=test_file, content="second")
+        assert test_file.read_text() == "second"
+
+    def test_generate_postfixed_file_path(self, mocker):
+        mocker.patch.object(FileHelper, "_minute_timestamp", return_value="2025-01-02_03-04")
+        assert FileHelper.generate_postfixed_file_path("out/result.md") == "out/result_2025-01-02_03-04.md"
+        assert FileHelper.generate_postfixed_file_path("out.d/result") == "out.d/result_2025-01-02_03-04"
+
+    def test_read_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            FileHelper.read_file(tmp_path / "missing.txt")
+
+class TestFileHelperDirectories:
+    def test_read_multiple_files_from_directories_keeps_order(self, tmp_path):
+        first_directory = tmp_path / "first"
+        second_directory = tmp_path / "second"
+        (first_directory / "subdirectory").mkdir(parents=True)
+        second_directory.mkdir()
+        for name in ["b.txt", "a.txt", "c.txt"]:
+            FileHelper.write_to_file(file_path=first_directory / name, content=name)
+        FileHelper.write_to_file(file_path=second_directory / "d.txt", content="d.txt")
+        contents = FileHelper.read_multiple_files_from_directories([first_directory, second_directory])
+        assert contents == ["a.txt", "b.txt", "c.txt", "d.txt"]
+
+    def test_combine_files_in_directories_includes_shared_files_once(self, tmp_path):
+        first_directory = tmp_path / "first"
+        second_directory = tmp_path / "second"
+        FileHelper.write_to_file(file_path=first_directory / "shared.md", content="shared")
+        FileHelper.write_to_file(file_path=second_directory / "own.md", content="own")
+        (second_directory / "link.md").symlink_to(first_directory / "shared.md")
+        combined = FileHelper.combine_files_in_directories([first_directory, second_directory])
+        assert combined == "\n---\nshared\n---\nown"
+
+    def test_parse_comma_separated_paths(self, tmp_path):
+        first_file = tmp_path / "first.txt"
+        second_file = tmp_path / "second.txt"
+        FileHelper.create_new_file(first_file)
+        FileHelper.create_new_file(second_file)
+        paths = FileHelper.parse_comma_separated_paths(
+            f"{second_file}, {first_file},{second_file},{tmp_path / 'missing.txt'}")
+        assert paths == [str(second_file.resolve()), str(first_file.resolve())]
+        assert FileHelper.parse_comma_separated_paths(None) == []
+
+class TestFileHelperReadCache:
+    def test_read_file_returns_changed_content(self, tmp_path):
+        test_file = tmp_path / "prompt.md"
+        FileHelper.write_to_file(file_path=test_file, content="first version")
+        assert FileHelper.read_file(test_file) == "first version"
+        FileHelper.write_to_file(file_path=test_file, content="second, longer version")
+        assert FileHelper.read_file(test_file) == "second, longer version"
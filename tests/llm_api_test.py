@@ -0,0 +1,126 @@
+import pytest
+from sokrates import LLMApi
+
+class TestLLMApiPipeline:
+
+    def test_send_pipeline_passes_output_to_next_stage(self, mocker):
+        llm_api = LLMApi()
+        send = mocker.patch.object(llm_api, "send", side_effect=["<think>x</think>refined", "final"])
+        outputs = llm_api.send_pipeline([
+            {"prompt": "refine this", "model": "a", "post_process": lambda r: r.split("</think>")[-1]},
+            {"model": "b", "context_array": ["context"]}
+        ])
+        assert outputs == ["refined", "final"]
+        assert send.call_args_list[1].kwargs == {"model": "b", "context_array": ["context"], "prompt": "refined"}
+
+    def test_send_pipeline_as_conversation(self, mocker):
+        llm_api = LLMApi()
+        chat_completion = mocker.patch.object(llm_api, "chat_completion", side_effect=["<think>x</think>refined", "final"])
+        outputs = llm_api.send_pipeline([
+            {"prompt": "refine this", "model": "a", "post_process": lambda r: r.split("</think>")[-1]},
+            {"model": "a"}
+        ], conversation=True)
+        assert outputs == ["refined", "final"]
+        messages = chat_completion.call_args_list[1].args[0]
+        assert [message["role"] for message in messages] == ["user", "assistant", "user"]
+        assert messages[1]["content"] == "<think>x</think>refined"
+        assert messages[2]["content"] == LLMApi.CONVERSATION_FOLLOW_UP_PROMPT
+
+    def test_cached_conversation_is_not_echoed_when_disabled(self, mocker, tmp_path, capsys):
+        from sokrates import ResponseCache
+        llm_api = LLMApi(response_cache=ResponseCache(tmp_path))
+        mocker.patch.object(llm_api, "chat_completion", side_effect=["cached-refined", "cached-final"])
+        stages = [{"prompt": "refine this", "model": "a"}, {"model": "a"}]
+        llm_api.send_pipeline(stages, conversation=True)
+        capsys.readouterr()
+        with LLMApi.stream_echo(False):
+            assert llm_api.send_pipeline(stages, conversation=True) == ["cached-refined", "cached-final"]
+        assert "cached-" not in capsys.readouterr().out
+
+    def test_send_pipeline_requires_initial_prompt(self):
+        with pytest.raises(ValueError):
+            LLMApi().send_pipeline([{"model": "a"}])
+
+class TestLLMApiSendAsync:
+
+    def test_send_async_uses_response_cache(self, mocker, tmp_path):
+        import asyncio
+        from sokrates import ResponseCache
+        llm_api = LLMApi(response_cache=ResponseCache(tmp_path))
+        completion = mocker.MagicMock()
+        completion.choices[0].message.content = "response"
+        client = mocker.MagicMock()
+        client.chat.completions.create = mocker.AsyncMock(return_value=completion)
+        mocker.patch.object(llm_api, "get_async_openai_client", return_value=client)
+
+        async def send_twice():
+            return [await llm_api.send_async("prompt", model="a") for _ in range(2)]
+
+        assert asyncio.run(send_twice()) == ["response", "response"]
+        assert client.chat.completions.create.await_count == 1
+
+class TestLLMApiClient:
+
+    def test_client_is_shared_per_endpoint_and_key(self):
+        first = LLMApi(api_endpoint="http://localhost:1/v1", api_key="a")
+        second = LLMApi(api_endpoint="http://localhost:1/v1", api_key="a")
+        other = LLMApi(api_endpoint="http://localhost:1/v1", api_key="b")
+        client = first.get_openai_client()
+        assert second.get_openai_client() is client
+        assert other.get_openai_client() is not client
+        first.close()
+        other.close()
+        assert second.get_openai_client() is not client
+        second.close()
+
+class TestLLMApiSendStream:
+
+    def test_send_stream_yields_pieces_and_caches_response(self, mocker, tmp_path):
+        from sokrates import ResponseCache
+        llm_api = LLMApi(response_cache=ResponseCache(tmp_path))
+        chunks = []
+        for content in ["Hel", None, "lo"]:
+            chunk = mocker.MagicMock()
+            chunk.choices[0].delta.content = content
+            chunks.append(chunk)
+        client = mocker.MagicMock()
+        client.chat.completions.create.return_value = iter(chunks)
+        mocker.patch.object(llm_api, "get_openai_client", return_value=client)
+
+        assert list(llm_api.send_stream("prompt", model="a")) == ["Hel", "lo"]
+        assert list(llm_api.send_stream("prompt", model="a")) == ["Hello"]
+        assert client.chat.completions.create.call_count == 1
+
+    def test_stream_echo_can_be_disabled(self, mocker, capsys):
+        llm_api = LLMApi()
+        chunk = mocker.MagicMock()
+        chunk.choices[0].delta.content = "streamed-token"
+        client = mocker.MagicMock()
+        client.chat.completions.create.side_effect = lambda **kwargs: iter([chunk])
+        mocker.patch.object(llm_api, "get_openai_client", return_value=client)
+
+        with LLMApi.stream_echo(False):
+            assert llm_api.send("prompt", model="a") == "streamed-token"
+        assert "streamed-token" not in capsys.readouterr().out
+        assert LLMApi.stream_echo_enabled()
+        assert llm_api.send("prompt", model="a") == "streamed-token"
+        assert "streamed-token" in capsys.readouterr().out
+
+class TestLLMApiSystemPrompt:
+
+    def test_system_prompt_is_sent_first(self):
+        assert LLMApi._build_messages("prompt", "instructions") == [
+            {"role": "system", "content": "instructions"},
+            {"role": "user", "content": "prompt"}
+        ]
+        assert LLMApi._build_messages("prompt") == [{"role": "user", "content": "prompt"}]
+
+class TestLLMApiCombineContext:
+
+    def test_combine_context(self):
+        assert LLMApi().combine_context(["a", "b"]) == "\n---\na\n---\nb\n ---"
+
+    def test_get_shared_returns_one_instance_per_settings(self):
+        shared = LLMApi.get_shared(api_endpoint="http://localhost:1/v1", api_key="a")
+        assert LLMApi.get_shared(api_endpoint="http://localhost:1/v1", api_key="a") is shared
+        assert LLMApi.get_shared(api_endpoint="http://localhost:1/v1", api_key="a", verbose=True) is not shared
@@ -80,5 +80,15 @@ class TestPromptRefiner(unittest.TestCase):
         clean_response_text = "This is a clean response."
         self.assertEqual(self.refiner.clean_response(clean_response_text), clean_response_text)
 
+    def test_clean_response_only_skips_clean_responses(self):
+        clean_response_text = "# Title\n\nSome *content*."
+        self.assertIs(self.refiner.clean_response(clean_response_text), clean_response_text)
+
+        self.assertEqual(self.refiner.clean_response("  padded \n"), "padded")
+        self.assertEqual(self.refiner.clean_response("a\n\n\n\nb"), "a\n\nb")
+        self.assertEqual(self.refiner.clean_response("Refined prompt: text"), "text")
+        self.assertEqual(self.refiner.clean_response("<THINK>x</THINK>text"), "text")
+        self.assertEqual(self.refiner.clean_response("text</answer>"), "text")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -32,5 +32,26 @@ class TestRefinementWorkflow(unittest.TestCase):
         print(result)
         print("-"*60)
 
+class TestRefinementWorkflowFused:
+
+    def test_same_model_is_refined_and_executed_with_one_request(self, mocker):
+        workflow = RefinementWorkflow(model="a")
+        send = mocker.patch.object(workflow.llm_api, "send", return_value="# result")
+        assert workflow.refine_and_send_prompt("input", "refine", fuse=True) == "# result"
+        assert send.call_count == 1
+        assert send.call_args.args[0].endswith(RefinementWorkflow.FUSED_EXECUTION_INSTRUCTION)
+
+    def test_different_models_use_two_requests(self, mocker):
+        workflow = RefinementWorkflow(model="a")
+        send = mocker.patch.object(workflow.llm_api, "send", side_effect=["# refined", "# result"])
+        assert workflow.refine_and_send_prompt("input", "refine", execution_model="b", fuse=True) == "# result"
+        assert send.call_args.args[0] == "# refined"
+
+    def test_two_requests_by_default(self, mocker):
+        workflow = RefinementWorkflow(model="a")
+        send = mocker.patch.object(workflow.llm_api, "send", side_effect=["# refined", "# result"])
+        assert workflow.refine_and_send_prompt("input", "refine") == "# result"
+        assert send.call_count == 2
+
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -0,0 +1,61 @@
+import pytest
+import os
+from sokrates import ResponseCache
+
+class TestResponseCache:
+
+    def test_set_and_get(self, tmp_path):
+        cache = ResponseCache(cache_directory=tmp_path)
+        key = ResponseCache.cache_key("model", 0.7, 2000, "prompt")
+        assert cache.get(key) is None
+        cache.set(key, "response", model="model")
+        assert cache.get(key) == "response"
+
+    def test_cache_key_depends_on_all_parts(self):
+        key = ResponseCache.cache_key("model", 0.7, 2000, "prompt")
+        assert key == ResponseCache.cache_key("model", 0.7, 2000, "prompt")
+        assert key != ResponseCache.cache_key("other-model", 0.7, 2000, "prompt")
+        assert key != ResponseCache.cache_key("model", 0.2, 2000, "prompt")
+        assert key != ResponseCache.cache_key("model", 0.7, 2000, "other prompt")
+
+    def test_cache_key_is_unambiguous(self):
+        assert ResponseCache.cache_key("model", None) != ResponseCache.cache_key("model", "None")
+        assert ResponseCache.cache_key("a|b", "c") != ResponseCache.cache_key("a", "b|c")
+
+    def test_from_arguments_only_caches_deterministic_requests(self, tmp_path):
+        import argparse
+        args = argparse.Namespace(no_cache=False, cache_dir=str(tmp_path), force_cache=False)
+        cache = ResponseCache.from_arguments(args, 0, 0.0)
+        assert cache.max_entries == ResponseCache.DEFAULT_MAX_ENTRIES
+        assert ResponseCache.from_arguments(args, 0, 0.7) is None
+        assert ResponseCache.from_arguments(args, "0") is not None
+        args.force_cache = True
+        assert ResponseCache.from_arguments(args, 0.7) is not None
+        args.no_cache = True
+        assert ResponseCache.from_arguments(args, 0) is None
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        cache = ResponseCache(cache_directory=tmp_path)
+        key = ResponseCache.cache_key("model", "prompt")
+        (tmp_path / f"{key}.json").write_text("not json")
+        assert cache.get(key) is None
+
+    def test_expired_entry_is_a_miss(self, tmp_path):
+        cache = ResponseCache(cache_directory=tmp_path, ttl=60)
+        key = ResponseCache.cache_key("model", "prompt")
+        cache.set(key, "response")
+        assert cache.get(key) == "response"
+        os.utime(tmp_path / f"{key}.json", (0, 0))
+        assert cache.get(key) is None
+        assert not (tmp_path / f"{key}.json").exists()
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        cache = ResponseCache(cache_directory=tmp_path, max_entries=2)
+        keys = [ResponseCache.cache_key("model", i) for i in range(3)]
+        cache.set(keys[0], "0")
+        cache.set(keys[1], "1")
+        os.utime(tmp_path / f"{keys[1]}.json", (0, 0))
+        cache.set(keys[2], "2")
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) == "0"
+        assert cache.get(keys[2]) == "2"
@@ -5,11 +5,15 @@ Test Suite for SequentialTaskExecutor
 This module contains unit tests for the SequentialTaskExecutor class.
 """
 
+import asyncio
 import os
 import json
 import tempfile
+import threading
+import openai
 from sokrates.sequential_task_executor import SequentialTaskExecutor
 from sokrates.file_helper import FileHelper
+from sokrates.llm_api import LLMApi
 
 def create_test_task_file():
     """Create a test JSON file with sample tasks"""
@@ -77,5 +81,153 @@ def test_sequential_task_executor():
             import shutil
             shutil.rmtree("./test_results")
 
+def test_concurrent_execution_keeps_task_order(mocker, tmp_path):
+    """Test that concurrent execution reports the task details in task file order"""
+    task_file = create_test_task_file()
+    try:
+        executor = SequentialTaskExecutor(
+            api_endpoint="http://localhost:1234/v1",
+            api_key="notrequired",
+            model="qwen/qwen3-8b",
+            output_dir=str(tmp_path),
+            max_concurrency=2,
+            qps_limit=100
+        )
+        echo_enabled = []
+        mocker.patch.object(executor, "_process_single_task_file",
+                            side_effect=lambda **kwargs: echo_enabled.append(LLMApi.stream_echo_enabled()))
+
+        result = executor.execute_tasks_from_file(task_file)
+
+        assert result["successful_tasks"] == 2
+        assert result["failed_tasks"] == 0
+        assert [detail["task_id"] for detail in result["details"]] == [1, 2]
+        # streamed tokens of parallel tasks are not echoed
+        assert echo_enabled == [False, False]
+    finally:
+        os.remove(task_file)
+
+def test_async_execution_overlaps_tasks(mocker, tmp_path):
+    """Test that tasks run in parallel when awaited from an already running event loop"""
+    task_file = create_test_task_file()
+    try:
+        executor = SequentialTaskExecutor(
+            api_endpoint="http://localhost:1234/v1",
+            api_key="notrequired",
+            model="qwen/qwen3-8b",
+            output_dir=str(tmp_path),
+            max_concurrency=2
+        )
+        # both tasks have to be in flight at the same time to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+        mocker.patch.object(executor, "_process_single_task_file", side_effect=lambda **kwargs: barrier.wait())
+
+        async def run():
+            return await executor.execute_tasks_from_file_async(task_file)
+        result = asyncio.run(run())
+
+        assert result["successful_tasks"] == 2
+        assert result["failed_tasks"] == 0
+    finally:
+        os.remove(task_file)
+
+def test_invalid_and_duplicate_subtasks_are_skipped(mocker, tmp_path):
+    """Test that invalid and repeated sub-tasks are rejected before any LLM request"""
+    task_file = tmp_path / "tasks.json"
+    task_file.write_text(json.dumps({
+        "task": "Test task execution",
+        "subtasks": [
+            {"id": 1, "description": "  Write a poem.  "},
+            {"id": 2, "description": "   "},
+            {"description": "No id"},
+            {"id": 1, "description": "Write a poem."},
+            {"id": 3, "description": "x" * (SequentialTaskExecutor.MAX_DESCRIPTION_LENGTH + 1)}
+        ]
+    }))
+    executor = SequentialTaskExecutor(
+        api_endpoint="http://localhost:1234/v1",
+        api_key="notrequired",
+        model="qwen/qwen3-8b",
+        output_dir=str(tmp_path / "results")
+    )
+    process_task = mocker.patch.object(executor, "_process_single_task_file", return_value="result")
+
+    result = executor.execute_tasks_from_file(str(task_file))
+
+    process_task.assert_called_once()
+    assert process_task.call_args.kwargs["task_desc"] == "Write a poem."
+    assert result["successful_tasks"] == 1
+    assert [detail["status"] for detail in result["details"]] == ["skipped"] * 4 + ["completed"]
+
+def test_batches_respect_size_and_token_budget(tmp_path):
+    """Test that batches are closed at batch_size tasks or when the token budget would be exceeded"""
+    executor = SequentialTaskExecutor(
+        api_endpoint="http://localhost:1234/v1",
+        api_key="notrequired",
+        model="qwen/qwen3-8b",
+        output_dir=str(tmp_path),
+        batch_size=3,
+        max_batch_tokens=100
+    )
+    subtasks = [{"id": i, "description": description} for i, description in
+                enumerate(["short"] * 4 + ["x" * 1000, "short"], start=1)]
+
+    batches = executor._build_batches(subtasks)
+
+    assert [[subtask["id"] for subtask in batch] for batch in batches] == [[1, 2, 3], [4], [5], [6]]
+
+def test_fail_fast_cancels_remaining_tasks(mocker, tmp_path):
+    """Test that an unrecoverable LLM API error cancels the tasks that have not started yet"""
+    task_file = create_test_task_file()
+    try:
+        executor = SequentialTaskExecutor(
+            api_endpoint="http://localhost:1234/v1",
+            api_key="notrequired",
+            model="qwen/qwen3-8b",
+            output_dir=str(tmp_path),
+            fail_fast=True
+        )
+
+        def unreachable_server(**kwargs):
+            # LLMApi.send wraps the openai error like this
+            try:
+                raise openai.APIConnectionError(request=None)
+            except Exception as e:
+                raise Exception(f"Error calling LLM API: {e}")
+        process_task = mocker.patch.object(executor, "_process_single_task_file", side_effect=unreachable_server)
+
+        result = executor.execute_tasks_from_file(task_file)
+
+        process_task.assert_called_once()
+        assert result["failed_tasks"] == 2
+        assert [detail["status"] for detail in result["details"]] == ["failed", "cancelled"]
+    finally:
+        os.remove(task_file)
+
+def test_resume_skips_checkpointed_tasks(mocker, tmp_path):
+    """Test that tasks recorded in the checkpoint file are not executed again"""
+    task_file = create_test_task_file()
+    try:
+        executor = SequentialTaskExecutor(
+            api_endpoint="http://localhost:1234/v1",
+            api_key="notrequired",
+            model="qwen/qwen3-8b",
+            output_dir=str(tmp_path)
+        )
+        tasks = FileHelper.read_json_file(task_file)
+        first_task = tasks["subtasks"][0]
+        executor._write_checkpoint(first_task["id"],
+                                   executor._task_hash(tasks["task"], first_task["description"]),
+                                   str(tmp_path / "task_1_result.md"))
+        process_task = mocker.patch.object(executor, "_process_single_task_file", return_value="result")
+
+        result = executor.execute_tasks_from_file(task_file)
+
+        assert result["successful_tasks"] == 2
+        process_task.assert_called_once()
+        assert process_task.call_args.kwargs["task_id"] == 2
+    finally:
+        os.remove(task_file)
+
 if __name__ == "__main__":
     test_sequential_task_executor()
\ No newline at end of file